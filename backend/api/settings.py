@@ -47,6 +47,11 @@ INSTALLED_APPS = [
 
 # Google Auth Settings
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+# Certificados usados para validar os ID tokens (cacheados em memória);
+# aponte para um servidor local para testar offline
+GOOGLE_CERTS_URL = os.getenv(
+    "GOOGLE_CERTS_URL", "https://www.googleapis.com/oauth2/v1/certs"
+)
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
@@ -54,6 +59,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "v1.db_routing.ReplicaStickinessMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -88,6 +94,26 @@ DATABASES = {
     }
 }
 
+# Réplica de leitura opcional para relatórios, dashboard e listagens
+# (v1/db_routing.py). Em desenvolvimento, um segundo arquivo SQLite
+# atualizado com `python manage.py sync_replica`; em produção, a réplica
+# do MySQL (DB_REPLICA_ENGINE=django.db.backends.mysql e HOST/PORT/...).
+if os.getenv("DB_REPLICA_NAME"):
+    DATABASES["replica"] = {
+        "ENGINE": os.getenv("DB_REPLICA_ENGINE", "django.db.backends.sqlite3"),
+        "NAME": os.getenv("DB_REPLICA_NAME"),
+        "HOST": os.getenv("DB_REPLICA_HOST", ""),
+        "PORT": os.getenv("DB_REPLICA_PORT", ""),
+        "USER": os.getenv("DB_REPLICA_USER", ""),
+        "PASSWORD": os.getenv("DB_REPLICA_PASSWORD", ""),
+        # Nos testes a réplica é o próprio banco de teste
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASE = "replica"
+# Após uma escrita, as leituras do usuário ficam no primário por N segundos
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+DATABASE_ROUTERS = ["v1.db_routing.ReplicaRouter"]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -136,6 +162,56 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
 }
 
+# E-mail: convites são enfileirados em EmailOutbox e enviados pelo comando
+# drain_outbox. Em desenvolvimento use o backend console ou file.
+EMAIL_BACKEND = os.getenv(
+    "EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend"
+)
+EMAIL_FILE_PATH = os.getenv("EMAIL_FILE_PATH", BASE_DIR / "sent_emails")
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "False") == "True"
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "no-reply@sesamum.local")
+
+# Cache: CACHE_BACKEND=locmem (padrão, um cache por processo), file
+# (compartilhado entre processos da máquina, em CACHE_LOCATION) ou
+# redis/memcached (compartilhado entre máquinas; CACHE_LOCATION é a URL/
+# endereço do servidor, ex.: redis://127.0.0.1:6379/1)
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+}
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.getenv(
+            "CACHE_LOCATION",
+            str(BASE_DIR / "django_cache") if CACHE_BACKEND == "file" else "",
+        ),
+    }
+}
+# Validade (segundos) das respostas cacheadas da API (v1/cache.py)
+API_CACHE_TIMEOUT = int(os.getenv("API_CACHE_TIMEOUT", "300"))
+
+# Queries implícitas em Model.save() (v1/query_guard.py): off, warn ou
+# raise. Os testes sempre rodam com raise (TEST_RUNNER) e o bench também
+SAVE_QUERY_GUARD = os.getenv("SAVE_QUERY_GUARD", "off")
+TEST_RUNNER = "v1.tests.runner.TestRunner"
+
+# Ingestão de checks (v1/services/ingest.py): "direct" grava cada check na
+# requisição; "buffered" confirma após o log local e grava em micro-lotes
+CHECK_INGEST_MODE = os.getenv("CHECK_INGEST_MODE", "direct")
+CHECK_INGEST_LOG = os.getenv("CHECK_INGEST_LOG", BASE_DIR / "check_ingest.log")
+CHECK_INGEST_BATCH_SIZE = int(os.getenv("CHECK_INGEST_BATCH_SIZE", "500"))
+CHECK_INGEST_FLUSH_INTERVAL = float(os.getenv("CHECK_INGEST_FLUSH_INTERVAL", "0.05"))
+# Segundos até reler do banco o snapshot de credenciamento de um evento
+CHECK_INGEST_SNAPSHOT_TTL = float(os.getenv("CHECK_INGEST_SNAPSHOT_TTL", "10"))
+
 # Configurações opcionais do SimpleJWT (para garantir que o prefixo seja Bearer)
 from datetime import timedelta
 
@@ -2,16 +2,25 @@ from django.contrib import admin
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from v1.views import (
+    AsyncDashboardMetricsView,
+    AsyncEventOverviewView,
     CheckViewSet,
     CompanySetView,
+    ControlRosterView,
     DashboardMetricsView,
+    EventAttendanceView,
+    EventCheckHistogramView,
     EventOverviewView,
     EventStaffBulkView,
     EventViewSet,
     GoogleLoginView,
     InviteViewSet,
+    ParticipationViewSet,
+    ProjectAnalyticsView,
+    ProjectAttendanceView,
     ProjectViewSet,
     RegisterWithInviteView,
+    StaffLookupView,
     StaffViewSet,
     UserSetView,
 )
@@ -24,6 +33,7 @@ router.register(r"companies", CompanySetView, basename="company")
 router.register(r"users", UserSetView, basename="user")
 router.register(r"projects", ProjectViewSet, basename="project")
 router.register(r"invites", InviteViewSet, basename="invite")
+router.register(r"participations", ParticipationViewSet, basename="participation")
 # Adicione ViewSets de Company, Project, Event conforme necessário para CRUD básico
 
 urlpatterns = [
@@ -48,6 +58,44 @@ urlpatterns = [
     path(
         "events/<int:pk>/overview/", EventOverviewView.as_view(), name="event-overview"
     ),
+    # Relatórios
+    path(
+        "events/<int:pk>/attendance/",
+        EventAttendanceView.as_view(),
+        name="event-attendance",
+    ),
+    path(
+        "events/<int:pk>/checks/histogram/",
+        EventCheckHistogramView.as_view(),
+        name="event-check-histogram",
+    ),
+    path(
+        "projects/<int:pk>/attendance/",
+        ProjectAttendanceView.as_view(),
+        name="project-attendance",
+    ),
+    path(
+        "projects/<int:pk>/analytics/",
+        ProjectAnalyticsView.as_view(),
+        name="project-analytics",
+    ),
+    # Leituras assíncronas (async views; servir via ASGI)
+    path("async/staffs/lookup/", StaffLookupView.as_view(), name="async-staff-lookup"),
+    path(
+        "async/events/<int:pk>/overview/",
+        AsyncEventOverviewView.as_view(),
+        name="async-event-overview",
+    ),
+    path(
+        "async/events/<int:pk>/roster/",
+        ControlRosterView.as_view(),
+        name="async-event-roster",
+    ),
+    path(
+        "async/dashboard/metrics/",
+        AsyncDashboardMetricsView.as_view(),
+        name="async-dashboard-metrics",
+    ),
     # Router
     path("", include(router.urls)),
 ]
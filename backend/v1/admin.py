@@ -1,3 +1,4 @@
+from django import forms
 from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
@@ -8,19 +9,90 @@ from .models import (
     Event,
     EventsCompany,
     EventsStaff,
+    InviteStatus,
+    Person,
     Project,
     Staff,
     UserInvite,
 )
+from .pagination import EstimatedCountPaginator
+from .reports import invalidate_histogram
+from .services import search_staffs
+from .utils import sanitize_digits
 
 User = get_user_model()
 
 
+class CompanyInputFilter(admin.SimpleListFilter):
+    """
+    Filtro por empresa digitando o CNPJ (prefixo) ou o início do nome.
+
+    Substitui o filtro padrão de FK, que renderiza todas as empresas.
+    """
+
+    title = "company"
+    parameter_name = "company"
+    template = "admin/v1/input_filter.html"
+    # Caminho até Company a partir do model do admin
+    company_field = "company"
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def has_output(self):
+        return True
+
+    def choices(self, changelist):
+        query_parts = [
+            (name, value)
+            for name, values in changelist.params.items()
+            if name != self.parameter_name
+            for value in (values if isinstance(values, list) else [values])
+        ]
+        yield {
+            "query_parts": query_parts,
+            "parameter_name": self.parameter_name,
+            "value": self.value(),
+            "placeholder": "CNPJ ou nome",
+        }
+
+    def queryset(self, request, queryset):
+        value = (self.value() or "").strip()
+        if not value:
+            return queryset
+        digits = sanitize_digits(value)
+        if digits and not any(c.isalpha() for c in value):
+            lookup = {f"{self.company_field}__cnpj__startswith": digits}
+        else:
+            lookup = {f"{self.company_field}__name__istartswith": value}
+        return queryset.filter(**lookup)
+
+
+def company_filter(company_field):
+    """CompanyInputFilter para um caminho até Company (ex.: staff__company)"""
+    return type(
+        "CompanyInputFilter", (CompanyInputFilter,), {"company_field": company_field}
+    )
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Base para tabelas grandes: sem o COUNT(*) extra da tabela inteira e
+    com contagem estimada quando não há filtros.
+    """
+
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+
 # Customize User Admin to handle custom fields and password
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ("email", "name", "role", "company", "is_active")
-    list_filter = ("role", "is_active", "company")
+    list_filter = ("role", "is_active", CompanyInputFilter)
+    list_select_related = ("company",)
+    autocomplete_fields = ("company",)
+    raw_id_fields = ("created_by",)
     fieldsets = (
         (None, {"fields": ("email", "password")}),
         ("Personal info", {"fields": ("name",)}),
@@ -58,49 +130,126 @@ class CompanyAdmin(admin.ModelAdmin):
     search_fields = ("name", "cnpj")
 
 
+class InviteStatusFilter(admin.SimpleListFilter):
+    title = "status"
+    parameter_name = "status"
+
+    def lookups(self, request, model_admin):
+        return InviteStatus.choices
+
+    def queryset(self, request, queryset):
+        if self.value() in InviteStatus.values:
+            return queryset.filter_status(self.value())
+        return queryset
+
+
 @admin.register(UserInvite)
-class UserInviteAdmin(admin.ModelAdmin):
+class UserInviteAdmin(LargeTableAdmin):
     list_display = ("email", "role", "company", "status", "expires_at")
-    list_filter = ("role", "company")
+    list_filter = (InviteStatusFilter, "role", CompanyInputFilter)
+    list_select_related = ("company",)
+    autocomplete_fields = ("company",)
+    raw_id_fields = ("used_by", "created_by")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_status()
+
+
+@admin.register(Person)
+class PersonAdmin(LargeTableAdmin):
+    list_display = ("name", "cpf", "created_at")
+    search_fields = ("=cpf", "^name")
 
 
 @admin.register(Staff)
-class StaffAdmin(admin.ModelAdmin):
+class StaffAdmin(LargeTableAdmin):
     list_display = ("name", "cpf", "company")
     search_fields = ("name", "cpf")
-    list_filter = ("company",)
+    list_filter = (CompanyInputFilter,)
+    list_select_related = ("company",)
+    autocomplete_fields = ("company",)
+    raw_id_fields = ("created_by", "person")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Usa o índice full-text em vez de LIKE '%x%' sobre a tabela toda
+        if not search_term:
+            return queryset, False
+        return search_staffs(queryset, search_term, limit=None), False
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(LargeTableAdmin):
     list_display = ("name", "company", "status", "date_begin", "date_end")
-    list_filter = ("company", "status")
+    list_filter = (CompanyInputFilter, "status")
+    list_select_related = ("company",)
+    search_fields = ("name",)
+    autocomplete_fields = ("company",)
+    raw_id_fields = ("created_by",)
 
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(LargeTableAdmin):
     list_display = ("name", "project", "status", "date_begin")
-    list_filter = ("status",)
+    list_filter = ("status", company_filter("project__company"))
+    list_select_related = ("project",)
+    search_fields = ("name",)
+    autocomplete_fields = ("project",)
+    raw_id_fields = ("created_by",)
 
 
 @admin.register(EventsCompany)
-class EventsCompanyAdmin(admin.ModelAdmin):
+class EventsCompanyAdmin(LargeTableAdmin):
     list_display = ("event", "company", "role")
-    list_filter = ("role",)
+    list_filter = ("role", CompanyInputFilter)
+    list_select_related = ("event", "company")
+    autocomplete_fields = ("event", "company")
+
+
+class EventsStaffAdminForm(forms.ModelForm):
+    # Derivado do staff escolhido. Continua sendo campo do form (desabilitado)
+    # para que validate_unique cheque a unique (event, staff_cpf)
+    staff_cpf = forms.CharField(disabled=True, required=False, label="Staff cpf")
+
+    class Meta:
+        model = EventsStaff
+        fields = "__all__"
+
+    def clean(self):
+        cleaned_data = super().clean()
+        staff = cleaned_data.get("staff")
+        if staff is not None:
+            # O form já carregou o Staff: copiar o CPF não custa query
+            cleaned_data["staff_cpf"] = staff.cpf
+        return cleaned_data
 
 
 @admin.register(EventsStaff)
-class EventsStaffAdmin(admin.ModelAdmin):
+class EventsStaffAdmin(LargeTableAdmin):
+    form = EventsStaffAdminForm
     list_display = ("event", "staff", "staff_cpf")
-    search_fields = ("staff__name", "staff_cpf")
+    # CPF exato e prefixo do nome usam índices; "%x%" varreria a tabela
+    search_fields = ("=staff_cpf", "^staff__name")
+    list_filter = (company_filter("staff__company"),)
+    list_select_related = ("event", "staff")
+    autocomplete_fields = ("event",)
+    raw_id_fields = ("staff", "registration_check", "created_by")
 
 
 @admin.register(Check)
-class CheckAdmin(admin.ModelAdmin):
+class CheckAdmin(LargeTableAdmin):
     list_display = ("action", "get_staff_name", "timestamp")
     list_filter = ("action",)
+    list_select_related = ("events_staff__staff",)
+    raw_id_fields = ("events_staff", "user_control")
+    # Ordena pela PK: evita ordenar a tabela inteira por um campo sem índice
+    ordering = ("-id",)
 
+    @admin.display(description="Staff Name")
     def get_staff_name(self, obj):
         return obj.events_staff.staff.name
 
-    get_staff_name.short_description = "Staff Name"
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change:
+            # Edição não muda a contagem de checks do evento (ver throughput)
+            invalidate_histogram(obj.events_staff.event_id)
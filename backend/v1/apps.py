@@ -2,3 +2,6 @@ from django.apps import AppConfig
 
 class V1Config(AppConfig):
     name = 'v1'
+
+    def ready(self):
+        from . import signals  # noqa: F401
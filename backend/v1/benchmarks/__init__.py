@@ -0,0 +1,31 @@
+"""
+Suítes de benchmark e de estresse executadas via `python manage.py bench`.
+
+Cada suíte é uma função registrada com @suite que recebe as opções do
+comando e devolve um dicionário de resultados. Suítes de estresse criam
+os próprios dados (empresa/evento descartáveis) e os removem ao final.
+"""
+
+SUITES = {}
+
+
+def suite(name):
+    def register(func):
+        SUITES[name] = func
+        return func
+
+    return register
+
+
+class SuiteFailed(Exception):
+    """Uma verificação da suíte não foi satisfeita"""
+
+
+from . import (  # noqa: E402,F401
+    asgi,
+    documents,
+    google_login,
+    ingest,
+    response_cache,
+    sanitize,
+)
@@ -0,0 +1,173 @@
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+from django.db import close_old_connections
+from rest_framework_simplejwt.tokens import AccessToken
+
+from . import SuiteFailed, suite
+from .fixtures import scratch_event
+
+# Workers do servidor síncrono (equivalente a um gunicorn com 4 workers sync)
+WSGI_WORKERS = 4
+
+# Atraso entre o início e o fim do envio da requisição (cliente lento)
+SLOW_CLIENT_DELAY = 0.05
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class _PoolWSGIServer(WSGIServer):
+    """WSGI com um número fixo de workers, como um servidor sync em produção"""
+
+    request_queue_size = 4096
+
+    def __init__(self, address, workers):
+        super().__init__(address, _QuietHandler)
+        self.pool = ThreadPoolExecutor(workers)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._work, request, client_address)
+
+    def _work(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            close_old_connections()
+
+
+def _wsgi_server():
+    server = _PoolWSGIServer(("127.0.0.1", 0), WSGI_WORKERS)
+    server.set_app(get_wsgi_application())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def stop():
+        server.shutdown()
+        server.pool.shutdown()
+        server.server_close()
+
+    return server.server_port, stop
+
+
+def _asgi_server():
+    try:
+        import uvicorn
+    except ImportError:
+        raise SuiteFailed("uvicorn não instalado (pip install uvicorn)")
+
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    config = uvicorn.Config(
+        get_asgi_application(), log_level="warning", lifespan="off", backlog=4096
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(
+        target=server.run, kwargs={"sockets": [sock]}, daemon=True
+    )
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    def stop():
+        server.should_exit = True
+        thread.join()
+
+    return sock.getsockname()[1], stop
+
+
+async def _request(port, path, token):
+    """Uma requisição de cliente lento; retorna (status, latência em s)"""
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\n".encode())
+    await writer.drain()
+    await asyncio.sleep(SLOW_CLIENT_DELAY)
+    writer.write(
+        (
+            "Host: 127.0.0.1\r\n"
+            f"Authorization: Bearer {token}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode()
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status = int(response.split(b" ", 2)[1]) if response else 0
+    return status, time.perf_counter() - started
+
+
+async def _load(port, path, token, connections, requests_per_connection):
+    async def client():
+        results = []
+        for _ in range(requests_per_connection):
+            try:
+                results.append(await _request(port, path, token))
+            except OSError:
+                results.append((0, 0.0))
+        return results
+
+    started = time.perf_counter()
+    batches = await asyncio.gather(*(client() for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+    return [result for batch in batches for result in batch], elapsed
+
+
+def _summary(results, elapsed):
+    latencies = sorted(latency for status, latency in results if status == 200)
+    errors = len(results) - len(latencies)
+    if not latencies:
+        return {"requests": len(results), "errors": errors}
+    return {
+        "requests": len(results),
+        "errors": errors,
+        "req_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1),
+    }
+
+
+@suite("async-views")
+def async_views(threads=16, iterations=20, **options):
+    """
+    Overview do evento sob muitas conexões de clientes lentos.
+
+    Compara a view DRF síncrona servida por WSGI com WSGI_WORKERS workers e
+    a view assíncrona servida por ASGI (uvicorn, um único event loop).
+    `threads` é o número de conexões simultâneas e `iterations` o número
+    de requisições por conexão.
+    """
+    with scratch_event(staff_count=100) as (event, links, control):
+        token = str(AccessToken.for_user(control))
+        modes = {
+            "wsgi_sync": (_wsgi_server, f"/events/{event.pk}/overview/"),
+            "asgi_async": (_asgi_server, f"/async/events/{event.pk}/overview/"),
+        }
+        results = {"connections": threads, "requests_per_connection": iterations}
+        for name, (start_server, path) in modes.items():
+            port, stop = start_server()
+            try:
+                responses, elapsed = asyncio.run(
+                    _load(port, path, token, threads, iterations)
+                )
+            finally:
+                stop()
+            summary = _summary(responses, elapsed)
+            if summary["errors"]:
+                raise SuiteFailed(f"{name}: {summary['errors']} requisições falharam")
+            for key, value in summary.items():
+                results[f"{name}_{key}"] = value
+    return results
@@ -0,0 +1,61 @@
+import random
+import time
+
+from ..documents import (
+    is_valid_cnpj,
+    is_valid_cpf,
+    validate_cnpjs,
+    validate_cpfs,
+)
+from . import SuiteFailed, suite
+from .fixtures import fake_cnpj, fake_cpf
+
+SIZES = (1_000, 10_000, 50_000)
+
+
+def _documents(size):
+    """Metade válida, metade com dígito verificador trocado, formatados"""
+    cpfs, cnpjs = [], []
+    for i in range(size):
+        cpf = fake_cpf(random.randrange(1, 10**9))
+        cnpj = fake_cnpj()
+        if i % 2:
+            cpf = cpf[:-1] + str((int(cpf[-1]) + 1) % 10)
+            cnpj = cnpj[:-1] + str((int(cnpj[-1]) + 1) % 10)
+        cpfs.append(f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}")
+        cnpjs.append(f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}")
+    return cpfs, cnpjs
+
+
+def _per_row_us(func, values, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        result = func(values)
+    elapsed = time.perf_counter() - started
+    return elapsed * 1_000_000 / (iterations * len(values)), result
+
+
+@suite("documents")
+def documents(iterations=20, **options):
+    """
+    Custo por linha da validação de CPF/CNPJ: um documento por vez
+    (is_valid_*) contra o lote inteiro de uma vez (validate_*), em lotes
+    do tamanho de uma importação.
+    """
+    iterations = max(1, iterations // 10)
+    results = {}
+    for size in SIZES:
+        cpfs, cnpjs = _documents(size)
+        for kind, values, one, batch in (
+            ("cpf", cpfs, is_valid_cpf, validate_cpfs),
+            ("cnpj", cnpjs, is_valid_cnpj, validate_cnpjs),
+        ):
+            single_us, expected = _per_row_us(
+                lambda rows: [one(row) for row in rows], values, iterations
+            )
+            batch_us, flags = _per_row_us(batch, values, iterations)
+            if flags.tolist() != expected or sum(expected) != (size + 1) // 2:
+                raise SuiteFailed(f"{kind}: lote e unitário divergem ({size})")
+            results[f"{kind}_{size}_single_us"] = round(single_us, 3)
+            results[f"{kind}_{size}_batch_us"] = round(batch_us, 3)
+    return results
@@ -0,0 +1,60 @@
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ..documents import cnpj_check_digits, cpf_check_digits
+from ..models import Company, Event, EventsStaff, Project, Staff, User, UserRole
+from ..utils import generate_nano_id
+
+
+def fake_cpf(number):
+    """CPF válido a partir de um número (até 9 dígitos)"""
+    base = f"{number:09d}"
+    return base + cpf_check_digits(base)
+
+
+def fake_cnpj():
+    """CNPJ válido aleatório"""
+    base = str(random.randrange(10**11, 10**12))
+    return base + cnpj_check_digits(base)
+
+
+@contextmanager
+def scratch_event(staff_count=1):
+    """Empresa/projeto/evento descartáveis com `staff_count` staffs vinculados"""
+    tag = generate_nano_id()[:8]
+    company = Company.objects.create(name=f"bench-{tag}", cnpj=fake_cnpj())
+    try:
+        control = User.objects.create_user(
+            email=f"bench-{tag}@example.com",
+            name="bench",
+            role=UserRole.CONTROL,
+            company=company,
+        )
+        project = Project.objects.create(name=f"bench-{tag}", company=company)
+        now = timezone.now()
+        event = Event.objects.create(
+            name=f"bench-{tag}",
+            project=project,
+            date_begin=now,
+            date_end=now + timedelta(hours=8),
+        )
+        staffs = Staff.objects.bulk_create(
+            Staff(
+                name=f"bench {i}",
+                name_search=f"bench {i}",
+                cpf=fake_cpf(i + 1),
+                company=company,
+            )
+            for i in range(staff_count)
+        )
+        links = EventsStaff.objects.bulk_create(
+            EventsStaff(event=event, staff=staff, staff_cpf=staff.cpf)
+            for staff in staffs
+        )
+        yield event, links, control
+    finally:
+        User.objects.filter(company=company).delete()
+        company.delete()
@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+from google.auth.transport import requests as google_requests
+from google.oauth2 import id_token
+
+from ..services.google_auth import GoogleTokenVerifier
+from . import SuiteFailed, suite
+
+AUDIENCE = "bench-client"
+KEY_ID = "bench-key"
+
+
+def _signed_token():
+    """Par (token, certs) assinado com uma chave RSA local descartável"""
+    # cryptography vem com o google-auth recente; importado só nesta suíte
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    signer = crypt.RSASigner.from_string(private_pem, key_id=KEY_ID)
+    now = int(time.time())
+    token = google_jwt.encode(
+        signer,
+        {
+            "iss": "https://accounts.google.com",
+            "aud": AUDIENCE,
+            "sub": "bench",
+            "email": "bench@example.com",
+            "iat": now,
+            "exp": now + 3600,
+        },
+    )
+    return token, {KEY_ID: public_pem.decode()}
+
+
+def _certs_server(certs):
+    """Servidor HTTP local que imita o endpoint de certificados do Google"""
+    hits = {"count": 0}
+    body = json.dumps(certs).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits["count"] += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", "public, max-age=3600")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/certs", hits
+
+
+def _average_ms(func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+@suite("google-login")
+def google_login(iterations=20, **options):
+    """
+    Latência da verificação do ID token no login, antes e depois do cache.
+
+    Antes: `verify_oauth2_token` com um Request novo por login (sessão HTTP
+    nova e busca de certificados a cada chamada). Depois: GoogleTokenVerifier.
+    Tudo offline, contra um endpoint de certificados local.
+    """
+    token, certs = _signed_token()
+    server, certs_url, hits = _certs_server(certs)
+    try:
+        before_ms = _average_ms(
+            lambda: id_token.verify_token(
+                token, google_requests.Request(), AUDIENCE, certs_url=certs_url
+            ),
+            iterations,
+        )
+        before_fetches = hits["count"]
+
+        verifier = GoogleTokenVerifier(certs_url)
+        after_ms = _average_ms(lambda: verifier.verify(token, AUDIENCE), iterations)
+        after_fetches = hits["count"] - before_fetches
+    finally:
+        server.shutdown()
+
+    if after_fetches != 1:
+        raise SuiteFailed(f"esperada 1 busca de certificados, houve {after_fetches}")
+    return {
+        "iterations": iterations,
+        "before_ms": round(before_ms, 3),
+        "before_cert_fetches": before_fetches,
+        "after_ms": round(after_ms, 3),
+        "after_cert_fetches": after_fetches,
+    }
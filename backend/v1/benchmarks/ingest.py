@@ -0,0 +1,97 @@
+import tempfile
+import time
+from pathlib import Path
+
+from ..models import Check, CheckAction, EventsStaff, IngestCheckpoint
+from ..services import CheckIngestor, record_check
+from . import SuiteFailed, suite
+from .fixtures import scratch_event
+
+# Cada staff passa por credenciamento, check-in e check-out
+ACTIONS = (CheckAction.REGISTRATION, CheckAction.CHECK_IN, CheckAction.CHECK_OUT)
+
+
+def _verify(event, staff_count, label):
+    checks = Check.objects.filter(events_staff__event=event).count()
+    registered = EventsStaff.objects.filter(
+        event=event, registration_check__isnull=False
+    ).count()
+    if checks != staff_count * len(ACTIONS) or registered != staff_count:
+        raise SuiteFailed(
+            f"{label}: esperado {staff_count * len(ACTIONS)} checks e "
+            f"{staff_count} credenciados, obtido {checks} / {registered}"
+        )
+
+
+def _direct(staff_count):
+    with scratch_event(staff_count=staff_count) as (event, links, control):
+        start = time.perf_counter()
+        for action in ACTIONS:
+            for events_staff in links:
+                record_check(events_staff, action, control)
+        elapsed = time.perf_counter() - start
+        _verify(event, staff_count, "direct")
+    return elapsed
+
+
+def _buffered(staff_count, log_path):
+    with scratch_event(staff_count=staff_count) as (event, links, control):
+        ingestor = CheckIngestor(log_path)
+        ingestor.start()
+        start = time.perf_counter()
+        for action in ACTIONS:
+            for events_staff in links:
+                ingestor.submit(events_staff.pk, action, control.pk)
+        accepted = time.perf_counter() - start
+        ingestor.stop()
+        elapsed = time.perf_counter() - start
+        _verify(event, staff_count, "buffered")
+    return accepted, elapsed
+
+
+def _recovery(staff_count, log_path):
+    """Queda antes do flush: o próximo ingestor grava o que estava no log"""
+    with scratch_event(staff_count=staff_count) as (event, links, control):
+        crashed = CheckIngestor(log_path)
+        crashed.start(background=False)
+        for action in ACTIONS:
+            for events_staff in links:
+                crashed.submit(events_staff.pk, action, control.pk)
+        # Simula a queda: o log fica para trás, nada foi gravado no banco
+        crashed._log.write('{"seq": ')
+        crashed._log.close()
+
+        recovered = CheckIngestor(log_path)
+        count = recovered.start(background=False)
+        recovered.stop()
+        _verify(event, staff_count, "recovery")
+    if count != staff_count * len(ACTIONS):
+        raise SuiteFailed(f"recovery: {count} checks recuperados")
+    return count
+
+
+@suite("check-ingest")
+def check_ingest(iterations=20, **options):
+    """
+    Checks por segundo: gravação direta (uma transação por check) contra a
+    ingestão buffered (log local + micro-lotes), e a recuperação do log
+    após uma queda simulada.
+    """
+    staff_count = iterations * 50
+    total = staff_count * len(ACTIONS)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "check_ingest.log"
+        try:
+            direct = _direct(staff_count)
+            accepted, buffered = _buffered(staff_count, log_path)
+            recovered = _recovery(staff_count, log_path)
+        finally:
+            IngestCheckpoint.objects.filter(name=CheckIngestor(log_path).name).delete()
+
+    return {
+        "checks": total,
+        "direct_per_sec": round(total / direct),
+        "buffered_accept_per_sec": round(total / accepted),
+        "buffered_per_sec": round(total / buffered),
+        "recovered": recovered,
+    }
@@ -0,0 +1,154 @@
+import socketserver
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from . import SuiteFailed, suite
+from .fixtures import scratch_event
+
+
+class _MemcachedHandler(socketserver.StreamRequestHandler):
+    """Subconjunto do protocolo texto do memcached usado pelo pymemcache"""
+
+    def handle(self):
+        store = self.server.store
+        while line := self.rfile.readline():
+            command, *args = line.decode().split()
+            if command in ("get", "gets"):
+                # Resposta em um único write (evita o atraso de ACK do TCP)
+                reply = b""
+                for key in args:
+                    if key in store:
+                        flags, value = store[key]
+                        reply += f"VALUE {key} {flags} {len(value)}\r\n".encode()
+                        reply += value + b"\r\n"
+                self.wfile.write(reply + b"END\r\n")
+                continue
+            if command in ("set", "add"):
+                key, flags, _exptime, size, *noreply = args
+                value = self.rfile.read(int(size) + 2)[:-2]
+                stored = command == "set" or key not in store
+                if stored:
+                    store[key] = (flags, value)
+                reply = b"STORED\r\n" if stored else b"NOT_STORED\r\n"
+            elif command in ("incr", "decr"):
+                key, delta, *noreply = args
+                if key not in store:
+                    reply = b"NOT_FOUND\r\n"
+                else:
+                    sign = 1 if command == "incr" else -1
+                    value = max(int(store[key][1]) + sign * int(delta), 0)
+                    store[key] = (store[key][0], str(value).encode())
+                    reply = f"{value}\r\n".encode()
+            elif command == "delete":
+                key, *noreply = args
+                reply = b"DELETED\r\n" if store.pop(key, None) else b"NOT_FOUND\r\n"
+            elif command == "touch":
+                key, _exptime, *noreply = args
+                reply = b"TOUCHED\r\n" if key in store else b"NOT_FOUND\r\n"
+            elif command == "flush_all":
+                noreply = args[1:]
+                store.clear()
+                reply = b"OK\r\n"
+            else:
+                noreply = []
+                reply = b"ERROR\r\n"
+            if not noreply:
+                self.wfile.write(reply)
+
+
+def _memcached_stand_in():
+    """Servidor local que imita um memcached (cache compartilhado)"""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _MemcachedHandler)
+    server.daemon_threads = True
+    server.store = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _timed_get(client, url, iterations, **headers):
+    statuses = set()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        statuses.add(client.get(url, headers=headers).status_code)
+    return (time.perf_counter() - started) * 1000 / iterations, statuses
+
+
+def _measure(control, company, iterations):
+    client = APIClient()
+    client.force_authenticate(control)
+    url = "/companies/"
+
+    # Miss: limpa o cache antes de cada requisição
+    started = time.perf_counter()
+    for _ in range(iterations):
+        cache.clear()
+        response = client.get(url)
+    miss_ms = (time.perf_counter() - started) * 1000 / iterations
+
+    hit_ms, hit_statuses = _timed_get(client, url, iterations)
+    etag = client.get(url)["ETag"]
+    not_modified_ms, conditional_statuses = _timed_get(
+        client, url, iterations, **{"If-None-Match": etag}
+    )
+    if hit_statuses != {200} or conditional_statuses != {304}:
+        raise SuiteFailed(
+            f"status inesperados: {hit_statuses} / {conditional_statuses}"
+        )
+
+    # Invalidação por signal: o nome novo aparece na próxima leitura
+    company.name = f"{company.name}-renamed"
+    company.save()
+    names = {item["name"] for item in client.get(url).data}
+    if company.name not in names:
+        raise SuiteFailed("resposta não foi invalidada após Company.save()")
+    if client.get(url, headers={"If-None-Match": etag}).status_code != 200:
+        raise SuiteFailed("ETag antigo ainda gera 304 após a invalidação")
+
+    return {
+        "miss_ms": round(miss_ms, 3),
+        "hit_ms": round(hit_ms, 3),
+        "not_modified_ms": round(not_modified_ms, 3),
+        "response_bytes": len(response.content),
+    }
+
+
+@suite("response-cache")
+def response_cache(iterations=20, **options):
+    """
+    Latência de GET /companies/ sem cache, com cache e com GET condicional
+    (304), no cache configurado e num memcached local de mentira
+    (compartilhado, via pymemcache). Verifica também a invalidação.
+    """
+    with scratch_event() as (event, links, control):
+        company = event.project.company
+        results = {"backend": settings.CACHES["default"]["BACKEND"]}
+        for key, value in _measure(control, company, iterations).items():
+            results[f"configured_{key}"] = value
+
+        try:
+            import pymemcache  # noqa: F401
+        except ImportError:
+            results["shared"] = "pymemcache não instalado"
+            return results
+
+        server = _memcached_stand_in()
+        shared = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+                "LOCATION": f"127.0.0.1:{server.server_address[1]}",
+            }
+        }
+        try:
+            with override_settings(CACHES=shared):
+                for key, value in _measure(control, company, iterations).items():
+                    results[f"shared_{key}"] = value
+        finally:
+            server.shutdown()
+            server.server_close()
+        results["shared_keys"] = len(server.store)
+    return results
@@ -0,0 +1,73 @@
+import re
+import time
+
+from ..utils import sanitize_digits, sanitize_digits_many
+from . import SuiteFailed, suite
+from .fixtures import fake_cnpj, fake_cpf
+
+ROWS = 200_000
+
+
+def _legacy(value):
+    """Implementação anterior (re.sub a cada chamada)"""
+    if not value:
+        return ""
+    return re.sub(r"\D", "", value)
+
+
+_COMPILED = re.compile(r"\D")
+
+
+def _compiled(value):
+    """Só a regex pré-compilada, sem atalhos"""
+    if not value:
+        return ""
+    return _COMPILED.sub("", value)
+
+
+def _inputs():
+    cpfs = [fake_cpf(i) for i in range(1, ROWS + 1)]
+    cnpj = fake_cnpj()
+    return {
+        "clean": cpfs,
+        "formatted": [f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}" for c in cpfs],
+        "cnpj": [f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"] * ROWS,
+        "unusual": [f"CPF: {c} (ok)" for c in cpfs],
+    }
+
+
+def _ns_per_row(func, values, iterations):
+    best = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = func(values)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e9 / len(values), result
+
+
+@suite("sanitize")
+def sanitize(iterations=20, **options):
+    """
+    Custo por linha de sanitize_digits (melhor de N rodadas) em entradas
+    já limpas, formatadas (CPF/CNPJ) e com texto, contra a implementação
+    anterior e contra apenas pré-compilar a regex.
+    """
+    iterations = max(1, iterations // 4)
+    candidates = {
+        "legacy": lambda values: [_legacy(v) for v in values],
+        "compiled": lambda values: [_compiled(v) for v in values],
+        "single": lambda values: [sanitize_digits(v) for v in values],
+        "many": sanitize_digits_many,
+    }
+    results = {}
+    for kind, values in _inputs().items():
+        expected = None
+        for name, func in candidates.items():
+            ns, output = _ns_per_row(func, values, iterations)
+            if expected is None:
+                expected = output
+            elif output != expected:
+                raise SuiteFailed(f"{name} difere da implementação anterior ({kind})")
+            results[f"{kind}_{name}_ns"] = round(ns, 1)
+    return results
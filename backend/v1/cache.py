@@ -0,0 +1,138 @@
+"""
+Cache de respostas da API v1.
+
+- Respostas GET são guardadas por view/ação, escopo do usuário
+  (role + company_id) e URL completa (inclui query string);
+- Cada view declara os namespaces de que depende ("company", "event",
+  ...). Cada namespace tem uma versão no próprio cache que entra na chave;
+  `bump()` invalida tudo o que depende dele sem precisar apagar chaves
+  (ver v1/signals.py);
+- ETag e Last-Modified acompanham a resposta e GETs condicionais
+  (If-None-Match / If-Modified-Since) recebem 304 sem corpo.
+
+O backend vem de settings.CACHES (locmem, file ou um cache compartilhado).
+Com locmem cada processo tem o seu cache e a invalidação só vale para o
+processo que gravou; use file/redis com mais de um worker.
+"""
+
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+NAMESPACES = ("company", "project", "event", "staff")
+
+_VERSION_KEY = "v1:ns:{}"
+
+
+def namespace_versions(namespaces):
+    """Versão atual de cada namespace (0 se nunca invalidado)"""
+    keys = [_VERSION_KEY.format(ns) for ns in namespaces]
+    versions = cache.get_many(keys)
+    return [versions.get(key, 0) for key in keys]
+
+
+def bump(*namespaces):
+    """Invalida as respostas que dependem dos namespaces"""
+    for ns in namespaces:
+        key = _VERSION_KEY.format(ns)
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Chave removida entre o add e o incr (ex.: cache.clear())
+            cache.set(key, 1, timeout=None)
+
+
+def bump_on_commit(*namespaces):
+    """
+    Invalida depois do commit: antes dele, uma requisição concorrente
+    poderia guardar os dados antigos já sob a versão nova.
+    """
+    transaction.on_commit(lambda: bump(*namespaces))
+
+
+def _etag(data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+    return quote_etag(hashlib.md5(payload.encode()).hexdigest())
+
+
+def _not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        return etag in [tag.strip() for tag in if_none_match.split(",")]
+    since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    return since is not None and int(last_modified) <= since
+
+
+class CachedResponseMixin:
+    """
+    Cache de respostas GET para views DRF.
+
+    `cache_namespaces`: namespaces cuja invalidação descarta a resposta.
+    `cached_actions`: ações de ViewSet cacheadas (APIViews: todo GET).
+    """
+
+    cache_namespaces = ()
+    cached_actions = ("list", "retrieve")
+    cache_timeout = None  # None: settings.API_CACHE_TIMEOUT
+
+    def _cacheable(self, request):
+        if request.method != "GET":
+            return False
+        action = getattr(self, "action", None)
+        return action is None or action in self.cached_actions
+
+    def get_response_cache_key(self, request):
+        user = request.user
+        versions = ".".join(
+            str(version) for version in namespace_versions(self.cache_namespaces)
+        )
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        view = f"{type(self).__name__}.{getattr(self, 'action', None) or 'get'}"
+        return f"v1:resp:{view}:{versions}:{user.role}:{user.company_id}:{path}"
+
+    def initial(self, request, *args, **kwargs):
+        # Autenticação e permissões rodam antes de qualquer leitura do cache
+        super().initial(request, *args, **kwargs)
+        self._response_cache_key = None
+        if not self._cacheable(request):
+            return
+
+        self._response_cache_key = self.get_response_cache_key(request)
+        cached = cache.get(self._response_cache_key)
+        if cached is not None:
+            # Mesmo mecanismo do DRF para ligar ações a métodos HTTP
+            setattr(self, "get", lambda *args, **kwargs: self._from_cache(cached))
+
+    def _from_cache(self, cached):
+        self._response_cache_key = None
+        return self._conditional(Response(cached["data"]), cached)
+
+    def _conditional(self, response, entry):
+        if _not_modified(self.request, entry["etag"], entry["last_modified"]):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response["ETag"] = entry["etag"]
+        response["Last-Modified"] = http_date(entry["last_modified"])
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        key = getattr(self, "_response_cache_key", None)
+        if key and response.status_code == status.HTTP_200_OK:
+            entry = {
+                "data": response.data,
+                "etag": _etag(response.data),
+                "last_modified": time.time(),
+            }
+            timeout = self.cache_timeout or settings.API_CACHE_TIMEOUT
+            cache.set(key, entry, timeout)
+            response = self._conditional(response, entry)
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,158 @@
+"""
+Leituras pesadas em uma réplica do banco.
+
+Relatórios, dashboard e listagens marcados com `ReplicaReadMixin` leem de
+settings.REPLICA_DATABASE (alias "replica" em DATABASES, opcional);
+escritas e todo o resto continuam no "default". A escolha vale para a
+requisição inteira, via contextvar, então também alcança código chamado
+pela view (reports, services) e as queries do ORM assíncrono.
+
+Read-your-writes: após uma escrita bem-sucedida (POST/PUT/PATCH/DELETE),
+`ReplicaStickinessMiddleware` marca o usuário no cache por
+REPLICA_STICKY_SECONDS; nesse intervalo as leituras dele voltam ao
+"default", cobrindo o atraso de replicação. Com cache locmem a marcação
+vale só no processo que atendeu a escrita (ver v1/cache.py).
+
+Respostas que vão para o cache de respostas (v1/cache.py) são montadas
+com leituras do primário: com a réplica atrasada, os dados antigos ficariam
+guardados sob a versão nova do namespace até API_CACHE_TIMEOUT.
+
+Sem réplica configurada, nada muda.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+_read_alias = ContextVar("v1_read_alias", default=None)
+
+_STICKY_KEY = "v1:sticky:{}"
+
+
+def replica_alias():
+    """Alias da réplica, ou None se não houver uma configurada"""
+    alias = getattr(settings, "REPLICA_DATABASE", None)
+    return alias if alias in settings.DATABASES else None
+
+
+def _sticky_key(user):
+    return _STICKY_KEY.format(user.pk)
+
+
+def mark_sticky(user):
+    """Leituras do usuário vão ao primário pelos próximos segundos"""
+    if replica_alias() and user.is_authenticated:
+        cache.set(_sticky_key(user), True, settings.REPLICA_STICKY_SECONDS)
+
+
+def read_alias_for(user):
+    """Alias de leitura para o usuário: réplica, salvo se escreveu há pouco"""
+    alias = replica_alias()
+    if alias is None or cache.get(_sticky_key(user)):
+        return None
+    return alias
+
+
+async def aread_alias_for(user):
+    alias = replica_alias()
+    if alias is None or await cache.aget(_sticky_key(user)):
+        return None
+    return alias
+
+
+@contextmanager
+def reading_from(alias):
+    """Envia as leituras do bloco para `alias` (None: roteamento padrão)"""
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    """Leituras na réplica quando a requisição pediu; escritas no default"""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplica e primário têm os mesmos dados
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # O schema da réplica vem da replicação (ou de sync_replica)
+        return db != replica_alias()
+
+
+class ReplicaReadMixin:
+    """
+    Views DRF cujas leituras vão para a réplica.
+
+    `replica_actions`: ações de ViewSet roteadas (APIViews: todo GET).
+    Deve vir antes de `CachedResponseMixin` nas bases da view.
+    """
+
+    replica_actions = ("list",)
+
+    def initial(self, request, *args, **kwargs):
+        # Autenticação antes: a aderência ao primário é por usuário
+        super().initial(request, *args, **kwargs)
+        self._replica_token = None
+        action = getattr(self, "action", None)
+        # Resposta que será guardada no cache: lê do primário
+        if getattr(self, "_response_cache_key", None):
+            return
+        if request.method in SAFE_METHODS and (
+            action is None or action in self.replica_actions
+        ):
+            alias = read_alias_for(request.user)
+            if alias:
+                self._replica_token = _read_alias.set(alias)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        token = getattr(self, "_replica_token", None)
+        if token is not None:
+            _read_alias.reset(token)
+            self._replica_token = None
+        return response
+
+
+class ReplicaStickinessMiddleware:
+    """Marca o usuário após escritas bem-sucedidas (read-your-writes)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def _after(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            # O DRF grava o usuário autenticado (JWT) no HttpRequest
+            user = getattr(request, "user", None)
+            if user is not None:
+                mark_sticky(user)
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self._after(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method in SAFE_METHODS:
+            return response
+        return await sync_to_async(self._after)(request, response)
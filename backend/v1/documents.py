@@ -0,0 +1,131 @@
+"""
+Validação dos dígitos verificadores de CPF e CNPJ.
+
+- `is_valid_cpf` / `is_valid_cnpj`: um documento (formulários, admin);
+- `validate_cpfs` / `validate_cnpjs`: um lote inteiro de uma vez (importações
+  com dezenas de milhares de linhas). Os documentos viram uma matriz de
+  dígitos (numpy) e os dois dígitos verificadores de todas as linhas são
+  calculados com produtos matriciais, sem laço Python por documento;
+- `validate_cpf_digits` / `validate_cnpj_digits`: o mesmo para lotes que o
+  chamador já sanitizou (evita sanitizar duas vezes).
+
+As entradas podem vir formatadas ("123.456.789-09"); tudo que não for
+dígito é descartado antes da conta. Sequências de um único dígito repetido
+(000.000.000-00, ...) passam na conta, mas são inválidas.
+"""
+
+import numpy as np
+
+from .utils import sanitize_digits, sanitize_digits_many
+
+CPF_LENGTH = 11
+CNPJ_LENGTH = 14
+
+_CPF_WEIGHTS_1 = np.arange(10, 1, -1)  # 10..2
+_CPF_WEIGHTS_2 = np.arange(11, 1, -1)  # 11..2
+_CNPJ_WEIGHTS_1 = np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+_CNPJ_WEIGHTS_2 = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+
+
+def _cpf_digit(total):
+    return total * 10 % 11 % 10
+
+
+def _cnpj_digit(total):
+    remainder = total % 11
+    return np.where(remainder < 2, 0, 11 - remainder)
+
+
+def _digit_matrix(digits, length):
+    """
+    (matriz n x length de dígitos, máscara das linhas com o tamanho certo)
+    a partir de documentos já sanitizados
+    """
+    # \d do re também casa dígitos não ASCII (ex.: arábicos)
+    ok = np.fromiter(
+        (len(d) == length and d.isascii() for d in digits),
+        dtype=bool,
+        count=len(digits),
+    )
+    filler = "0" * length
+    joined = "".join(d if flag else filler for d, flag in zip(digits, ok))
+    matrix = np.frombuffer(joined.encode("ascii"), dtype=np.uint8) - ord("0")
+    return matrix.reshape(len(digits), length).astype(np.int64), ok
+
+
+def _not_repeated(matrix):
+    return (matrix != matrix[:, :1]).any(axis=1)
+
+
+def validate_cpfs(values):
+    """Array booleano: CPF válido em cada posição de `values`"""
+    return validate_cpf_digits(sanitize_digits_many(values))
+
+
+def validate_cpf_digits(digits):
+    """validate_cpfs para CPFs já sanitizados (sem máscara)"""
+    matrix, ok = _digit_matrix(digits, CPF_LENGTH)
+    first = _cpf_digit(matrix[:, :9] @ _CPF_WEIGHTS_1)
+    second = _cpf_digit(matrix[:, :10] @ _CPF_WEIGHTS_2)
+    return (
+        ok & (matrix[:, 9] == first) & (matrix[:, 10] == second) & _not_repeated(matrix)
+    )
+
+
+def validate_cnpjs(values):
+    """Array booleano: CNPJ válido em cada posição de `values`"""
+    return validate_cnpj_digits(sanitize_digits_many(values))
+
+
+def validate_cnpj_digits(digits):
+    """validate_cnpjs para CNPJs já sanitizados (sem máscara)"""
+    matrix, ok = _digit_matrix(digits, CNPJ_LENGTH)
+    first = _cnpj_digit(matrix[:, :12] @ _CNPJ_WEIGHTS_1)
+    second = _cnpj_digit(matrix[:, :13] @ _CNPJ_WEIGHTS_2)
+    return (
+        ok
+        & (matrix[:, 12] == first)
+        & (matrix[:, 13] == second)
+        & _not_repeated(matrix)
+    )
+
+
+def cpf_check_digits(base):
+    """Os dois dígitos verificadores dos 9 primeiros dígitos de um CPF"""
+    digits = [int(c) for c in base]
+    first = sum(d * w for d, w in zip(digits, range(10, 1, -1))) * 10 % 11 % 10
+    digits.append(first)
+    second = sum(d * w for d, w in zip(digits, range(11, 1, -1))) * 10 % 11 % 10
+    return f"{first}{second}"
+
+
+def cnpj_check_digits(base):
+    """Os dois dígitos verificadores dos 12 primeiros dígitos de um CNPJ"""
+    digits = [int(c) for c in base]
+    result = ""
+    for weights in (_CNPJ_WEIGHTS_1, _CNPJ_WEIGHTS_2):
+        remainder = sum(d * int(w) for d, w in zip(digits, weights)) % 11
+        digit = 0 if remainder < 2 else 11 - remainder
+        digits.append(digit)
+        result += str(digit)
+    return result
+
+
+def is_valid_cpf(value):
+    digits = sanitize_digits(value)
+    return (
+        len(digits) == CPF_LENGTH
+        and digits.isascii()
+        and len(set(digits)) > 1
+        and digits[9:] == cpf_check_digits(digits[:9])
+    )
+
+
+def is_valid_cnpj(value):
+    digits = sanitize_digits(value)
+    return (
+        len(digits) == CNPJ_LENGTH
+        and digits.isascii()
+        and len(set(digits)) > 1
+        and digits[12:] == cnpj_check_digits(digits[:12])
+    )
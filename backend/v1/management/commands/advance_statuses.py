@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from v1.services.scheduling import advance_statuses, pending_transitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Abre e fecha eventos/projetos conforme as datas de início e fim. "
+        "Agende via cron (ex.: a cada minuto)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--no-snapshots",
+            action="store_true",
+            help="Não recalcula os snapshots dos eventos fechados.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas conta as transições pendentes.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            counts = pending_transitions()
+            self.stdout.write(
+                ", ".join(f"{key}={value}" for key, value in counts.items())
+            )
+            return
+
+        result = advance_statuses(
+            batch_size=options["batch_size"], snapshots=not options["no_snapshots"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Eventos: {result['events_opened']} abertos, "
+                f"{result['events_closed']} fechados; "
+                f"projetos: {result['projects_opened']} abertos, "
+                f"{result['projects_closed']} fechados; "
+                f"{result['snapshot_rows']} snapshots"
+            )
+        )
@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from v1.models import Event, Status
+from v1.services.archive import ArchiveError, archive_event, restore_event
+
+
+class Command(BaseCommand):
+    help = (
+        "Move staffs e checks de eventos encerrados para as tabelas de arquivo. "
+        "Agende via cron (ex.: diariamente)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=30,
+            help="Arquiva eventos encerrados há mais de N dias (padrão: 30).",
+        )
+        parser.add_argument(
+            "--event",
+            type=int,
+            action="append",
+            help="Arquiva apenas este evento (pode repetir).",
+        )
+        parser.add_argument(
+            "--restore",
+            type=int,
+            action="append",
+            help="Restaura este evento arquivado (pode repetir).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas lista os eventos que seriam arquivados.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["restore"]:
+            for event in Event.objects.filter(pk__in=options["restore"]):
+                try:
+                    staffs, checks = restore_event(event, batch_size=batch_size)
+                except ArchiveError as exc:
+                    raise CommandError(f"Evento {event.pk}: {exc}")
+                self.stdout.write(
+                    f"Evento {event.pk} restaurado: {staffs} staffs, {checks} checks"
+                )
+            return
+
+        events = Event.objects.filter(status=Status.CLOSE, archived_at__isnull=True)
+        if options["event"]:
+            events = events.filter(pk__in=options["event"])
+        else:
+            cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+            events = events.filter(date_end__lt=cutoff)
+        events = events.order_by("date_end")
+
+        if options["dry_run"]:
+            self.stdout.write(f"{events.count()} eventos seriam arquivados")
+            return
+
+        archived = 0
+        for event in events:
+            try:
+                staffs, checks = archive_event(event, batch_size=batch_size)
+            except ArchiveError as exc:
+                # Evento reaberto/arquivado entre a listagem e o lock
+                self.stderr.write(f"Evento {event.pk} ignorado: {exc}")
+                continue
+            archived += 1
+            self.stdout.write(
+                f"Evento {event.pk} arquivado: {staffs} staffs, {checks} checks"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"{archived} eventos arquivados"))
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from v1.benchmarks import SUITES, SuiteFailed
+from v1.query_guard import ImplicitQueryError
+
+
+class Command(BaseCommand):
+    help = "Executa suítes de benchmark/estresse (ver v1/benchmarks)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("suite", choices=sorted(SUITES))
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args, suite, **options):
+        started = time.perf_counter()
+        try:
+            # Queries escondidas em save() invalidam a medição: falha na hora
+            with override_settings(SAVE_QUERY_GUARD="raise"):
+                results = SUITES[suite](
+                    threads=options["threads"], iterations=options["iterations"]
+                )
+        except (SuiteFailed, ImplicitQueryError) as exc:
+            raise CommandError(f"{suite}: {exc}")
+
+        for key, value in results.items():
+            self.stdout.write(f"{key}: {value}")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"{suite} ok ({elapsed:.2f}s)"))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from v1.reports import refresh_snapshots
+
+
+class Command(BaseCommand):
+    help = (
+        "Atualiza os snapshots diários de projetos/eventos. Por padrão é "
+        "incremental (a partir do último check processado); agende-o via cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recalcula todos os eventos que possuem checks.",
+        )
+        parser.add_argument(
+            "--event",
+            type=int,
+            action="append",
+            dest="events",
+            help="Recalcula apenas o evento informado (pode repetir).",
+        )
+
+    def handle(self, *args, **options):
+        events, rows = refresh_snapshots(
+            event_ids=options["events"], full=options["full"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"{events} eventos recalculados, {rows} snapshots")
+        )
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand
+
+from v1.services.people import NAME_SIMILARITY, duplicate_groups, link_people
+
+
+class Command(BaseCommand):
+    help = (
+        "Liga os staffs de mesmo CPF (entre empresas) a uma Person canônica "
+        "e lista os grupos duplicados. Rode após a migração 0013 e agende via "
+        "cron para ligar staffs criados por caminhos em massa."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--report",
+            action="store_true",
+            help=(
+                "Apenas lista as pessoas com mais de um staff, sem gravar nada "
+                "(considera os staffs já ligados a uma Person)."
+            ),
+        )
+        parser.add_argument(
+            "--conflicts-only",
+            action="store_true",
+            help="No relatório, mostra apenas grupos com nomes divergentes.",
+        )
+        parser.add_argument(
+            "--min-similarity",
+            type=float,
+            default=NAME_SIMILARITY,
+            help=f"Similaridade mínima de nomes (padrão: {NAME_SIMILARITY}).",
+        )
+        parser.add_argument("--limit", type=int, default=100)
+
+    def handle(self, *args, **options):
+        if options["report"]:
+            groups = duplicate_groups(
+                min_similarity=options["min_similarity"], limit=options["limit"]
+            )
+            if options["conflicts_only"]:
+                groups = [group for group in groups if group["conflict"]]
+            for group in groups:
+                flag = " [conflito]" if group["conflict"] else ""
+                self.stdout.write(
+                    f"{group['cpf']} {group['name']}: {group['staffs']} staffs "
+                    f"em {group['companies']} empresas{flag}"
+                )
+                for member in group["members"]:
+                    self.stdout.write(
+                        f"  staff {member['id']} empresa {member['company']} "
+                        f"{member['name']} ({member['similarity']})"
+                    )
+            self.stdout.write(f"{len(groups)} grupos")
+            return
+
+        created, relinked = link_people(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{created} pessoas criadas, {relinked} staffs ligados")
+        )
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from v1.services.mail import BATCH_SIZE, MAX_ATTEMPTS, drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Envia os e-mails pendentes da EmailOutbox em lotes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Continua rodando como worker, aguardando novos e-mails.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Segundos de espera quando a fila está vazia (com --loop).",
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = drain_outbox(
+                batch_size=options["batch_size"],
+                max_attempts=options["max_attempts"],
+            )
+            total_sent += sent
+            total_failed += failed
+            if sent or failed:
+                self.stdout.write(f"lote: {sent} enviados, {failed} falhas")
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{total_sent} enviados, {total_failed} falhas")
+        )
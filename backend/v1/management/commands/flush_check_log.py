@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from v1.services.ingest import CheckIngestor
+
+
+class Command(BaseCommand):
+    help = (
+        "Grava no banco os checks do log de ingestão que ainda não foram "
+        "gravados (ex.: após uma queda com CHECK_INGEST_MODE=buffered)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--log", default=settings.CHECK_INGEST_LOG)
+
+    def handle(self, *args, **options):
+        ingestor = CheckIngestor(options["log"])
+        try:
+            recovered = ingestor.start(background=False)
+        except RuntimeError as exc:
+            # O processo da API ainda está com o log: ele mesmo grava
+            raise CommandError(str(exc))
+        ingestor.stop()
+        self.stdout.write(self.style.SUCCESS(f"{recovered} checks gravados do log"))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from v1.services.staff_search import install_fulltext
+
+
+class Command(BaseCommand):
+    help = (
+        "Recria o índice full-text de staffs (tabela FTS5 e triggers no SQLite, "
+        "índice FULLTEXT no MySQL) e o repopula."
+    )
+
+    def handle(self, *args, **options):
+        with connection.schema_editor() as schema_editor:
+            install_fulltext(schema_editor)
+        self.stdout.write(self.style.SUCCESS("Índice de busca de staffs recriado"))
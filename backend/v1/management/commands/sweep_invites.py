@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from v1.models import UserInvite
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove, em lotes, convites expirados e não utilizados. "
+        "Agende via cron (ex.: diariamente)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-days",
+            type=int,
+            default=7,
+            help="Mantém convites expirados há menos de N dias (padrão: 7).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas conta os convites que seriam removidos.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["grace_days"])
+        expired = UserInvite.objects.filter(used_by__isnull=True, expires_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{expired.count()} convites seriam removidos")
+            return
+
+        removed = 0
+        while True:
+            ids = list(
+                expired.order_by("expires_at").values_list("id", flat=True)[
+                    : options["batch_size"]
+                ]
+            )
+            if not ids:
+                break
+            removed += UserInvite.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f"{removed} convites removidos"))
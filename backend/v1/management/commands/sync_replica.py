@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from v1.db_routing import replica_alias
+
+
+class Command(BaseCommand):
+    help = (
+        "Copia o banco default para a réplica. Apenas para desenvolvimento "
+        "com dois arquivos SQLite; em produção use a replicação do banco."
+    )
+
+    def handle(self, *args, **options):
+        alias = replica_alias()
+        if alias is None:
+            raise CommandError("Nenhuma réplica configurada (DB_REPLICA_NAME).")
+
+        source, target = connections["default"], connections[alias]
+        if source.vendor != "sqlite" or target.vendor != "sqlite":
+            raise CommandError("sync_replica só copia bancos SQLite.")
+
+        source.ensure_connection()
+        target.ensure_connection()
+        # API de backup do sqlite3: cópia consistente mesmo com escritas
+        source.connection.backup(target.connection)
+        self.stdout.write(self.style.SUCCESS(f"default copiado para {alias}"))
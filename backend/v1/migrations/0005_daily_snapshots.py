@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-19 15:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0004_user_is_staff'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SnapshotCursor',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('last_check_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'snapshot_cursors',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('registered', models.PositiveIntegerField(default=0)),
+                ('check_ins', models.PositiveIntegerField(default=0)),
+                ('check_outs', models.PositiveIntegerField(default=0)),
+                ('peak_on_site', models.PositiveIntegerField(default=0)),
+                ('hours', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='v1.company')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='v1.event')),
+                ('project', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='v1.project')),
+            ],
+            options={
+                'db_table': 'daily_snapshots',
+                'indexes': [models.Index(fields=['project', 'day'], name='daily_snaps_project_54838d_idx')],
+                'unique_together': {('event', 'company', 'day')},
+            },
+        ),
+    ]
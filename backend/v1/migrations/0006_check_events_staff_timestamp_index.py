@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0005_daily_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='check',
+            index=models.Index(fields=['events_staff', 'timestamp'], name='checks_events__68746a_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-19 15:12
+
+from django.db import migrations, models
+
+from v1.services.staff_search import install_fulltext, uninstall_fulltext
+from v1.utils import normalize_search_text
+
+
+def backfill_name_search(apps, schema_editor):
+    Staff = apps.get_model("v1", "Staff")
+    batch = []
+    for staff in Staff.objects.only("id", "name").iterator(chunk_size=2000):
+        staff.name_search = normalize_search_text(staff.name)
+        batch.append(staff)
+        if len(batch) >= 2000:
+            Staff.objects.bulk_update(batch, ["name_search"])
+            batch = []
+    Staff.objects.bulk_update(batch, ["name_search"])
+
+
+def create_fulltext(apps, schema_editor):
+    install_fulltext(schema_editor)
+
+
+def drop_fulltext(apps, schema_editor):
+    uninstall_fulltext(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0006_check_events_staff_timestamp_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='staff',
+            name='name_search',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='staff',
+            index=models.Index(fields=['cpf'], name='staffs_cpf_d3ec91_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='staff',
+            index=models.Index(fields=['name_search'], name='staffs_name_se_9bceef_idx'),
+        ),
+        migrations.RunPython(backfill_name_search, migrations.RunPython.noop),
+        migrations.RunPython(create_fulltext, drop_fulltext),
+    ]
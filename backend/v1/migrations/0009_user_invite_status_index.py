@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-19 15:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0008_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userinvite',
+            index=models.Index(fields=['expires_at', 'used_by'], name='user_invite_expires_1d67ee_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-19 15:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0009_user_invite_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='archived_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ArchivedEventsStaff',
+            fields=[
+                ('id', models.CharField(editable=False, max_length=21, primary_key=True, serialize=False)),
+                ('staff_cpf', models.CharField(max_length=11)),
+                ('registration_check_id', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_staffs', to='v1.event')),
+                ('staff', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='v1.staff')),
+            ],
+            options={
+                'db_table': 'archived_events_staff',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedCheck',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('action', models.CharField(choices=[('registration', 'Registration'), ('check-in', 'Check-In'), ('check-out', 'Check-Out')], max_length=20)),
+                ('timestamp', models.DateTimeField()),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_checks', to='v1.event')),
+                ('user_control', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('events_staff', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='checks_history', to='v1.archivedeventsstaff')),
+            ],
+            options={
+                'db_table': 'archived_checks',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedeventsstaff',
+            index=models.Index(fields=['staff_cpf'], name='archived_ev_staff_c_e0f0ec_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-19 15:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0010_event_archive'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date_begin', 'date_end'], name='events_date_be_ebfa44_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventsstaff',
+            index=models.Index(fields=['staff_cpf', 'event'], name='events_staf_staff_c_0a8132_idx'),
+        ),
+    ]
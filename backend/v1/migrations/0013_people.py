@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-19 15:31
+
+import django.db.models.deletion
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+from v1.services.staff_search import install_fulltext
+
+
+def reinstall_fulltext(apps, schema_editor):
+    # Se o AddField recriar a tabela staffs (SQLite), os triggers FTS somem
+    install_fulltext(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0012_status_schedule_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Person',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cpf', models.CharField(max_length=11, unique=True)),
+                ('name', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(db_default=django.db.models.functions.datetime.Now())),
+            ],
+            options={
+                'db_table': 'people',
+            },
+        ),
+        migrations.AddField(
+            model_name='staff',
+            name='person',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='staffs', to='v1.person'),
+        ),
+        migrations.RunPython(reinstall_fulltext, migrations.RunPython.noop),
+    ]
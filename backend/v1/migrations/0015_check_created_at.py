@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-19 15:51
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0014_ingest_checkpoint'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='snapshotcursor',
+            name='last_check_id',
+        ),
+        migrations.AddField(
+            model_name='check',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AddField(
+            model_name='snapshotcursor',
+            name='last_created_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name='check',
+            index=models.Index(fields=['created_at'], name='checks_created_10a26d_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0016_emailoutbox_claimed_until'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userinvite',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='userinvite',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -5,11 +5,15 @@ class AdminWriteCompanyReadMixin:
     """
     Mixin para garantir que apenas Admins escrevam,
     mas usuários da empresa ou controle possam ler.
+
+    Ações extras de escrita (@action) entram em `write_actions`.
     """
 
+    write_actions = ["create", "update", "partial_update", "destroy"]
+
     def get_permissions(self):
         # Ações de escrita
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action in self.write_actions:
             return [IsAdmin()]
 
         # Ações de leitura (list, retrieve)
@@ -5,12 +5,18 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models.functions import Now
 from django.utils import timezone
 
-from .utils import generate_nano_id, sanitize_digits
+from .documents import is_valid_cnpj, is_valid_cpf
+from .query_guard import SaveQueryGuardMixin
+from .utils import generate_nano_id, normalize_search_text, sanitize_digits
+
+# Validade padrão de um convite
+INVITE_LIFETIME = timedelta(hours=48)
 
 
 # --- Enums Modernos (Django TextChoices) ---
@@ -31,6 +37,18 @@ class CompanyRole(models.TextChoices):
     SERVICE = "service", "Service"
 
 
+class OutboxStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    SENT = "sent", "Sent"
+    FAILED = "failed", "Failed"
+
+
+class InviteStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    USED = "used", "Used"
+    EXPIRED = "expired", "Expired"
+
+
 class CheckAction(models.TextChoices):
     REGISTRATION = "registration", "Registration"
     CHECK_IN = "check-in", "Check-In"
@@ -60,10 +78,33 @@ class CustomUserManager(BaseUserManager):
         )
 
 
+class UserInviteQuerySet(models.QuerySet):
+    def with_status(self):
+        """Anota `invite_status` calculado no banco (mesma regra de .status)"""
+        return self.annotate(
+            invite_status=models.Case(
+                models.When(used_by__isnull=False, then=models.Value("used")),
+                models.When(expires_at__lte=Now(), then=models.Value("expired")),
+                default=models.Value("pending"),
+                output_field=models.CharField(),
+            )
+        )
+
+    def filter_status(self, status):
+        """Filtra por status direto no SQL (usa o índice expires_at/used_by)"""
+        if status == InviteStatus.USED:
+            return self.filter(used_by__isnull=False)
+        if status == InviteStatus.EXPIRED:
+            return self.filter(used_by__isnull=True, expires_at__lte=Now())
+        if status == InviteStatus.PENDING:
+            return self.filter(used_by__isnull=True, expires_at__gt=Now())
+        raise ValueError(f"Status de convite inválido: {status}")
+
+
 # --- Entidades ---
 
 
-class Company(models.Model):
+class Company(SaveQueryGuardMixin, models.Model):
     name = models.CharField(max_length=255)
     cnpj = models.CharField(max_length=14, unique=True)
     # db_default=Now() delega ao MySQL inserir o timestamp
@@ -72,10 +113,19 @@ class Company(models.Model):
         "User", on_delete=models.SET_NULL, null=True, related_name="companies_created"
     )
 
+    def clean(self):
+        # Formulários (admin) e serializer validam; save() não, pois há
+        # CNPJs antigos inválidos que não podem travar outras edições
+        if not is_valid_cnpj(self.cnpj):
+            raise ValidationError({"cnpj": "CNPJ inválido."})
+
     def save(self, *args, **kwargs):
         self.cnpj = sanitize_digits(self.cnpj)
         super().save(*args, **kwargs)
 
+    def __str__(self):
+        return self.name
+
     class Meta:
         db_table = "company"
 
@@ -110,7 +160,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         db_table = "users"
 
 
-class UserInvite(models.Model):
+class UserInvite(SaveQueryGuardMixin, models.Model):
     id = models.CharField(
         primary_key=True, max_length=21, default=generate_nano_id, editable=False
     )
@@ -130,41 +180,106 @@ class UserInvite(models.Model):
         User, on_delete=models.SET_NULL, null=True, related_name="invites_created"
     )
 
+    objects = UserInviteQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         if not self.expires_at:
             # Cálculo automático para expired_at, 48h
-            self.expires_at = timezone.now() + timedelta(hours=48)
+            self.expires_at = timezone.now() + INVITE_LIFETIME
         super().save(*args, **kwargs)
 
     @property
     def status(self):
-        # Propriedade computada (não vai pro banco)
-        if self.used_by:
-            return "used"
+        # Usa o valor anotado por with_status() quando disponível
+        if "invite_status" in self.__dict__:
+            return self.invite_status
+        if self.used_by_id:
+            return InviteStatus.USED
         if self.expires_at <= timezone.now():
-            return "expired"
-        return "pending"
+            return InviteStatus.EXPIRED
+        return InviteStatus.PENDING
 
     class Meta:
         db_table = "user_invites"
+        indexes = [models.Index(fields=["expires_at", "used_by"])]
+
+
+class Person(SaveQueryGuardMixin, models.Model):
+    """
+    Pessoa física canônica: um registro por CPF, ligado aos Staffs da
+    mesma pessoa em cada empresa (ver services/people.py)
+    """
+
+    cpf = models.CharField(max_length=11, unique=True)
+    name = models.CharField(max_length=255)
+    created_at = models.DateTimeField(db_default=Now())
+
+    def save(self, *args, **kwargs):
+        self.cpf = sanitize_digits(self.cpf)
+        super().save(*args, **kwargs)
 
+    def __str__(self):
+        return self.name
 
-class Staff(models.Model):
+    class Meta:
+        db_table = "people"
+
+
+class Staff(SaveQueryGuardMixin, models.Model):
     name = models.CharField(max_length=255)
+    # Nome normalizado (sem acentos, minúsculo) indexado para busca
+    name_search = models.CharField(max_length=255, default="", editable=False)
     cpf = models.CharField(max_length=11)
     company = models.ForeignKey(
         Company, on_delete=models.CASCADE, related_name="staffs"
     )
     created_at = models.DateTimeField(db_default=Now())
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    # Mesmo CPF em empresas diferentes aponta para a mesma Person
+    person = models.ForeignKey(
+        Person, on_delete=models.SET_NULL, null=True, blank=True, related_name="staffs"
+    )
+
+    # save() cria/busca a Person do CPF de propósito
+    save_query_tables = ("people",)
+
+    def clean(self):
+        if not is_valid_cpf(self.cpf):
+            raise ValidationError({"cpf": "CPF inválido."})
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # CPF carregado do banco: save() religa a Person se ele mudar
+        if "cpf" in instance.__dict__:
+            instance._loaded_cpf = instance.cpf
+        return instance
 
     def save(self, *args, **kwargs):
         self.cpf = sanitize_digits(self.cpf)
+        self.name_search = normalize_search_text(self.name)
+        cpf_changed = getattr(self, "_loaded_cpf", self.cpf) != self.cpf
+        if self.person_id is None or cpf_changed:
+            self.person, _ = Person.objects.get_or_create(
+                cpf=self.cpf, defaults={"name": self.name}
+            )
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "person"}
         super().save(*args, **kwargs)
+        self._loaded_cpf = self.cpf
+
+    def __str__(self):
+        return self.name
 
     class Meta:
         db_table = "staffs"
         unique_together = ["company", "cpf"]
+        indexes = [
+            # Busca por prefixo de CPF entre empresas (admin)
+            models.Index(fields=["cpf"]),
+            models.Index(fields=["name_search"]),
+        ]
 
 
 class Project(models.Model):
@@ -184,8 +299,16 @@ class Project(models.Model):
     created_at = models.DateTimeField(db_default=Now())
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
 
+    def __str__(self):
+        return self.name
+
     class Meta:
         db_table = "projects"
+        indexes = [
+            # Transições automáticas de status (services/scheduling.py)
+            models.Index(fields=["status", "date_begin"]),
+            models.Index(fields=["status", "date_end"]),
+        ]
 
 
 class Event(models.Model):
@@ -204,9 +327,21 @@ class Event(models.Model):
     )
     created_at = models.DateTimeField(db_default=Now())
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    # Preenchido quando staffs e checks do evento vão para as tabelas de arquivo
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.name
 
     class Meta:
         db_table = "events"
+        indexes = [
+            # Consultas por intervalo (calendário)
+            models.Index(fields=["date_begin", "date_end"]),
+            # Transições automáticas de status (services/scheduling.py)
+            models.Index(fields=["status", "date_begin"]),
+            models.Index(fields=["status", "date_end"]),
+        ]
 
 
 class EventsCompany(models.Model):
@@ -224,7 +359,7 @@ class EventsCompany(models.Model):
         unique_together = ["event", "company"]
 
 
-class EventsStaff(models.Model):
+class EventsStaff(SaveQueryGuardMixin, models.Model):
     id = models.CharField(
         primary_key=True, max_length=21, default=generate_nano_id, editable=False
     )
@@ -247,16 +382,23 @@ class EventsStaff(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
 
     def save(self, *args, **kwargs):
-        if self.staff_id and not self.staff_cpf:
-            # Otimização: só busca se não tiver, ou confia no frontend/logica
-            # No Django 6, recomenda-se evitar queries dentro do save se possível,
-            # mas para redundância é aceitável.
+        if not self.staff_cpf:
+            # Só copia o CPF de um Staff já carregado: buscar o Staff aqui
+            # seria uma query escondida por linha nos caminhos em massa
+            if not EventsStaff.staff.is_cached(self):
+                raise ValueError(
+                    "EventsStaff sem staff_cpf: informe o CPF ou a instância de Staff"
+                )
             self.staff_cpf = self.staff.cpf
         super().save(*args, **kwargs)
 
     class Meta:
         db_table = "events_staff"
         unique_together = ["event", "staff_cpf"]
+        indexes = [
+            # Mesmo CPF em outros eventos (conflitos de escala, histórico)
+            models.Index(fields=["staff_cpf", "event"]),
+        ]
 
 
 class Check(models.Model):
@@ -268,6 +410,137 @@ class Check(models.Model):
     user_control = models.ForeignKey(
         User, on_delete=models.SET_NULL, null=True, related_name="checks_performed"
     )
+    # Momento da gravação (o timestamp pode vir de antes, ex.: ingestão em lote)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         db_table = "checks"
+        indexes = [
+            # Histórico por EventsStaff em ordem cronológica (relatórios/vazão)
+            models.Index(fields=["events_staff", "timestamp"]),
+            # Varredura incremental dos snapshots
+            models.Index(fields=["created_at"]),
+        ]
+
+
+# --- Arquivo (eventos encerrados) ---
+
+
+class ArchivedEventsStaff(models.Model):
+    """Cópia de EventsStaff de um evento arquivado (mesmo id)"""
+
+    id = models.CharField(primary_key=True, max_length=21, editable=False)
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, related_name="archived_staffs"
+    )
+    staff = models.ForeignKey(Staff, on_delete=models.CASCADE)
+    staff_cpf = models.CharField(max_length=11)
+    # Sem FK: o Check de credenciamento também está arquivado
+    registration_check_id = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+
+    class Meta:
+        db_table = "archived_events_staff"
+        indexes = [
+            # Histórico por CPF (StaffViewSet.history)
+            models.Index(fields=["staff_cpf"]),
+        ]
+
+
+class ArchivedCheck(models.Model):
+    """Cópia de Check de um evento arquivado (mesmo id)"""
+
+    id = models.BigIntegerField(primary_key=True)
+    # Desnormalizado para que relatórios filtrem sem join
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, related_name="archived_checks"
+    )
+    events_staff = models.ForeignKey(
+        ArchivedEventsStaff, on_delete=models.CASCADE, related_name="checks_history"
+    )
+    action = models.CharField(max_length=20, choices=CheckAction.choices)
+    timestamp = models.DateTimeField()
+    user_control = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+
+    class Meta:
+        db_table = "archived_checks"
+
+
+# --- Agregados pré-calculados (relatórios) ---
+
+
+class DailySnapshot(models.Model):
+    """Agregado diário por evento/empresa, alimentado por build_snapshots"""
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="snapshots",
+    )
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="snapshots")
+    company = models.ForeignKey(Company, on_delete=models.CASCADE)
+    day = models.DateField()
+
+    registered = models.PositiveIntegerField(default=0)
+    check_ins = models.PositiveIntegerField(default=0)
+    check_outs = models.PositiveIntegerField(default=0)
+    peak_on_site = models.PositiveIntegerField(default=0)
+    hours = models.FloatField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "daily_snapshots"
+        unique_together = ["event", "company", "day"]
+        indexes = [models.Index(fields=["project", "day"])]
+
+
+class SnapshotCursor(models.Model):
+    """Marca d'água (Check.created_at) de um job incremental"""
+
+    name = models.CharField(primary_key=True, max_length=50)
+    last_created_at = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "snapshot_cursors"
+
+
+class IngestCheckpoint(models.Model):
+    """Última entrada do log de ingestão de checks gravada no banco"""
+
+    name = models.CharField(primary_key=True, max_length=100)
+    sequence = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "ingest_checkpoints"
+
+
+# --- Fila de e-mails ---
+
+
+class EmailOutbox(models.Model):
+    """E-mail enfileirado, enviado em lotes pelo comando drain_outbox"""
+
+    to = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(
+        max_length=10, choices=OutboxStatus.choices, default=OutboxStatus.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    # Lease do worker que pegou a mensagem; vencido, ela volta para a fila
+    claimed_until = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_outbox"
+        indexes = [models.Index(fields=["status", "id"])]
@@ -0,0 +1,56 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class StandardPagination(PageNumberPagination):
+    """Paginação opt-in (?page=, ?page_size=) para listagens potencialmente longas"""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+# Abaixo disso a contagem exata é barata e a estimativa pouco confiável
+ESTIMATE_THRESHOLD = 100_000
+
+_ESTIMATE_SQL = {
+    "postgresql": "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+    "mysql": (
+        "SELECT table_rows FROM information_schema.tables "
+        "WHERE table_schema = DATABASE() AND table_name = %s"
+    ),
+}
+
+
+def estimated_count(model, using="default"):
+    """Número aproximado de linhas da tabela (estatísticas do banco) ou None"""
+    connection = connections[using]
+    sql = _ESTIMATE_SQL.get(connection.vendor)
+    if sql is None:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [model._meta.db_table])
+        row = cursor.fetchone()
+    return row[0] if row and row[0] and row[0] > 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator do admin para tabelas grandes.
+
+    Sem filtros, um COUNT(*) percorre a tabela inteira; nesse caso usamos a
+    estimativa das estatísticas do banco (MySQL/PostgreSQL) quando ela
+    passa de ESTIMATE_THRESHOLD. Com filtros, a contagem é exata.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.has_filters():
+            estimate = estimated_count(queryset.model, using=queryset.db)
+            if estimate and estimate > ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
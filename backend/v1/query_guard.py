@@ -0,0 +1,93 @@
+"""
+Detecção de queries implícitas dentro de Model.save().
+
+Um save() deve executar apenas a escrita da própria linha. Acessar uma FK
+não carregada (ex.: `self.staff.cpf`) dispara um SELECT escondido por
+linha, que em caminhos em massa vira N queries. Modelos que herdam de
+`SaveQueryGuardMixin` rodam o save() sob um `execute_wrapper` que
+registra qualquer SQL fora da tabela do modelo.
+
+O comportamento vem de settings.SAVE_QUERY_GUARD:
+- "off" (padrão): nada é verificado;
+- "warn": registra no logger `v1.query_guard`;
+- "raise": levanta ImplicitQueryError (use nos testes/benchmarks).
+
+Queries explícitas e esperadas em outras tabelas são declaradas por
+modelo em `save_query_tables`.
+"""
+
+import functools
+import logging
+import re
+
+from django.conf import settings
+from django.db import connections, router
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "warn", "raise")
+
+# Controle de transação emitido pelo próprio Django durante o save()
+_TRANSACTION_SQL = re.compile(r"^\s*(SAVEPOINT|RELEASE|ROLLBACK|BEGIN|COMMIT)\b", re.I)
+
+
+class ImplicitQueryError(AssertionError):
+    """save() executou uma query fora da tabela do modelo"""
+
+
+def _tables_in(sql):
+    return set(re.findall(r'(?:FROM|INTO|UPDATE|JOIN)\s+[`"]?(\w+)[`"]?', sql, re.I))
+
+
+class _SaveQueryRecorder:
+    def __init__(self, allowed_tables):
+        self.allowed_tables = allowed_tables
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if not _TRANSACTION_SQL.match(sql) and not _tables_in(sql) <= set(
+            self.allowed_tables
+        ):
+            self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+
+def _guarded(save):
+    @functools.wraps(save)
+    def wrapper(self, *args, **kwargs):
+        mode = getattr(settings, "SAVE_QUERY_GUARD", "off")
+        if mode == "off":
+            return save(self, *args, **kwargs)
+
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        recorder = _SaveQueryRecorder((self._meta.db_table, *self.save_query_tables))
+        with connections[using].execute_wrapper(recorder):
+            result = save(self, *args, **kwargs)
+
+        if recorder.queries:
+            message = (
+                f"{type(self).__name__}.save() executou {len(recorder.queries)} "
+                f"query(s) implícita(s): {recorder.queries[0]}"
+            )
+            if mode == "raise":
+                raise ImplicitQueryError(message)
+            logger.warning(message)
+        return result
+
+    return wrapper
+
+
+class SaveQueryGuardMixin:
+    """
+    Verifica (conforme SAVE_QUERY_GUARD) as queries feitas pelo save()
+    do modelo, incluindo a lógica antes do super().save()
+    """
+
+    # Tabelas, além da do modelo, que o save() pode consultar de propósito
+    save_query_tables = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Envolve o save() definido pelo próprio modelo (não o herdado)
+        if "save" in cls.__dict__:
+            cls.save = _guarded(cls.__dict__["save"])
@@ -0,0 +1,9 @@
+from .attendance import (
+    AttendanceReport,
+    build_attendance_report,
+    hours_by_events_staff,
+    load_check_columns,
+)
+from .calendar import MAX_RANGE_DAYS, double_bookings, event_calendar
+from .snapshots import rebuild_events, refresh_snapshots
+from .throughput import INTERVALS, check_histogram, invalidate_histogram
@@ -0,0 +1,299 @@
+"""
+Apuração de horas trabalhadas a partir do histórico de checks.
+
+O histórico é carregado em lotes colunares (uma lista por coluna, sem
+instanciar models) e o pareamento check-in -> check-out é feito de forma
+vetorizada com NumPy, o que mantém o custo linear mesmo para um projeto
+inteiro com dezenas de eventos.
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC
+from itertools import islice
+
+import numpy as np
+from django.utils import timezone
+
+from ..models import CheckAction, Company, Staff
+from .sources import check_sources
+
+BATCH_SIZE = 5000
+
+ACTION_IN = 1
+ACTION_OUT = -1
+
+MICROSECONDS_PER_HOUR = 3_600_000_000
+
+
+@dataclass
+class CheckColumns:
+    """Histórico de check-in/out em formato colunar (um array por coluna)"""
+
+    events_staff: np.ndarray  # código inteiro do EventsStaff (fatorado)
+    staff: np.ndarray
+    company: np.ndarray
+    event: np.ndarray
+    action: np.ndarray  # ACTION_IN / ACTION_OUT
+    timestamp: np.ndarray  # datetime64[us] em UTC
+    # ID original de cada código de `events_staff` (keys[code] -> nanoid)
+    events_staff_keys: np.ndarray = field(
+        default_factory=lambda: np.array([], dtype=object)
+    )
+
+    def __len__(self):
+        return len(self.action)
+
+
+@dataclass
+class AttendanceReport:
+    staff: list = field(default_factory=list)
+    companies: list = field(default_factory=list)
+    days: list = field(default_factory=list)
+    total_hours: float = 0.0
+    shifts: int = 0
+    unmatched_check_ins: int = 0
+    unmatched_check_outs: int = 0
+
+    def as_dict(self):
+        return {
+            "total_hours": self.total_hours,
+            "shifts": self.shifts,
+            "unmatched_check_ins": self.unmatched_check_ins,
+            "unmatched_check_outs": self.unmatched_check_outs,
+            "staff": self.staff,
+            "companies": self.companies,
+            "days": self.days,
+        }
+
+
+def load_check_columns(event_ids=None, batch_size=BATCH_SIZE, **filters):
+    """
+    Carrega os check-in/out dos eventos em lotes colunares.
+
+    `filters` são lookups extras sobre Check (ex.: events_staff__staff_cpf).
+    Checks de eventos arquivados são lidos do arquivo da mesma forma.
+    """
+    columns = ([], [], [], [], [], [])
+    for checks, event_field in check_sources(
+        event_ids, action__in=[CheckAction.CHECK_IN, CheckAction.CHECK_OUT], **filters
+    ):
+        rows = checks.values_list(
+            "events_staff_id",
+            "events_staff__staff_id",
+            "events_staff__staff__company_id",
+            event_field,
+            "action",
+            "timestamp",
+        ).iterator(chunk_size=batch_size)
+        while batch := list(islice(rows, batch_size)):
+            for column, values in zip(columns, zip(*batch)):
+                column.extend(values)
+
+    events_staff, staff, company, event, action, timestamp = columns
+    return columns_from_lists(events_staff, staff, company, event, action, timestamp)
+
+
+def columns_from_lists(events_staff, staff, company, event, action, timestamp):
+    """Monta um CheckColumns a partir de listas paralelas já carregadas"""
+    if not action:
+        empty = np.array([], dtype=np.int64)
+        return CheckColumns(
+            empty, empty, empty, empty, empty, np.array([], dtype="datetime64[us]")
+        )
+
+    # EventsStaff usa nanoid como PK: fatoramos para códigos inteiros
+    events_staff_keys, events_staff_codes = np.unique(
+        np.array(events_staff, dtype=object).astype(str), return_inverse=True
+    )
+    actions = np.where(
+        np.array(action, dtype=object) == CheckAction.CHECK_IN, ACTION_IN, ACTION_OUT
+    )
+    timestamps = np.array(
+        [ts.astimezone(UTC).replace(tzinfo=None) for ts in timestamp],
+        dtype="datetime64[us]",
+    )
+    return CheckColumns(
+        events_staff=events_staff_codes.astype(np.int64),
+        staff=np.array(staff, dtype=np.int64),
+        company=np.array(company, dtype=np.int64),
+        event=np.array(event, dtype=np.int64),
+        action=actions.astype(np.int8),
+        timestamp=timestamps,
+        events_staff_keys=events_staff_keys,
+    )
+
+
+@dataclass
+class Pairs:
+    """Turnos (check-in seguido de check-out) encontrados no histórico"""
+
+    start: np.ndarray  # índices (na ordem ordenada) dos check-ins pareados
+    duration: np.ndarray  # duração em microssegundos
+    unmatched_in: int
+    unmatched_out: int
+
+
+def pair_checks(columns):
+    """
+    Pareia check-in/check-out por EventsStaff de forma vetorizada.
+
+    Após ordenar por (EventsStaff, timestamp), um turno é um check-in
+    imediatamente seguido de um check-out do mesmo EventsStaff. Entradas
+    duplicadas (in, in, out) descartam o primeiro check-in; saídas
+    duplicadas (in, out, out) descartam o último check-out. Os descartes
+    são contados como não pareados.
+
+    Retorna a ordenação aplicada e os pares encontrados.
+    """
+    order = np.lexsort((columns.timestamp, columns.events_staff))
+    if len(order) < 2:
+        unmatched = columns.action[order]
+        return order, Pairs(
+            start=np.array([], dtype=np.int64),
+            duration=np.array([], dtype=np.int64),
+            unmatched_in=int(np.count_nonzero(unmatched == ACTION_IN)),
+            unmatched_out=int(np.count_nonzero(unmatched == ACTION_OUT)),
+        )
+
+    staff = columns.events_staff[order]
+    action = columns.action[order]
+    ts = columns.timestamp[order]
+
+    is_pair = (
+        (action[:-1] == ACTION_IN)
+        & (action[1:] == ACTION_OUT)
+        & (staff[:-1] == staff[1:])
+    )
+    start = np.flatnonzero(is_pair)
+    duration = (ts[start + 1] - ts[start]).astype(np.int64)
+
+    paired = np.zeros(len(order), dtype=bool)
+    paired[start] = True
+    paired[start + 1] = True
+
+    return order, Pairs(
+        start=start,
+        duration=duration,
+        unmatched_in=int(np.count_nonzero(~paired & (action == ACTION_IN))),
+        unmatched_out=int(np.count_nonzero(~paired & (action == ACTION_OUT))),
+    )
+
+
+def _sum_by(keys, weights):
+    """Soma `weights` agrupando por `keys` (equivalente a um GROUP BY)"""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(inverse, weights=weights, minlength=len(unique))
+    counts = np.bincount(inverse, minlength=len(unique))
+    return unique, totals, counts
+
+
+def local_days(timestamps):
+    """Converte datetime64 UTC para a data local (fuso do Django)"""
+    if not len(timestamps):
+        return timestamps.astype("datetime64[D]")
+    tz = timezone.get_current_timezone()
+    # O offset só muda entre horas: calcula uma vez por hora distinta
+    hours, inverse = np.unique(timestamps.astype("datetime64[h]"), return_inverse=True)
+    offsets = np.array(
+        [
+            hour.astype(object).replace(tzinfo=UTC).astimezone(tz).utcoffset()
+            for hour in hours
+        ],
+        dtype="timedelta64[us]",
+    )
+    return (timestamps + offsets[inverse]).astype("datetime64[D]")
+
+
+def _hours(microseconds):
+    return round(float(microseconds) / MICROSECONDS_PER_HOUR, 2)
+
+
+def summarize(columns):
+    """Agrega os turnos pareados por staff, empresa e dia (IDs apenas)"""
+    order, pairs = pair_checks(columns)
+    start = order[pairs.start]
+    duration = pairs.duration
+
+    staff_ids, staff_hours, staff_shifts = _sum_by(columns.staff[start], duration)
+    company_ids, company_hours, company_shifts = _sum_by(
+        columns.company[start], duration
+    )
+    days, day_hours, day_shifts = _sum_by(
+        local_days(columns.timestamp[start]), duration
+    )
+
+    # Empresa de cada staff (um staff pertence a uma única empresa)
+    staff_company = dict(
+        zip(columns.staff[start].tolist(), columns.company[start].tolist())
+    )
+
+    report = AttendanceReport(
+        total_hours=_hours(duration.sum()),
+        shifts=len(duration),
+        unmatched_check_ins=pairs.unmatched_in,
+        unmatched_check_outs=pairs.unmatched_out,
+    )
+    report.staff = [
+        {
+            "id": staff_id,
+            "company": staff_company[staff_id],
+            "hours": _hours(hours),
+            "shifts": int(shifts),
+        }
+        for staff_id, hours, shifts in zip(
+            staff_ids.tolist(), staff_hours, staff_shifts
+        )
+    ]
+    report.companies = [
+        {"id": company_id, "hours": _hours(hours), "shifts": int(shifts)}
+        for company_id, hours, shifts in zip(
+            company_ids.tolist(), company_hours, company_shifts
+        )
+    ]
+    report.days = [
+        {"date": day.isoformat(), "hours": _hours(hours), "shifts": int(shifts)}
+        for day, hours, shifts in zip(days.tolist(), day_hours, day_shifts)
+    ]
+    return report
+
+
+def hours_by_events_staff(columns):
+    """Horas trabalhadas por EventsStaff ({id do EventsStaff: horas})"""
+    order, pairs = pair_checks(columns)
+    codes, hours, _ = _sum_by(columns.events_staff[order[pairs.start]], pairs.duration)
+    return {
+        str(columns.events_staff_keys[code]): _hours(total)
+        for code, total in zip(codes.tolist(), hours)
+    }
+
+
+def build_attendance_report(event_ids, company=None):
+    """
+    Relatório de horas por staff, empresa e dia para os eventos informados.
+
+    Se `company` for informado, considera apenas os staffs dessa empresa.
+    """
+    filters = {}
+    if company is not None:
+        # Filtrado no banco: não carrega os checks das outras empresas
+        filters["events_staff__staff__company"] = company
+    columns = load_check_columns(event_ids, **filters)
+
+    report = summarize(columns)
+
+    # Enriquecimento com nomes: duas queries, independente do volume
+    staff_names = dict(
+        Staff.objects.filter(id__in=[row["id"] for row in report.staff]).values_list(
+            "id", "name"
+        )
+    )
+    company_names = dict(
+        Company.objects.filter(
+            id__in=[row["id"] for row in report.companies]
+        ).values_list("id", "name")
+    )
+    for row in report.staff:
+        row["name"] = staff_names.get(row["id"])
+    for row in report.companies:
+        row["name"] = company_names.get(row["id"])
+    return report
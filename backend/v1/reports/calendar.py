@@ -0,0 +1,122 @@
+"""
+Calendário de eventos e detecção de staff escalado em eventos simultâneos.
+
+Um evento aparece no intervalo [início, fim) quando se sobrepõe a ele
+(date_begin < fim e date_end > início), consulta atendida pelo índice
+(date_begin, date_end) de Event. Os conflitos vêm de um único self-join
+em events_staff pelo CPF (índice (staff_cpf, event)), limitado aos
+eventos do intervalo.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db import connections, router
+from django.utils import timezone
+
+from ..models import Event, EventsStaff, Staff
+
+# Intervalo máximo de uma consulta (dias)
+MAX_RANGE_DAYS = 366
+
+MAX_CONFLICTS = 1000
+
+
+def _local_bounds(day_from, day_to):
+    """Início de `day_from` e fim de `day_to` (inclusive) no fuso atual"""
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(day_from, time.min), tz)
+    end = timezone.make_aware(
+        datetime.combine(day_to + timedelta(days=1), time.min), tz
+    )
+    return start, end
+
+
+def _days(begin, end, day_from, day_to):
+    """Dias locais cobertos por [begin, end), recortados ao intervalo"""
+    first = max(timezone.localdate(begin), day_from)
+    # date_end exclusivo: um evento que termina à meia-noite não ocupa o dia
+    last = min(timezone.localdate(end - timedelta(microseconds=1)), day_to)
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def double_bookings(event_ids, company=None, limit=MAX_CONFLICTS):
+    """
+    Pares de eventos sobrepostos em que o mesmo CPF está escalado.
+
+    Retorna [(cpf, evento_a, evento_b)] com evento_a < evento_b.
+    `company` restringe aos staffs da empresa.
+    """
+    if not event_ids:
+        return []
+
+    es = EventsStaff._meta.db_table
+    ev = Event._meta.db_table
+    placeholders = ", ".join(["%s"] * len(event_ids))
+    company_join = company_where = ""
+    params = [*event_ids, *event_ids]
+    if company is not None:
+        company_join = f"JOIN {Staff._meta.db_table} s ON s.id = a.staff_id"
+        company_where = "AND s.company_id = %s"
+        params.append(company.pk)
+    params.append(limit)
+
+    sql = f"""
+        SELECT a.staff_cpf, a.event_id, b.event_id
+        FROM {es} a
+        JOIN {es} b ON b.staff_cpf = a.staff_cpf AND b.event_id > a.event_id
+        JOIN {ev} ea ON ea.id = a.event_id
+        JOIN {ev} eb ON eb.id = b.event_id
+        {company_join}
+        WHERE a.event_id IN ({placeholders})
+          AND b.event_id IN ({placeholders})
+          AND ea.date_begin < eb.date_end
+          AND eb.date_begin < ea.date_end
+          {company_where}
+        ORDER BY a.staff_cpf, a.event_id, b.event_id
+        LIMIT %s
+    """
+    # Mesmo banco das leituras do ORM (réplica, se a requisição pediu)
+    with connections[router.db_for_read(EventsStaff)].cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def event_calendar(events, day_from, day_to, company=None):
+    """
+    Eventos de `events` (queryset) sobrepostos a [day_from, day_to],
+    agrupados por dia, e os conflitos de escala entre eles.
+    """
+    start, end = _local_bounds(day_from, day_to)
+    rows = list(
+        events.filter(date_begin__lt=end, date_end__gt=start)
+        .order_by("date_begin", "id")
+        .values("id", "name", "status", "project_id", "date_begin", "date_end")
+    )
+
+    days = {}
+    for row in rows:
+        for day in _days(row["date_begin"], row["date_end"], day_from, day_to):
+            days.setdefault(day.isoformat(), []).append(row["id"])
+
+    conflicts = double_bookings([row["id"] for row in rows], company=company)
+    return {
+        "from": day_from,
+        "to": day_to,
+        "events": [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "status": row["status"],
+                "project": row["project_id"],
+                "begin": row["date_begin"],
+                "end": row["date_end"],
+            }
+            for row in rows
+        ],
+        "days": days,
+        "conflicts": [
+            {"cpf": cpf, "events": [event_a, event_b]}
+            for cpf, event_a, event_b in conflicts
+        ],
+        "conflicts_truncated": len(conflicts) >= MAX_CONFLICTS,
+    }
@@ -0,0 +1,231 @@
+"""
+Snapshots diários por projeto/evento/empresa.
+
+`refresh_snapshots` é incremental: a partir da marca d'água (created_at
+do último Check visto, menos uma margem) descobre quais eventos receberam
+checks novos e recalcula apenas esses eventos. Os endpoints de analytics
+de projeto leem somente a tabela de snapshots, sem tocar em Check.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from ..models import (
+    ArchivedCheck,
+    Check,
+    CheckAction,
+    DailySnapshot,
+    Event,
+    SnapshotCursor,
+)
+from .sources import check_sources
+from .attendance import (
+    ACTION_IN,
+    ACTION_OUT,
+    MICROSECONDS_PER_HOUR,
+    load_check_columns,
+    local_days,
+    pair_checks,
+)
+
+CURSOR_NAME = "daily_snapshots"
+
+# Checks gravados até esta margem antes da marca d'água são revistos a cada
+# execução (transações que terminam fora de ordem)
+RESCAN_MARGIN = timedelta(minutes=10)
+
+# Eventos recalculados por vez (limita memória e duração das transações)
+EVENTS_PER_CHUNK = 20
+
+
+def _check_counts(event_ids):
+    """Contagem de checks por (evento, empresa, dia), agrupada no banco"""
+    counts = {}
+    for checks, event_field in check_sources(event_ids):
+        rows = (
+            checks.annotate(
+                day=TruncDate("timestamp", tzinfo=timezone.get_current_timezone())
+            )
+            .values(event_field, "events_staff__staff__company_id", "day")
+            .annotate(
+                registered=Count("id", filter=Q(action=CheckAction.REGISTRATION)),
+                check_ins=Count("id", filter=Q(action=CheckAction.CHECK_IN)),
+                check_outs=Count("id", filter=Q(action=CheckAction.CHECK_OUT)),
+            )
+        )
+        # Um evento está inteiro no arquivo ou inteiro nas tabelas vivas
+        for row in rows:
+            key = (row[event_field], row["events_staff__staff__company_id"], row["day"])
+            counts[key] = row
+    return counts
+
+
+def _hours_and_peaks(event_ids):
+    """
+    Horas trabalhadas e pico de pessoas no local por (evento, empresa, dia).
+
+    O pico é calculado com uma soma acumulada de +1 (entrada) / -1 (saída)
+    por (evento, empresa); quem entrou e ainda não saiu conta como presente.
+    """
+    columns = load_check_columns(event_ids)
+    result = {}
+    if not len(columns):
+        return result
+
+    order, pairs = pair_checks(columns)
+    start = order[pairs.start]
+    end = order[pairs.start + 1]
+
+    # Horas: atribuídas ao dia do check-in
+    days = local_days(columns.timestamp[start])
+    for event_id, company_id, day, duration in zip(
+        columns.event[start].tolist(),
+        columns.company[start].tolist(),
+        days.tolist(),
+        pairs.duration.tolist(),
+    ):
+        key = (event_id, company_id, day)
+        hours, peak = result.get(key, (0.0, 0))
+        result[key] = (hours + duration / MICROSECONDS_PER_HOUR, peak)
+
+    # Check-ins em aberto: último registro do EventsStaff é uma entrada
+    sorted_staff = columns.events_staff[order]
+    is_last = np.append(sorted_staff[1:] != sorted_staff[:-1], True)
+    open_in = order[is_last & (columns.action[order] == ACTION_IN)]
+
+    points = np.concatenate([start, open_in, end])
+    delta = np.concatenate(
+        [
+            np.full(len(start) + len(open_in), ACTION_IN),
+            np.full(len(end), ACTION_OUT),
+        ]
+    )
+    event = columns.event[points]
+    company = columns.company[points]
+    ts = columns.timestamp[points]
+
+    # Ordena por (evento, empresa, instante); saídas antes de entradas no empate
+    sort = np.lexsort((delta, ts, company, event))
+    event, company, ts, delta = event[sort], company[sort], ts[sort], delta[sort]
+
+    group_start = np.flatnonzero(
+        np.append(True, (event[1:] != event[:-1]) | (company[1:] != company[:-1]))
+    )
+    running = np.cumsum(delta)
+    # Remove o acumulado dos grupos anteriores (cumsum segmentado)
+    offsets = np.repeat(
+        running[group_start] - delta[group_start],
+        np.diff(np.append(group_start, len(delta))),
+    )
+    on_site = running - offsets
+
+    days = local_days(ts)
+    cell_start = np.flatnonzero(
+        np.append(
+            True,
+            (event[1:] != event[:-1])
+            | (company[1:] != company[:-1])
+            | (days[1:] != days[:-1]),
+        )
+    )
+    # Quem já estava no local na virada do dia também conta no pico
+    peaks = np.maximum(
+        np.maximum.reduceat(on_site, cell_start), (on_site - delta)[cell_start]
+    )
+    for event_id, company_id, day, peak in zip(
+        event[cell_start].tolist(),
+        company[cell_start].tolist(),
+        days[cell_start].tolist(),
+        peaks.tolist(),
+    ):
+        key = (event_id, company_id, day)
+        hours, _ = result.get(key, (0.0, 0))
+        result[key] = (hours, max(peak, 0))
+    return result
+
+
+def rebuild_events(event_ids):
+    """Recalcula (substitui) os snapshots dos eventos informados"""
+    event_ids = list(event_ids)
+    projects = dict(
+        Event.objects.filter(id__in=event_ids).values_list("id", "project_id")
+    )
+    counts = _check_counts(event_ids)
+    hours_and_peaks = _hours_and_peaks(event_ids)
+
+    snapshots = []
+    for key in counts.keys() | hours_and_peaks.keys():
+        event_id, company_id, day = key
+        row = counts.get(key, {})
+        hours, peak = hours_and_peaks.get(key, (0.0, 0))
+        snapshots.append(
+            DailySnapshot(
+                project_id=projects.get(event_id),
+                event_id=event_id,
+                company_id=company_id,
+                day=day,
+                registered=row.get("registered", 0),
+                check_ins=row.get("check_ins", 0),
+                check_outs=row.get("check_outs", 0),
+                peak_on_site=peak,
+                hours=round(hours, 2),
+            )
+        )
+
+    with transaction.atomic():
+        DailySnapshot.objects.filter(event_id__in=event_ids).delete()
+        DailySnapshot.objects.bulk_create(snapshots, batch_size=1000)
+    return len(snapshots)
+
+
+def refresh_snapshots(event_ids=None, full=False):
+    """
+    Atualiza os snapshots.
+
+    - `event_ids`: recalcula apenas esses eventos (sob demanda);
+    - `full`: recalcula todos os eventos com checks;
+    - padrão: incremental, a partir da marca d'água (ver RESCAN_MARGIN).
+
+    Retorna (eventos recalculados, linhas gravadas).
+    """
+    cursor, _ = SnapshotCursor.objects.get_or_create(name=CURSOR_NAME)
+    # Relógio do banco (created_at vem do db_default), não o do servidor
+    watermark = Check.objects.aggregate(last=Max("created_at"))["last"]
+
+    incremental = event_ids is None
+    if incremental:
+        checks = Check.objects.all()
+        if not full and cursor.last_created_at is not None:
+            # IDs e created_at não seguem a ordem de commit: um check de uma
+            # transação mais lenta pode aparecer depois da execução anterior
+            # com valores abaixo da marca. Revarre a margem a cada execução.
+            checks = checks.filter(
+                created_at__gt=cursor.last_created_at - RESCAN_MARGIN
+            )
+        event_ids = set(
+            checks.values_list("events_staff__event_id", flat=True).distinct()
+        )
+        if full:
+            event_ids.update(
+                ArchivedCheck.objects.values_list("event_id", flat=True).distinct()
+            )
+    event_ids = sorted(set(event_ids))
+
+    written = 0
+    for i in range(0, len(event_ids), EVENTS_PER_CHUNK):
+        written += rebuild_events(event_ids[i : i + EVENTS_PER_CHUNK])
+
+    # Recalcular eventos específicos não avança o cursor incremental
+    if incremental and watermark is not None:
+        # Arquivar os checks mais recentes pode baixar o MAX(created_at) vivo
+        if cursor.last_created_at is not None:
+            watermark = max(watermark, cursor.last_created_at)
+        SnapshotCursor.objects.filter(name=CURSOR_NAME).update(
+            last_created_at=watermark, updated_at=timezone.now()
+        )
+    return len(event_ids), written
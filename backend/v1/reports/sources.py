@@ -0,0 +1,31 @@
+"""
+Checks vivos e arquivados vistos como uma única fonte.
+
+Eventos arquivados têm seus checks em `ArchivedCheck`, que mantém os
+mesmos caminhos de lookup de `Check` (events_staff__staff_id,
+events_staff__staff_cpf, ...). A única diferença é o evento, que no
+arquivo é uma coluna própria (sem join).
+"""
+
+from ..models import ArchivedCheck, Check
+
+LIVE_EVENT_FIELD = "events_staff__event_id"
+ARCHIVED_EVENT_FIELD = "event_id"
+
+
+def check_sources(event_ids=None, **filters):
+    """
+    Lista de (queryset, campo do evento) para Check e ArchivedCheck.
+
+    `filters` são lookups aplicados às duas tabelas.
+    """
+    sources = [
+        (Check.objects.filter(**filters), LIVE_EVENT_FIELD),
+        (ArchivedCheck.objects.filter(**filters), ARCHIVED_EVENT_FIELD),
+    ]
+    if event_ids is None:
+        return sources
+    return [
+        (checks.filter(**{f"{event_field}__in": event_ids}), event_field)
+        for checks, event_field in sources
+    ]
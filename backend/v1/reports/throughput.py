@@ -0,0 +1,105 @@
+"""
+Histograma de vazão de checks por intervalo de tempo, ação e operador.
+
+O truncamento e o agrupamento acontecem no banco (hora truncada + fatia
+de minutos); o Python apenas monta o instante inicial de cada bucket.
+Eventos encerrados quase não mudam, então o resultado deles fica em cache.
+A chave leva só dados do próprio evento: contagem e maior id dos checks
+(vivos e arquivados) e uma versão do evento trocada quando um check dele é
+editado no admin. Checks de outros eventos não invalidam nada.
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, Max, Value
+from django.db.models.functions import ExtractMinute, Floor, TruncHour
+from django.utils import timezone
+
+from ..cache import bump_on_commit, namespace_versions
+from ..models import Status
+from .sources import check_sources
+
+INTERVALS = (1, 5, 15)
+
+CLOSED_EVENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _version_namespace(event_id):
+    return f"histogram:{event_id}"
+
+
+def invalidate_histogram(event_id):
+    """Descarta os histogramas em cache do evento (após o commit)"""
+    bump_on_commit(_version_namespace(event_id))
+
+
+def _fingerprint(event_id):
+    """Contagem e maior id dos checks do evento, por fonte"""
+    parts = []
+    for checks, _ in check_sources([event_id]):
+        totals = checks.aggregate(count=Count("id"), last=Max("id"))
+        parts.append(f"{totals['count']}-{totals['last']}")
+    return ":".join(parts)
+
+
+def _histogram_rows(event_id, interval, action):
+    tz = timezone.get_current_timezone()
+    filters = {"action": action} if action else {}
+
+    counts = Counter()
+    # Evento arquivado: os checks vêm de ArchivedCheck
+    for checks, _ in check_sources([event_id], **filters):
+        rows = (
+            checks.annotate(
+                hour=TruncHour("timestamp", tzinfo=tz),
+                slot=Floor(
+                    ExtractMinute("timestamp", tzinfo=tz) / Value(interval),
+                    output_field=IntegerField(),
+                ),
+            )
+            .values("hour", "slot", "action", "user_control_id")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        for row in rows:
+            key = (row["hour"], row["slot"], row["action"], row["user_control_id"])
+            counts[key] += row["count"]
+
+    return [
+        {
+            "start": (hour + timedelta(minutes=int(slot) * interval)).isoformat(),
+            "action": check_action,
+            "user_control": user_control,
+            "count": count,
+        }
+        for (hour, slot, check_action, user_control), count in sorted(
+            counts.items(), key=lambda item: (item[0][:3], item[0][3] or 0)
+        )
+    ]
+
+
+def check_histogram(event, interval=5, action=None):
+    """
+    Contagem de checks do evento em buckets de `interval` minutos.
+
+    Cada bucket é separado por ação e operador (Check.user_control).
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"interval deve ser um de {INTERVALS}")
+
+    if event.status != Status.CLOSE:
+        return _histogram_rows(event.id, interval, action)
+
+    # Checks novos, removidos ou editados no evento trocam a chave
+    (version,) = namespace_versions([_version_namespace(event.id)])
+    key = (
+        f"v1:histogram:{event.id}:{interval}:{action or 'all'}:"
+        f"{version}:{_fingerprint(event.id)}"
+    )
+    rows = cache.get(key)
+    if rows is None:
+        rows = _histogram_rows(event.id, interval, action)
+        cache.set(key, rows, CLOSED_EVENT_CACHE_TIMEOUT)
+    return rows
@@ -1,7 +1,12 @@
-from .check_serializer import CheckSerializer
+from .check_serializer import CheckIngestSerializer, CheckSerializer
+from .clone_serializer import CloneSerializer, EventCloneSerializer
 from .company_serializer import CompanySerializer
 from .event_serializer import EventSerializer, EventsStaffControlSerializer
-from .invite_serializer import InviteSerializer
+from .invite_serializer import InviteBulkSerializer, InviteSerializer
+from .participation_serializer import (
+    EventsCompanySerializer,
+    ParticipationBulkSerializer,
+)
 from .project_serializer import ProjectSerializer
 from .staff_serializer import StaffSerializer
 from .user_serializer import UserSerializer
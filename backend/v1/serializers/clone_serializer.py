@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from ..models import Project
+
+
+class CloneSerializer(serializers.Serializer):
+    """Entrada do POST /projects/:id/clone e /events/:id/clone"""
+
+    name = serializers.CharField(max_length=255, required=False)
+    # Ex.: 364 mantém o dia da semana de um festival anual
+    shift_days = serializers.IntegerField(
+        required=False, default=0, min_value=-3650, max_value=3650
+    )
+    include_staff = serializers.BooleanField(required=False, default=False)
+
+
+class EventCloneSerializer(CloneSerializer):
+    project = serializers.PrimaryKeyRelatedField(
+        queryset=Project.objects.all(), required=False
+    )
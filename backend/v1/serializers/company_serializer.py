@@ -2,6 +2,7 @@ from django.db import transaction
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 
+from ..documents import is_valid_cnpj
 from ..models import Company
 from ..utils import sanitize_digits
 
@@ -11,3 +12,8 @@ class CompanySerializer(serializers.ModelSerializer):
         model = Company
         fields = ["id", "name", "cnpj", "created_at", "created_by"]
         read_only_fields = ["created_at", "created_by"]
+
+    def validate_cnpj(self, value):
+        if not is_valid_cnpj(value):
+            raise serializers.ValidationError("CNPJ inválido.")
+        return sanitize_digits(value)
@@ -1,7 +1,9 @@
-from django.conf import settings
 from rest_framework import serializers
 
-from ..models import UserInvite
+from ..models import Company, UserInvite, UserRole
+from ..utils import build_invite_url
+
+MAX_BULK_INVITES = 1000
 
 
 class InviteSerializer(serializers.ModelSerializer):
@@ -23,4 +25,30 @@ class InviteSerializer(serializers.ModelSerializer):
 
     def get_invite_url(self, obj):
         # Exemplo de URL de frontend
-        return f"{settings.FRONTEND_URL}/signup?invite={obj.id}"
+        return build_invite_url(obj.id)
+
+
+class InviteBulkSerializer(serializers.Serializer):
+    """Entrada do POST /invites/bulk: lista de e-mails e/ou quantidade"""
+
+    company = serializers.PrimaryKeyRelatedField(queryset=Company.objects.all())
+    role = serializers.ChoiceField(choices=UserRole.choices)
+    emails = serializers.ListField(
+        child=serializers.EmailField(),
+        required=False,
+        default=list,
+        max_length=MAX_BULK_INVITES,
+    )
+    count = serializers.IntegerField(
+        required=False, default=0, min_value=0, max_value=MAX_BULK_INVITES
+    )
+
+    def validate(self, attrs):
+        total = len(attrs["emails"]) + attrs["count"]
+        if total == 0:
+            raise serializers.ValidationError("Informe emails ou count.")
+        if total > MAX_BULK_INVITES:
+            raise serializers.ValidationError(
+                f"Máximo de {MAX_BULK_INVITES} convites por requisição."
+            )
+        return attrs
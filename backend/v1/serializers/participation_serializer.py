@@ -0,0 +1,47 @@
+from rest_framework import serializers
+
+from ..models import Company, CompanyRole, Event, EventsCompany
+from ..services.participations import MAX_MATRIX_CELLS
+
+
+class EventsCompanySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = EventsCompany
+        fields = ["id", "event", "company", "role", "staff_limit"]
+
+
+def _existing_ids(model, ids, label):
+    """Valida que todos os ids existem com uma única query"""
+    ids = list(dict.fromkeys(ids))
+    found = set(model.objects.filter(id__in=ids).values_list("id", flat=True))
+    missing = [pk for pk in ids if pk not in found]
+    if missing:
+        raise serializers.ValidationError(f"{label} não encontrados: {missing}")
+    return ids
+
+
+class ParticipationBulkSerializer(serializers.Serializer):
+    """Entrada do POST /participations/bulk: matriz eventos x empresas"""
+
+    events = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+    companies = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+    role = serializers.ChoiceField(choices=CompanyRole.choices)
+    staff_limit = serializers.IntegerField(min_value=1, max_value=32767)
+
+    def validate_events(self, value):
+        return _existing_ids(Event, value, "Eventos")
+
+    def validate_companies(self, value):
+        return _existing_ids(Company, value, "Empresas")
+
+    def validate(self, attrs):
+        if len(attrs["events"]) * len(attrs["companies"]) > MAX_MATRIX_CELLS:
+            raise serializers.ValidationError(
+                f"Máximo de {MAX_MATRIX_CELLS} células (eventos x empresas) "
+                "por requisição."
+            )
+        return attrs
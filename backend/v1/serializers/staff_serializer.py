@@ -2,6 +2,7 @@ from django.db import transaction
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 
+from ..documents import is_valid_cpf
 from ..models import (
     Check,
     Company,
@@ -21,11 +22,13 @@ class StaffSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Staff
-        fields = "__all__"
-        read_only_fields = ["created_by", "created_at"]
+        exclude = ["name_search"]
+        read_only_fields = ["created_by", "created_at", "person"]
         # Removemos o UniqueTogetherValidator daqui, pois ele ignora campos read_only
 
     def validate_cpf(self, value):
+        if not is_valid_cpf(value):
+            raise serializers.ValidationError("CPF inválido.")
         return sanitize_digits(value)
 
     def validate(self, attrs):
@@ -0,0 +1,25 @@
+from .archive import ArchiveError, archive_event, restore_event
+from .checks import (
+    CheckRejected,
+    last_movement_subquery,
+    record_check,
+    validate_transition,
+)
+from .cloning import clone_event, clone_project
+from .google_auth import InvalidGoogleToken, verify_google_token
+from .ingest import CheckIngestor, ingest_check
+from .invites import (
+    InviteEmailMismatch,
+    InviteError,
+    InviteNotFound,
+    InviteUnavailable,
+    UserAlreadyExists,
+    create_invites,
+    register_with_invite,
+)
+from .mail import drain_outbox, queue_invite_emails
+from .participations import assign_companies, participation_matrix
+from .people import duplicate_groups, link_people
+from .quota import link_staffs_to_event
+from .scheduling import advance_statuses
+from .staff_search import search_staffs
@@ -0,0 +1,146 @@
+"""
+Arquivamento de eventos encerrados.
+
+Os EventsStaff e Checks de um evento com status CLOSE são copiados para
+`archived_events_staff` / `archived_checks` (mesmos ids) e removidos das
+tabelas vivas, que passam a conter apenas eventos abertos e pendentes.
+`restore_event` faz o caminho inverso. Cada evento é movido em uma única
+transação, em lotes, sem carregar o evento inteiro em memória.
+
+Os relatórios leem as duas tabelas (ver `reports.sources`), então o
+arquivamento é transparente para eles.
+"""
+
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from ..models import (
+    ArchivedCheck,
+    ArchivedEventsStaff,
+    Check,
+    Event,
+    EventsStaff,
+    Status,
+)
+
+BATCH_SIZE = 1000
+
+_STAFF_FIELDS = (
+    "id",
+    "staff_id",
+    "staff_cpf",
+    "registration_check_id",
+    "created_at",
+    "created_by_id",
+)
+_CHECK_FIELDS = ("id", "events_staff_id", "action", "timestamp", "user_control_id")
+
+
+class ArchiveError(Exception):
+    """Evento em estado que não permite arquivar/restaurar"""
+
+
+def _batches(queryset, batch_size):
+    rows = queryset.iterator(chunk_size=batch_size)
+    while batch := list(islice(rows, batch_size)):
+        yield batch
+
+
+def _copy(source, target_model, batch_size, **extra):
+    """Copia as linhas (dicts de values()) de `source` para `target_model`"""
+    copied = 0
+    for batch in _batches(source, batch_size):
+        target_model.objects.bulk_create(
+            [target_model(**row, **extra) for row in batch], batch_size=batch_size
+        )
+        copied += len(batch)
+    return copied
+
+
+def _delete_in_batches(queryset, batch_size):
+    ids = queryset.values_list("id", flat=True)
+    for batch in _batches(ids, batch_size):
+        queryset.model.objects.filter(id__in=batch).delete()
+
+
+def archive_event(event, batch_size=BATCH_SIZE):
+    """
+    Move staffs e checks de um evento encerrado para o arquivo.
+
+    Retorna (staffs, checks) arquivados.
+    """
+    with transaction.atomic():
+        event = Event.objects.select_for_update().get(pk=event.pk)
+        if event.status != Status.CLOSE:
+            raise ArchiveError("Apenas eventos encerrados podem ser arquivados.")
+        if event.archived_at is not None:
+            raise ArchiveError("Evento já arquivado.")
+
+        links = EventsStaff.objects.filter(event=event)
+        checks = Check.objects.filter(events_staff__event=event)
+
+        staffs = _copy(
+            links.values(*_STAFF_FIELDS).order_by(),
+            ArchivedEventsStaff,
+            batch_size,
+            event_id=event.pk,
+        )
+        archived_checks = _copy(
+            checks.values(*_CHECK_FIELDS).order_by(),
+            ArchivedCheck,
+            batch_size,
+            event_id=event.pk,
+        )
+
+        # Quebra o ciclo EventsStaff <-> Check antes de remover
+        links.update(registration_check=None)
+        _delete_in_batches(checks, batch_size)
+        _delete_in_batches(links, batch_size)
+
+        event.archived_at = timezone.now()
+        event.save(update_fields=["archived_at"])
+    return staffs, archived_checks
+
+
+def restore_event(event, batch_size=BATCH_SIZE):
+    """
+    Devolve staffs e checks de um evento arquivado às tabelas vivas.
+
+    Retorna (staffs, checks) restaurados.
+    """
+    with transaction.atomic():
+        event = Event.objects.select_for_update().get(pk=event.pk)
+        if event.archived_at is None:
+            raise ArchiveError("Evento não está arquivado.")
+
+        archived_links = ArchivedEventsStaff.objects.filter(event=event)
+        archived_checks = ArchivedCheck.objects.filter(event=event)
+
+        # O credenciamento é religado depois que os checks existirem
+        fields = [f for f in _STAFF_FIELDS if f != "registration_check_id"]
+        staffs = _copy(
+            archived_links.values(*fields).order_by(),
+            EventsStaff,
+            batch_size,
+            event_id=event.pk,
+        )
+        checks = _copy(
+            archived_checks.values(*_CHECK_FIELDS).order_by(), Check, batch_size
+        )
+        EventsStaff.objects.filter(event=event).update(
+            registration_check_id=Subquery(
+                ArchivedEventsStaff.objects.filter(id=OuterRef("id")).values(
+                    "registration_check_id"
+                )
+            )
+        )
+
+        _delete_in_batches(archived_checks, batch_size)
+        _delete_in_batches(archived_links, batch_size)
+
+        event.archived_at = None
+        event.save(update_fields=["archived_at"])
+    return staffs, checks
@@ -0,0 +1,83 @@
+"""
+Máquina de estados de credenciamento e check-in/out.
+
+Regras:
+- registration: apenas uma vez por EventsStaff;
+- check-in/check-out: apenas para staff credenciado, alternando
+  (check-in -> check-out -> check-in ...).
+
+A concorrência é tratada sem locks globais: o credenciamento é gravado
+com um UPDATE condicional (`registration_check IS NULL`), e check-in/out
+bloqueiam apenas a linha do EventsStaff envolvido.
+"""
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from ..models import Check, CheckAction, EventsStaff
+
+
+class CheckRejected(Exception):
+    """Transição de estado inválida para o EventsStaff"""
+
+
+def validate_transition(registered, last_action, action):
+    """Valida `action` dado o estado atual; levanta CheckRejected se inválida"""
+    if action == CheckAction.REGISTRATION:
+        if registered:
+            raise CheckRejected("Staff já credenciado para este evento.")
+        return
+
+    if not registered:
+        raise CheckRejected("Staff não credenciado (Registration Required).")
+    if action == CheckAction.CHECK_IN and last_action == CheckAction.CHECK_IN:
+        raise CheckRejected("Staff já possui check-in em aberto.")
+    if action == CheckAction.CHECK_OUT and last_action != CheckAction.CHECK_IN:
+        raise CheckRejected("Staff não possui check-in em aberto.")
+
+
+def _movements(events_staff):
+    return Check.objects.filter(
+        events_staff=events_staff,
+        action__in=[CheckAction.CHECK_IN, CheckAction.CHECK_OUT],
+    ).order_by("-id")
+
+
+def last_movement(events_staff_id):
+    """Última ação de check-in/out do EventsStaff (ou None)"""
+    return _movements(events_staff_id).values_list("action", flat=True).first()
+
+
+def last_movement_subquery():
+    """Subquery de `last_movement` para anotar querysets de EventsStaff"""
+    return Subquery(_movements(OuterRef("pk")).values("action")[:1])
+
+
+def record_check(events_staff, action, user_control=None):
+    """Registra um Check aplicando a máquina de estados de forma atômica"""
+    with transaction.atomic():
+        if action == CheckAction.REGISTRATION:
+            check = Check.objects.create(
+                action=action, events_staff=events_staff, user_control=user_control
+            )
+            # Só um credenciamento vence: quem não atualizar a linha desfaz o Check
+            claimed = EventsStaff.objects.filter(
+                pk=events_staff.pk, registration_check__isnull=True
+            ).update(registration_check=check)
+            if not claimed:
+                raise CheckRejected("Staff já credenciado para este evento.")
+            events_staff.registration_check = check
+            return check
+
+        registration_check_id = (
+            EventsStaff.objects.select_for_update()
+            .filter(pk=events_staff.pk)
+            .values_list("registration_check_id", flat=True)
+            .get()
+        )
+        validate_transition(
+            registration_check_id is not None, last_movement(events_staff.pk), action
+        )
+        return Check.objects.create(
+            action=action, events_staff=events_staff, user_control=user_control
+        )
@@ -0,0 +1,114 @@
+"""
+Cópia de projetos e eventos recorrentes (ex.: o mesmo festival todo ano).
+
+Um evento é copiado com as empresas participantes (EventsCompany) e,
+opcionalmente, o quadro de staffs (EventsStaff, sem credenciamento nem
+checks). As linhas filhas são copiadas em lotes com bulk_create a partir
+de values(), sem instanciar os models de origem, e tudo acontece em uma
+única transação. Eventos arquivados copiam o quadro do arquivo.
+"""
+
+from datetime import timedelta
+from itertools import islice
+
+from django.db import transaction
+
+from ..models import Event, EventsCompany, EventsStaff, Project
+
+BATCH_SIZE = 1000
+
+
+def _bulk_copy(model, rows, build):
+    """bulk_create em lotes a partir de um iterador de dicts de values()"""
+    rows = iter(rows)
+    copied = 0
+    while batch := list(islice(rows, BATCH_SIZE)):
+        model.objects.bulk_create([build(row) for row in batch], batch_size=BATCH_SIZE)
+        copied += len(batch)
+    return copied
+
+
+def _copy_event(source, project, shift, include_staff, name, created_by):
+    # Eventos são criados um a um: no MySQL o bulk_create não devolve as PKs
+    event = Event.objects.create(
+        name=name or source.name,
+        description=source.description,
+        location=source.location,
+        date_begin=source.date_begin + shift,
+        date_end=source.date_end + shift,
+        project=project,
+        created_by=created_by,
+    )
+
+    companies = _bulk_copy(
+        EventsCompany,
+        EventsCompany.objects.filter(event=source)
+        .values("company_id", "role", "staff_limit")
+        .iterator(chunk_size=BATCH_SIZE),
+        lambda row: EventsCompany(event=event, **row),
+    )
+
+    staffs = 0
+    if include_staff:
+        roster = (
+            source.archived_staffs
+            if source.archived_at is not None
+            else source.event_staffs
+        )
+        staffs = _bulk_copy(
+            EventsStaff,
+            roster.values("staff_id", "staff_cpf").iterator(chunk_size=BATCH_SIZE),
+            lambda row: EventsStaff(event=event, created_by=created_by, **row),
+        )
+    return event, companies, staffs
+
+
+def clone_event(
+    source,
+    project=None,
+    shift_days=0,
+    include_staff=False,
+    name=None,
+    created_by=None,
+):
+    """
+    Copia um evento (no mesmo projeto, ou em `project`), deslocando as
+    datas em `shift_days`. Retorna (evento, empresas, staffs) copiados.
+    """
+    with transaction.atomic():
+        return _copy_event(
+            source,
+            project or source.project,
+            timedelta(days=shift_days),
+            include_staff,
+            name,
+            created_by,
+        )
+
+
+def clone_project(
+    source, shift_days=0, include_staff=False, name=None, created_by=None
+):
+    """
+    Copia um projeto com todos os seus eventos. Retorna (projeto, eventos,
+    empresas, staffs) copiados.
+    """
+    shift = timedelta(days=shift_days)
+    with transaction.atomic():
+        project = Project.objects.create(
+            name=name or source.name,
+            description=source.description,
+            date_begin=source.date_begin and source.date_begin + shift,
+            date_end=source.date_end and source.date_end + shift,
+            company_id=source.company_id,
+            created_by=created_by,
+        )
+        events = companies = staffs = 0
+        for event in source.events.order_by("date_begin", "id"):
+            _, event_companies, event_staffs = _copy_event(
+                event, project, shift, include_staff, None, created_by
+            )
+            events += 1
+            companies += event_companies
+            staffs += event_staffs
+    return project, events, companies, staffs
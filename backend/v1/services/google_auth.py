@@ -0,0 +1,126 @@
+"""
+Verificação de ID tokens do Google fora do caminho crítico do login.
+
+`id_token.verify_oauth2_token` com um `google_requests.Request()` novo a
+cada login abre uma sessão HTTP nova e busca os certificados do Google
+toda vez. Aqui a sessão é reaproveitada (pool de conexões) e os
+certificados ficam em memória até expirar o Cache-Control/Expires da
+resposta. Se o token vier assinado por uma chave nova (rotação), os
+certificados são recarregados uma vez antes de rejeitar o token.
+"""
+
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from django.conf import settings
+from google.auth import exceptions as google_exceptions
+from google.auth import jwt as google_jwt
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+# Usado quando a resposta não informa validade
+DEFAULT_CERTS_MAX_AGE = 300
+
+CERTS_TIMEOUT = 5
+
+# Intervalo mínimo entre recargas forçadas por `kid` desconhecido, para que
+# tokens forjados não transformem cada login em uma busca de certificados
+FORCED_REFRESH_INTERVAL = 60
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class InvalidGoogleToken(ValueError):
+    """Token inválido, expirado ou emitido para outro client"""
+
+
+def _max_age(headers):
+    """Validade (segundos) dos certificados segundo os headers HTTP"""
+    match = _MAX_AGE.search(headers.get("Cache-Control", ""))
+    if match:
+        return max(int(match.group(1)) - int(headers.get("Age", 0) or 0), 0)
+    if headers.get("Expires") and headers.get("Date"):
+        try:
+            expires = parsedate_to_datetime(headers["Expires"])
+            date = parsedate_to_datetime(headers["Date"])
+            return max((expires - date).total_seconds(), 0)
+        except (TypeError, ValueError):
+            pass
+    return DEFAULT_CERTS_MAX_AGE
+
+
+class GoogleTokenVerifier:
+    def __init__(self, certs_url, session=None, clock=time.monotonic):
+        self.certs_url = certs_url
+        self.session = session or requests.Session()
+        self.clock = clock
+        self.fetches = 0
+        self._certs = None
+        self._expires_at = 0
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def _stale(self, force):
+        if self._certs is None or self.clock() >= self._expires_at:
+            return True
+        return force and self.clock() - self._fetched_at >= FORCED_REFRESH_INTERVAL
+
+    def certs(self, force=False):
+        """Certificados em cache; busca novamente apenas quando expiram"""
+        if self._stale(force):
+            with self._lock:
+                # Outra thread pode ter atualizado enquanto esperávamos o lock
+                if self._stale(force):
+                    self._refresh()
+        return self._certs
+
+    def _refresh(self):
+        response = self.session.get(self.certs_url, timeout=CERTS_TIMEOUT)
+        response.raise_for_status()
+        self._certs = response.json()
+        self._fetched_at = self.clock()
+        self._expires_at = self._fetched_at + _max_age(response.headers)
+        self.fetches += 1
+
+    def verify(self, token, audience):
+        """Valida assinatura, audiência, expiração e emissor; retorna as claims"""
+        try:
+            # Tokens malformados falham aqui, sem tocar na rede
+            key_id = google_jwt.decode_header(token).get("kid")
+            certs = self.certs()
+            if key_id not in certs:
+                # Chave rotacionada: recarrega antes de rejeitar
+                certs = self.certs(force=True)
+            claims = google_jwt.decode(token, certs=certs, audience=audience)
+        except (ValueError, google_exceptions.GoogleAuthError) as exc:
+            raise InvalidGoogleToken(str(exc)) from exc
+        except requests.RequestException as exc:
+            raise InvalidGoogleToken(f"Could not fetch Google certs: {exc}") from exc
+
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise InvalidGoogleToken(f"Wrong issuer: {claims.get('iss')}")
+        return claims
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_verifier():
+    """Verificador compartilhado pelo processo (sessão e cache únicos)"""
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = GoogleTokenVerifier(settings.GOOGLE_CERTS_URL)
+    return _verifier
+
+
+def verify_google_token(token):
+    """Claims do ID token do Google; levanta InvalidGoogleToken (ValueError)"""
+    if not token:
+        raise InvalidGoogleToken("Token is required")
+    return get_verifier().verify(token, settings.GOOGLE_CLIENT_ID)
@@ -0,0 +1,448 @@
+"""
+Ingestão de checks em lote para picos de abertura de portões.
+
+Modo opcional (settings.CHECK_INGEST_MODE = "buffered"); o padrão
+continua sendo `record_check`, um INSERT por transação.
+
+1. Cada check é validado contra um snapshot em memória do estado de
+   credenciamento (registered / último movimento por EventsStaff). O
+   snapshot de um evento é carregado no primeiro check dele e relido do
+   banco (com as pendências locais por cima) depois de SNAPSHOT_TTL;
+   eventos sem checks nesse intervalo saem da memória;
+2. O check aceito recebe um número de sequência, é anexado ao log local
+   (JSON por linha) e confirmado na hora (HTTP 202);
+3. Uma thread grava os checks pendentes em micro-lotes (group commit):
+   fsync do log, bulk_create, vínculo dos credenciamentos com um UPDATE
+   por conjunto e o checkpoint (IngestCheckpoint), tudo na mesma transação;
+4. Ao iniciar, entradas do log com sequência acima do checkpoint (o
+   processo caiu antes de gravá-las) são regravadas antes de aceitar novos
+   checks. Entradas até o checkpoint já estão no banco e são ignoradas.
+
+O log é escrito e descarregado (flush) antes da confirmação, então
+sobrevive à queda do processo; a queda da máquina pode perder até um
+intervalo de flush (o fsync é feito por lote). O log é truncado sempre
+que não há pendências.
+
+Um único processo de ingestão por log (o arquivo é travado com flock).
+Com vários workers, o primeiro a travar o log ingere em lote e os demais
+gravam cada check direto com `record_check`, tentando assumir o log de
+tempos em tempos (LOCK_RETRY). O snapshot só vê esses checks diretos ao
+ser relido: quando ele rejeita uma transição de um EventsStaff sem
+pendências locais, o estado é relido na hora; uma transição que ele
+aceita pode estar errada por até SNAPSHOT_TTL (ex.: um segundo check-in
+logo após um check-in gravado por outro worker). Com um único worker não
+há essa janela.
+
+Linhas que o banco recusa de forma persistente (IntegrityError, ou outro
+DatabaseError por MAX_ATTEMPTS lotes seguidos com o banco respondendo)
+vão para o dead-letter (`<log>.dead`, JSON por linha com o erro) e o
+checkpoint avança, para não travar a fila.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from ..models import Check, CheckAction, EventsStaff, IngestCheckpoint
+from .checks import (
+    CheckRejected,
+    last_movement_subquery,
+    record_check,
+    validate_transition,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.05  # segundos
+MAX_ATTEMPTS = 3  # falhas seguidas do mesmo lote antes de isolar as linhas
+LOCK_RETRY = 5.0  # segundos entre tentativas de assumir um log travado
+SNAPSHOT_TTL = 10.0  # segundos até reler o snapshot de um evento
+
+
+class IngestLogBusy(RuntimeError):
+    """O log de ingestão está travado por outro processo"""
+
+
+def _apply(state, action):
+    if action == CheckAction.REGISTRATION:
+        state[0] = True
+    else:
+        state[1] = action
+
+
+class CheckIngestor:
+    """Log local + snapshot em memória + gravação em micro-lotes"""
+
+    def __init__(
+        self,
+        log_path,
+        batch_size=BATCH_SIZE,
+        flush_interval=FLUSH_INTERVAL,
+        snapshot_ttl=SNAPSHOT_TTL,
+    ):
+        self.log_path = Path(log_path)
+        self.dead_letter_path = self.log_path.with_name(self.log_path.name + ".dead")
+        self.name = str(self.log_path.resolve())[-100:]
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.snapshot_ttl = snapshot_ttl
+
+        self._lock = threading.Lock()  # snapshot, sequência e escrita no log
+        self._flush_lock = threading.Lock()  # um flush por vez
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._pending = deque()
+        self._state = {}  # events_staff_id -> [registered, último movimento]
+        self._event_of = {}  # events_staff_id -> event_id
+        self._loaded = {}  # event_id -> (instante da carga, events_staff_ids)
+        self._sequence = 0
+        self._written = 0  # maior sequência já gravada no banco
+        self._failures = 0  # falhas seguidas do lote atual
+        self._log = None
+        self._thread = None
+
+    # --- ciclo de vida ---
+
+    def start(self, background=True):
+        """Trava o log, recupera entradas não gravadas e inicia a thread"""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.log_path, "a+", encoding="utf-8")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._log, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                self._log.close()
+                raise IngestLogBusy(f"Log de ingestão em uso: {self.log_path}")
+
+        checkpoint, _ = IngestCheckpoint.objects.get_or_create(name=self.name)
+        self._sequence = self._written = checkpoint.sequence
+        recovered = self._recover(checkpoint.sequence)
+        if recovered:
+            logger.warning("%s checks recuperados do log %s", recovered, self.log_path)
+
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name="check-ingest", daemon=True
+            )
+            self._thread.start()
+        return recovered
+
+    def stop(self):
+        """Para a thread e grava o que estiver pendente"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._log is not None and not self._log.closed:
+            self.flush()
+            self._log.close()
+
+    def _recover(self, checkpoint):
+        valid = 0  # bytes de entradas completas
+        with open(self.log_path, "rb") as raw:
+            for line in raw:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError
+                    entry = json.loads(line)
+                except ValueError:
+                    # Última linha incompleta: a confirmação nunca foi enviada
+                    break
+                valid += len(line)
+                self._sequence = max(self._sequence, entry["seq"])
+                if entry["seq"] > checkpoint:
+                    self._pending.append(entry)
+        # Sem o fragmento, novas entradas não são coladas nele
+        self._log.truncate(valid)
+        self._log.seek(0, os.SEEK_END)
+        return self.flush()
+
+    def _run(self):
+        try:
+            while not self._stopping.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                try:
+                    self.flush()
+                except Exception:
+                    # Banco indisponível: as entradas seguem no log e na fila
+                    logger.exception("Falha ao gravar checks; nova tentativa")
+                    self._stopping.wait(self.flush_interval * 10)
+        finally:
+            connection.close()
+
+    # --- aceitação ---
+
+    def _snapshot(self, **filters):
+        rows = (
+            EventsStaff.objects.filter(**filters)
+            .annotate(last_action=last_movement_subquery())
+            .values_list("id", "registration_check_id", "last_action")
+        )
+        return {
+            pk: [registration_check_id is not None, last_action]
+            for pk, registration_check_id, last_action in rows
+        }
+
+    def _load_event(self, events_staff_id):
+        """Snapshot de credenciamento do evento do EventsStaff (duas queries)"""
+        event_id = (
+            EventsStaff.objects.filter(pk=events_staff_id)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+        if event_id is None:
+            raise CheckRejected("EventsStaff não encontrado.")
+        state = self._snapshot(event_id=event_id)
+        # Pendências ainda não gravadas são mais novas que o banco (reaplicar
+        # uma que acabou de ser gravada não muda o estado)
+        for entry in self._pending:
+            if entry["events_staff"] in state:
+                _apply(state[entry["events_staff"]], entry["action"])
+
+        now = time.monotonic()
+        self._evict(event_id)
+        for expired in [
+            pk
+            for pk, (loaded_at, _) in self._loaded.items()
+            if now - loaded_at > self.snapshot_ttl
+        ]:
+            self._evict(expired)
+        self._state.update(state)
+        self._event_of.update(dict.fromkeys(state, event_id))
+        self._loaded[event_id] = (now, list(state))
+
+    def _evict(self, event_id):
+        _, ids = self._loaded.pop(event_id, (None, ()))
+        for pk in ids:
+            self._state.pop(pk, None)
+            self._event_of.pop(pk, None)
+
+    def _stale(self, events_staff_id):
+        event_id = self._event_of.get(events_staff_id)
+        if event_id is None:
+            return True
+        loaded_at, _ = self._loaded[event_id]
+        return time.monotonic() - loaded_at > self.snapshot_ttl
+
+    def _validate(self, events_staff_id, action):
+        state = self._state[events_staff_id]
+        try:
+            validate_transition(state[0], state[1], action)
+        except CheckRejected:
+            # Outro worker pode ter gravado direto (record_check); sem
+            # pendências locais do EventsStaff, o banco está em dia
+            if any(e["events_staff"] == events_staff_id for e in self._pending):
+                raise
+            fresh = self._snapshot(pk=events_staff_id).get(events_staff_id)
+            if fresh is None or fresh == state:
+                raise
+            state[:] = fresh
+            validate_transition(state[0], state[1], action)
+        return state
+
+    def submit(self, events_staff_id, action, user_control_id=None):
+        """
+        Valida e confirma um check; levanta CheckRejected se inválido.
+
+        Retorna a entrada gravada no log ({seq, events_staff, action,
+        user_control, timestamp}).
+        """
+        with self._lock:
+            if self._stale(events_staff_id):
+                self._load_event(events_staff_id)
+            state = self._validate(events_staff_id, action)
+
+            self._sequence += 1
+            entry = {
+                "seq": self._sequence,
+                "events_staff": events_staff_id,
+                "action": action,
+                "user_control": user_control_id,
+                "timestamp": timezone.now().isoformat(),
+            }
+            self._log.write(json.dumps(entry) + "\n")
+            self._log.flush()
+
+            _apply(state, action)
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+        return entry
+
+    # --- gravação ---
+
+    def flush(self):
+        """Grava todas as entradas pendentes em lotes; retorna quantas"""
+        flushed = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = list(islice(self._pending, self.batch_size))
+                if not batch:
+                    break
+                # Group commit: um fsync do log por lote
+                os.fsync(self._log.fileno())
+                self._write(batch)
+                with self._lock:
+                    for _ in batch:
+                        self._pending.popleft()
+                    if not self._pending:
+                        # Tudo no banco: o log pode recomeçar vazio
+                        self._log.truncate(0)
+                flushed += len(batch)
+        return flushed
+
+    def _checks(self, batch):
+        return [
+            Check(
+                events_staff_id=entry["events_staff"],
+                action=entry["action"],
+                user_control_id=entry["user_control"],
+                timestamp=datetime.fromisoformat(entry["timestamp"]),
+            )
+            for entry in batch
+        ]
+
+    def _commit(self, batch):
+        Check.objects.bulk_create(self._checks(batch))
+        registered = [
+            entry["events_staff"]
+            for entry in batch
+            if entry["action"] == CheckAction.REGISTRATION
+        ]
+        if registered:
+            EventsStaff.objects.filter(
+                pk__in=registered, registration_check__isnull=True
+            ).update(
+                registration_check=Subquery(
+                    Check.objects.filter(
+                        events_staff=OuterRef("pk"), action=CheckAction.REGISTRATION
+                    )
+                    .order_by("id")
+                    .values("id")[:1]
+                )
+            )
+        IngestCheckpoint.objects.filter(name=self.name).update(
+            sequence=batch[-1]["seq"], updated_at=timezone.now()
+        )
+
+    def _write(self, batch):
+        # Linhas já gravadas por uma tentativa anterior interrompida
+        batch = [entry for entry in batch if entry["seq"] > self._written]
+        if not batch:
+            return
+        try:
+            with transaction.atomic():
+                self._commit(batch)
+        except DatabaseError as exc:
+            if not isinstance(exc, IntegrityError):
+                # Banco fora do ar ou erro passageiro: o lote inteiro volta
+                self._failures += 1
+                if self._failures < MAX_ATTEMPTS:
+                    raise
+        else:
+            self._written = batch[-1]["seq"]
+            self._failures = 0
+            return
+
+        # Uma linha inválida (ex.: EventsStaff removido) não trava o lote
+        for entry in batch:
+            try:
+                with transaction.atomic():
+                    self._commit([entry])
+            except DatabaseError as exc:
+                # Só descarta com o banco respondendo; senão levanta e o
+                # lote é tentado de novo mais tarde
+                IngestCheckpoint.objects.filter(name=self.name).exists()
+                self._dead_letter(entry, exc)
+                IngestCheckpoint.objects.filter(name=self.name).update(
+                    sequence=entry["seq"], updated_at=timezone.now()
+                )
+            self._written = entry["seq"]
+        self._failures = 0
+
+    def _dead_letter(self, entry, exc):
+        logger.error("Check enviado ao dead-letter (%s): %s", exc, entry)
+        with open(self.dead_letter_path, "a", encoding="utf-8") as dead:
+            dead.write(json.dumps({**entry, "error": repr(exc)}) + "\n")
+            dead.flush()
+            os.fsync(dead.fileno())
+
+
+_ingestor = None
+_busy_until = 0.0
+_ingestor_lock = threading.Lock()
+
+
+def get_ingestor():
+    """
+    Ingestor do processo, iniciado no primeiro uso.
+
+    None enquanto o log estiver com outro processo; a tentativa de
+    assumi-lo (e recuperar o que ficou nele) se repete a cada LOCK_RETRY.
+    """
+    global _ingestor, _busy_until
+    with _ingestor_lock:
+        if _ingestor is None and time.monotonic() >= _busy_until:
+            ingestor = CheckIngestor(
+                settings.CHECK_INGEST_LOG,
+                batch_size=settings.CHECK_INGEST_BATCH_SIZE,
+                flush_interval=settings.CHECK_INGEST_FLUSH_INTERVAL,
+                snapshot_ttl=settings.CHECK_INGEST_SNAPSHOT_TTL,
+            )
+            try:
+                ingestor.start()
+            except IngestLogBusy:
+                _busy_until = time.monotonic() + LOCK_RETRY
+                return None
+            atexit.register(ingestor.stop)
+            _ingestor = ingestor
+    return _ingestor
+
+
+def ingest_check(events_staff_id, action, user_control=None):
+    """
+    Aceita um check no modo buffered (ver docstring do módulo).
+
+    Sem o log (outro worker está com ele), grava direto com `record_check`
+    e retorna a entrada no mesmo formato, com "seq" None.
+    """
+    ingestor = get_ingestor()
+    if ingestor is not None:
+        return ingestor.submit(
+            events_staff_id,
+            action,
+            user_control_id=user_control.pk if user_control is not None else None,
+        )
+
+    events_staff = EventsStaff.objects.filter(pk=events_staff_id).first()
+    if events_staff is None:
+        raise CheckRejected("EventsStaff não encontrado.")
+    check = record_check(events_staff, action, user_control=user_control)
+    return {
+        "seq": None,
+        "events_staff": check.events_staff_id,
+        "action": check.action,
+        "user_control": check.user_control_id,
+        "timestamp": timezone.now().isoformat(),
+    }
@@ -0,0 +1,98 @@
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from ..models import INVITE_LIFETIME, InviteStatus, User, UserInvite
+from .mail import queue_invite_emails
+
+BATCH_SIZE = 500
+
+
+class InviteError(Exception):
+    """Cadastro via convite recusado"""
+
+
+class InviteNotFound(InviteError):
+    pass
+
+
+class InviteUnavailable(InviteError):
+    def __init__(self, status):
+        super().__init__(f"Invite is {status}")
+        self.status = status
+
+
+class InviteEmailMismatch(InviteError):
+    pass
+
+
+class UserAlreadyExists(InviteError):
+    pass
+
+
+def create_invites(company, role, emails=None, count=0, created_by=None):
+    """
+    Cria convites em massa com um único bulk_create.
+
+    Um convite por e-mail em `emails` (e-mails repetidos são ignorados)
+    mais `count` convites sem e-mail. Os e-mails são enfileirados na
+    mesma transação.
+    """
+    expires_at = timezone.now() + INVITE_LIFETIME
+    recipients = list(dict.fromkeys(emails or [])) + [None] * count
+    invites = [
+        UserInvite(
+            company=company,
+            email=email,
+            role=role,
+            expires_at=expires_at,
+            created_by=created_by,
+        )
+        for email in recipients
+    ]
+
+    with transaction.atomic():
+        UserInvite.objects.bulk_create(invites, batch_size=BATCH_SIZE)
+        queue_invite_emails(invites, company.name)
+    return invites
+
+
+def register_with_invite(invite_id, email, name):
+    """
+    Cria o usuário e consome o convite em uma única transação.
+
+    O convite é reivindicado com um UPDATE condicional
+    (`used_by IS NULL AND expires_at > now`): com cadastros simultâneos
+    apenas um vence; os demais têm a criação do usuário desfeita.
+    """
+    invite = (
+        UserInvite.objects.with_status()
+        .filter(id=invite_id)
+        .only("id", "email", "role", "company_id", "created_by_id", "expires_at")
+        .first()
+    )
+    if invite is None:
+        raise InviteNotFound("Invalid invite token")
+    if invite.status != InviteStatus.PENDING:
+        raise InviteUnavailable(invite.status)
+    if invite.email and invite.email != email:
+        raise InviteEmailMismatch("Email does not match invite restriction")
+
+    try:
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email=email,
+                name=name,
+                role=invite.role,
+                company_id=invite.company_id,
+                created_by_id=invite.created_by_id,  # Admin que gerou o convite
+            )
+            claimed = UserInvite.objects.filter(
+                id=invite.id, used_by__isnull=True, expires_at__gt=Now()
+            ).update(used_by=user)
+            if not claimed:
+                # Outro cadastro consumiu o convite primeiro: desfaz o usuário
+                raise InviteUnavailable(InviteStatus.USED)
+    except IntegrityError:
+        raise UserAlreadyExists("User already exists")
+    return user
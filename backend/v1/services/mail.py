@@ -0,0 +1,113 @@
+"""
+Fila local de e-mails (EmailOutbox).
+
+As requisições apenas enfileiram mensagens já renderizadas; o comando
+drain_outbox as envia em lotes reaproveitando uma única conexão do
+EMAIL_BACKEND configurado (console/file em desenvolvimento).
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from ..models import EmailOutbox, OutboxStatus
+from ..utils import build_invite_url
+
+BATCH_SIZE = 100
+MAX_ATTEMPTS = 5
+
+# Tempo máximo de envio de um lote antes que outro worker possa pegá-lo
+LEASE = timedelta(minutes=10)
+
+
+def render_invite_email(invite, company_name):
+    """Retorna (assunto, corpo) do e-mail de convite"""
+    context = {
+        "company": company_name,
+        "role": invite.get_role_display(),
+        "invite_url": build_invite_url(invite.id),
+        "expires_at": timezone.localtime(invite.expires_at),
+    }
+    subject = render_to_string("v1/emails/invite_subject.txt", context).strip()
+    body = render_to_string("v1/emails/invite_body.txt", context)
+    return subject, body
+
+
+def queue_invite_emails(invites, company_name):
+    """Enfileira o e-mail dos convites que possuem destinatário"""
+    messages = []
+    for invite in invites:
+        if not invite.email:
+            continue
+        subject, body = render_invite_email(invite, company_name)
+        messages.append(EmailOutbox(to=invite.email, subject=subject, body=body))
+    return EmailOutbox.objects.bulk_create(messages, batch_size=BATCH_SIZE)
+
+
+def _claim_batch(batch_size, max_attempts):
+    """
+    Reserva um lote pendente para este worker.
+
+    skip_locked evita a espera entre workers durante a reserva; o lease
+    (`claimed_until`) impede que outro worker pegue as mesmas linhas
+    depois do commit, enquanto o envio acontece. Se o worker cair, as
+    mensagens voltam para a fila quando o lease vencer.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxStatus.PENDING, attempts__lt=max_attempts)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        EmailOutbox.objects.filter(id__in=ids).update(
+            attempts=F("attempts") + 1, claimed_until=now + LEASE
+        )
+    return list(EmailOutbox.objects.filter(id__in=ids).order_by("id"))
+
+
+def drain_outbox(batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """
+    Envia um lote de e-mails pendentes.
+
+    Retorna (enviados, falhas). Mensagens que falharem voltam para a fila
+    até `max_attempts`, depois ficam como `failed`.
+    """
+    batch = _claim_batch(batch_size, max_attempts)
+    if not batch:
+        return 0, 0
+
+    sent, failed = [], []
+    with get_connection() as connection:
+        for item in batch:
+            message = EmailMessage(
+                item.subject,
+                item.body,
+                settings.DEFAULT_FROM_EMAIL,
+                [item.to],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as exc:  # noqa: BLE001 - registramos e seguimos
+                item.last_error = str(exc)
+                # Libera o lease: volta para a fila na próxima rodada
+                item.claimed_until = None
+                if item.attempts >= max_attempts:
+                    item.status = OutboxStatus.FAILED
+                failed.append(item)
+            else:
+                item.status = OutboxStatus.SENT
+                item.sent_at = timezone.now()
+                sent.append(item)
+
+    EmailOutbox.objects.bulk_update(sent, ["status", "sent_at"])
+    EmailOutbox.objects.bulk_update(failed, ["status", "last_error", "claimed_until"])
+    return len(sent), len(failed)
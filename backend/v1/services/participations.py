@@ -0,0 +1,97 @@
+"""
+Participação de empresas em eventos (EventsCompany) em forma de matriz
+eventos x empresas.
+
+A atribuição em massa é um único upsert (bulk_create com
+update_conflicts sobre a unique (event, company), ver
+utils.upsert_options); a matriz de leitura traz o uso atual da cota de
+cada célula a partir de uma query agrupada.
+"""
+
+from django.db import transaction
+from django.db.models import Count
+
+from ..models import Company, Event, EventsCompany, EventsStaff
+from ..utils import upsert_options
+
+BATCH_SIZE = 1000
+
+# Limite de células por requisição (eventos x empresas)
+MAX_MATRIX_CELLS = 10_000
+
+
+def assign_companies(events, companies, role, staff_limit):
+    """
+    Cria ou atualiza a participação de cada empresa em cada evento.
+
+    Participações existentes têm `role` e `staff_limit` sobrescritos.
+    Retorna o número de células gravadas.
+    """
+    rows = [
+        EventsCompany(
+            event_id=event_id, company_id=company_id, role=role, staff_limit=staff_limit
+        )
+        for event_id in events
+        for company_id in companies
+    ]
+    with transaction.atomic():
+        EventsCompany.objects.bulk_create(
+            rows,
+            batch_size=BATCH_SIZE,
+            # Única chave além da PK: unique (event, company)
+            **upsert_options(
+                EventsCompany, ["event", "company"], ["role", "staff_limit"]
+            ),
+        )
+    return len(rows)
+
+
+def participation_matrix(event_ids, company_ids=None):
+    """
+    Matriz de participação dos eventos: uma célula por EventsCompany, com
+    a cota (`staff_limit`) e o uso atual (`used`, staffs da empresa
+    vinculados ao evento). `company_ids` restringe as colunas.
+    """
+    participations = EventsCompany.objects.filter(event_id__in=event_ids)
+    links = EventsStaff.objects.filter(event_id__in=event_ids)
+    if company_ids is not None:
+        participations = participations.filter(company_id__in=company_ids)
+        links = links.filter(staff__company_id__in=company_ids)
+
+    # Uso de todas as células em uma única query agrupada
+    usage = {
+        (row["event_id"], row["staff__company_id"]): row["used"]
+        for row in links.values("event_id", "staff__company_id")
+        .annotate(used=Count("id"))
+        .order_by()
+    }
+
+    cells = [
+        {
+            "event": row["event_id"],
+            "company": row["company_id"],
+            "role": row["role"],
+            "staff_limit": row["staff_limit"],
+            "used": usage.get((row["event_id"], row["company_id"]), 0),
+        }
+        for row in participations.values(
+            "event_id", "company_id", "role", "staff_limit"
+        ).order_by("event_id", "company_id")
+    ]
+    column_ids = {cell["company"] for cell in cells}
+    if company_ids is not None:
+        column_ids.update(company_ids)
+
+    return {
+        "events": list(
+            Event.objects.filter(id__in=event_ids)
+            .order_by("date_begin", "id")
+            .values("id", "name", "date_begin", "date_end")
+        ),
+        "companies": list(
+            Company.objects.filter(id__in=column_ids)
+            .order_by("name", "id")
+            .values("id", "name")
+        ),
+        "cells": cells,
+    }
@@ -0,0 +1,155 @@
+"""
+Deduplicação de staffs entre empresas.
+
+Staff é único por (empresa, CPF): a mesma pessoa existe uma vez em cada
+empresa. Cada Staff aponta para uma Person canônica (uma por CPF), o que
+permite relatórios por pessoa com um join inteiro em vez de comparar CPFs.
+
+- `duplicate_groups`: Persons com mais de um Staff, de uma query agrupada;
+  os nomes de cada grupo são comparados (difflib) e grupos cujos nomes
+  divergem demais são marcados como conflito (provável CPF digitado
+  errado em alguma empresa);
+- `link_people`: cria as Persons que faltam e reescreve `Staff.person` em
+  lotes, com UPDATEs por conjunto. Idempotente: só toca staffs sem
+  Person ou ligados a uma Person de outro CPF (CPF editado).
+"""
+
+from collections import Counter
+from difflib import SequenceMatcher
+
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+
+from ..cache import bump_on_commit
+from ..models import Person, Staff
+
+BATCH_SIZE = 1000
+
+# Similaridade mínima (0..1) entre o nome de cada staff e o nome canônico
+NAME_SIMILARITY = 0.8
+
+
+def name_similarity(a, b):
+    """Similaridade entre dois nomes já normalizados (name_search)"""
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _canonical(members):
+    """Nome mais frequente do grupo; empate: o do staff mais antigo"""
+    counts = Counter(member["name_search"] for member in members)
+    best = max(counts.values())
+    return next(m for m in members if counts[m["name_search"]] == best)
+
+
+def duplicate_groups(queryset=None, min_similarity=NAME_SIMILARITY, limit=None):
+    """
+    Persons ligadas a mais de um Staff (agrupado por person_id; staffs
+    ainda sem Person ficam de fora até o próximo `link_people`).
+
+    Retorna [{person, cpf, name, staffs, companies, conflict, members}]
+    ordenado pelos maiores grupos. `members` traz {id, company, name,
+    similarity}.
+    """
+    queryset = Staff.objects.all() if queryset is None else queryset
+    groups = (
+        queryset.filter(person__isnull=False)
+        .values("person_id", "person__cpf")
+        .annotate(
+            staffs=Count("id"),
+            companies=Count("company", distinct=True),
+            names=Count("name_search", distinct=True),
+        )
+        .filter(staffs__gt=1)
+        .order_by("-staffs", "person_id")
+    )
+    if limit is not None:
+        groups = groups[:limit]
+    groups = list(groups)
+
+    members = {}
+    person_ids = [group["person_id"] for group in groups]
+    for i in range(0, len(person_ids), BATCH_SIZE):
+        rows = (
+            queryset.filter(person_id__in=person_ids[i : i + BATCH_SIZE])
+            .order_by("id")
+            .values("id", "person_id", "company_id", "name", "name_search")
+        )
+        for row in rows:
+            members.setdefault(row["person_id"], []).append(row)
+
+    result = []
+    for group in groups:
+        rows = members.get(group["person_id"], [])
+        canonical = _canonical(rows) if rows else None
+        items = []
+        for row in rows:
+            # Grupos com um único nome normalizado não precisam comparar
+            similarity = (
+                1.0
+                if group["names"] == 1
+                else name_similarity(row["name_search"], canonical["name_search"])
+            )
+            items.append(
+                {
+                    "id": row["id"],
+                    "company": row["company_id"],
+                    "name": row["name"],
+                    "similarity": round(similarity, 3),
+                }
+            )
+        result.append(
+            {
+                "person": group["person_id"],
+                "cpf": group["person__cpf"],
+                "name": canonical["name"] if canonical else "",
+                "staffs": group["staffs"],
+                "companies": group["companies"],
+                "conflict": any(item["similarity"] < min_similarity for item in items),
+                "members": items,
+            }
+        )
+    return result
+
+
+def _stale_staffs():
+    """Staffs sem Person ou ligados a uma Person de outro CPF"""
+    return Staff.objects.filter(Q(person__isnull=True) | ~Q(person__cpf=F("cpf")))
+
+
+def link_people(batch_size=BATCH_SIZE):
+    """
+    Liga todos os staffs à Person do seu CPF, criando as que faltam.
+
+    Retorna (persons criadas, staffs religados).
+    """
+    stale = _stale_staffs()
+    created = relinked = 0
+    while True:
+        cpfs = list(
+            stale.order_by("cpf").values_list("cpf", flat=True).distinct()[:batch_size]
+        )
+        if not cpfs:
+            break
+
+        names = {}
+        for cpf, name in Staff.objects.filter(cpf__in=cpfs).values_list("cpf", "name"):
+            names.setdefault(cpf, Counter())[name] += 1
+
+        with transaction.atomic():
+            existing = Person.objects.filter(cpf__in=cpfs).count()
+            Person.objects.bulk_create(
+                [Person(cpf=cpf, name=names[cpf].most_common(1)[0][0]) for cpf in cpfs],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            created += Person.objects.filter(cpf__in=cpfs).count() - existing
+            relinked += stale.filter(cpf__in=cpfs).update(
+                person_id=Subquery(
+                    Person.objects.filter(cpf=OuterRef("cpf")).values("id")[:1]
+                )
+            )
+
+    if relinked:
+        # update() não dispara signals
+        bump_on_commit("staff")
+    return created, relinked
@@ -0,0 +1,133 @@
+"""
+Vínculo em massa de staffs a um evento respeitando EventsCompany.staff_limit.
+
+A contagem atual é lida uma única vez por requisição, com a linha de
+EventsCompany da empresa bloqueada (select_for_update). O lock é por
+(evento, empresa): empresas diferentes não disputam o mesmo lock.
+"""
+
+from django.db import transaction
+
+from ..cache import bump_on_commit
+from ..documents import validate_cpf_digits
+from ..models import EventsCompany, EventsStaff, Person, Staff
+from ..utils import normalize_search_text, sanitize_digits_many, upsert_options
+
+BATCH_SIZE = 1000
+
+REJECT_INVALID_CPF = "invalid_cpf"
+REJECT_MISSING_NAME = "missing_name"
+REJECT_STAFF_LIMIT = "staff_limit"
+
+
+def _normalize(items):
+    """Sanitiza e remove CPFs repetidos no lote (o último nome vence)"""
+    rows = {}
+    rejected = []
+    # Sanitização e dígitos verificadores do lote inteiro de uma vez
+    cpfs = sanitize_digits_many([item.get("cpf") for item in items])
+    valid = validate_cpf_digits(cpfs)
+    for item, cpf, is_valid in zip(items, cpfs, valid):
+        if not is_valid:
+            rejected.append({"cpf": item.get("cpf"), "reason": REJECT_INVALID_CPF})
+            continue
+        if not item.get("name"):
+            rejected.append({"cpf": cpf, "reason": REJECT_MISSING_NAME})
+            continue
+        rows[cpf] = item["name"]
+    return rows, rejected
+
+
+def link_staffs_to_event(event, company, items, created_by=None):
+    """
+    Faz o upsert dos staffs da empresa e os vincula ao evento.
+
+    Aceitação parcial: CPFs que excederem a cota restante de
+    EventsCompany.staff_limit são rejeitados e reportados no resultado.
+    Sem linha de EventsCompany para a empresa, não há cota a aplicar.
+    """
+    rows, rejected = _normalize(items)
+
+    with transaction.atomic():
+        participation = (
+            EventsCompany.objects.select_for_update()
+            .filter(event=event, company=company)
+            .first()
+        )
+
+        already_linked = set(
+            EventsStaff.objects.filter(
+                event=event, staff_cpf__in=list(rows)
+            ).values_list("staff_cpf", flat=True)
+        )
+        new_cpfs = [cpf for cpf in rows if cpf not in already_linked]
+
+        remaining = None
+        if participation is not None:
+            used = EventsStaff.objects.filter(
+                event=event, staff__company=company
+            ).count()
+            remaining = max(participation.staff_limit - used, 0)
+            rejected.extend(
+                {"cpf": cpf, "reason": REJECT_STAFF_LIMIT}
+                for cpf in new_cpfs[remaining:]
+            )
+            new_cpfs = new_cpfs[:remaining]
+            remaining -= len(new_cpfs)
+
+        # Upsert dos staffs aceitos e já vinculados (mantém o nome atualizado)
+        upsert_cpfs = new_cpfs + [cpf for cpf in rows if cpf in already_linked]
+        Person.objects.bulk_create(
+            [Person(cpf=cpf, name=rows[cpf]) for cpf in upsert_cpfs],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        person_ids = dict(
+            Person.objects.filter(cpf__in=upsert_cpfs).values_list("cpf", "id")
+        )
+        Staff.objects.bulk_create(
+            [
+                Staff(
+                    company=company,
+                    cpf=cpf,
+                    name=rows[cpf],
+                    name_search=normalize_search_text(rows[cpf]),
+                    person_id=person_ids[cpf],
+                    created_by=created_by,
+                )
+                for cpf in upsert_cpfs
+            ],
+            batch_size=BATCH_SIZE,
+            # Única chave além da PK: unique (company, cpf)
+            **upsert_options(
+                Staff, ["company", "cpf"], ["name", "name_search", "person"]
+            ),
+        )
+        staff_ids = dict(
+            Staff.objects.filter(company=company, cpf__in=new_cpfs).values_list(
+                "cpf", "id"
+            )
+        )
+
+        EventsStaff.objects.bulk_create(
+            [
+                EventsStaff(
+                    event=event,
+                    staff_id=staff_ids[cpf],
+                    staff_cpf=cpf,
+                    created_by=created_by,
+                )
+                for cpf in new_cpfs
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        # bulk_create não dispara signals
+        bump_on_commit("staff")
+
+    return {
+        "linked": len(new_cpfs),
+        "already_linked": sorted(already_linked),
+        "rejected": rejected,
+        "remaining": remaining,
+    }
@@ -0,0 +1,99 @@
+"""
+Transições automáticas de status de eventos e projetos pelas datas.
+
+- pending → open quando o período começa (date_begin <= agora < date_end);
+- pending/open → close quando o período termina (date_end <= agora).
+
+As transições só avançam: um evento fechado nunca é reaberto aqui. Cada
+transição é um UPDATE por conjunto, filtrado pelo status atual, atendido
+pelos índices (status, date_begin) / (status, date_end) — só as linhas
+que ainda precisam mudar são lidas, então o comando pode rodar a cada
+minuto. Rodadas concorrentes são seguras: o UPDATE repete o filtro de
+status e uma linha já alterada não é alterada de novo.
+
+Projetos usam datas (DateField, dia inclusive) no fuso atual; projetos
+sem datas ficam com o status manual.
+
+Eventos fechados têm os snapshots recalculados e o cache de respostas é
+invalidado (queryset.update() não dispara signals).
+"""
+
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..cache import bump_on_commit
+from ..models import Event, Project, Status
+from ..reports import rebuild_events
+
+BATCH_SIZE = 1000
+
+
+def _advance(queryset, new_status, batch_size):
+    """Atualiza `queryset` para `new_status` em lotes; retorna os ids alterados"""
+    changed = []
+    ids = queryset.order_by().values_list("id", flat=True).iterator(batch_size)
+    while batch := list(islice(ids, batch_size)):
+        with transaction.atomic():
+            # Repete o filtro: outra rodada pode ter mudado a linha no meio
+            updated = queryset.filter(id__in=batch).update(status=new_status)
+        if updated:
+            changed.extend(batch)
+    return changed
+
+
+def _due(model, now, today):
+    """Querysets (a fechar, a abrir) de um modelo"""
+    # Event: datetimes com fim exclusivo; Project: dias, fim inclusive
+    moment = now if model is Event else today
+    ended = {"date_end__lte" if model is Event else "date_end__lt": moment}
+    to_close = model.objects.filter(status__in=[Status.PENDING, Status.OPEN], **ended)
+    to_open = model.objects.filter(status=Status.PENDING, date_begin__lte=moment)
+    return to_close, to_open.exclude(**ended)
+
+
+def pending_transitions(now=None):
+    """Contagem das transições que `advance_statuses` faria agora"""
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    counts = {}
+    for model in (Event, Project):
+        to_close, to_open = _due(model, now, today)
+        name = model._meta.model_name
+        counts[f"{name}s_closed"] = to_close.count()
+        counts[f"{name}s_opened"] = to_open.count()
+    return counts
+
+
+def advance_statuses(now=None, batch_size=BATCH_SIZE, snapshots=True):
+    """
+    Aplica as transições vencidas até `now`.
+
+    Retorna {"events_closed", "events_opened", "projects_closed",
+    "projects_opened", "snapshot_rows"}.
+    """
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    result = {}
+    closed_events = []
+    for model in (Event, Project):
+        to_close, to_open = _due(model, now, today)
+        name = model._meta.model_name
+        # Fecha primeiro: um período que já terminou não passa por open
+        closed = _advance(to_close, Status.CLOSE, batch_size)
+        opened = _advance(to_open, Status.OPEN, batch_size)
+        result[f"{name}s_closed"] = len(closed)
+        result[f"{name}s_opened"] = len(opened)
+        if model is Event:
+            closed_events = closed
+        if closed or opened:
+            bump_on_commit(name)
+
+    # Fechamento congela os números do evento: snapshots finais
+    rows = 0
+    if snapshots:
+        for i in range(0, len(closed_events), batch_size):
+            rows += rebuild_events(closed_events[i : i + batch_size])
+    result["snapshot_rows"] = rows
+    return result
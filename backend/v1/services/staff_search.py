@@ -0,0 +1,149 @@
+"""
+Busca de Staff por nome e CPF.
+
+- CPF (apenas dígitos): prefixo sobre a coluna `cpf` indexada;
+- Nome: índice full-text sobre `name_search` (nome sem acentos, minúsculo)
+  com resultados ranqueados. SQLite usa uma tabela FTS5 mantida por
+  triggers; MySQL usa um índice FULLTEXT. Outros bancos caem para busca
+  por prefixo de palavra.
+"""
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from ..utils import normalize_search_text, sanitize_digits
+
+SEARCH_LIMIT = 50
+
+FTS_TABLE = "staffs_fts"
+MYSQL_FULLTEXT_INDEX = "staffs_name_search_ft"
+
+_SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name_search, content='staffs', content_rowid='id', prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON staffs BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name_search)
+        VALUES (new.id, new.name_search);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON staffs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name_search)
+        VALUES ('delete', old.id, old.name_search);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON staffs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name_search)
+        VALUES ('delete', old.id, old.name_search);
+        INSERT INTO {FTS_TABLE}(rowid, name_search)
+        VALUES (new.id, new.name_search);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+_SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def install_fulltext(schema_editor):
+    """
+    Cria (ou recria) o índice full-text de staffs. Idempotente.
+
+    No SQLite, migrações que recriam a tabela `staffs` descartam os
+    triggers; rode `python manage.py rebuild_staff_search` depois delas.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for sql in _SQLITE_INSTALL:
+            schema_editor.execute(sql)
+    elif vendor == "mysql":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'staffs' "
+                "AND index_name = %s",
+                [MYSQL_FULLTEXT_INDEX],
+            )
+            exists = cursor.fetchone()
+        if not exists:
+            schema_editor.execute(
+                f"ALTER TABLE staffs ADD FULLTEXT INDEX "
+                f"{MYSQL_FULLTEXT_INDEX} (name_search)"
+            )
+
+
+def uninstall_fulltext(schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for sql in _SQLITE_UNINSTALL:
+            schema_editor.execute(sql)
+    elif vendor == "mysql":
+        schema_editor.execute(f"ALTER TABLE staffs DROP INDEX {MYSQL_FULLTEXT_INDEX}")
+
+
+def _cpf_query(q):
+    """Retorna os dígitos se a busca for um CPF (completo ou prefixo)"""
+    digits = sanitize_digits(q)
+    if digits and not any(c.isalpha() for c in q):
+        return digits
+    return None
+
+
+def search_staffs(queryset, q, limit=SEARCH_LIMIT):
+    """
+    Filtra `queryset` pela busca `q`, ordenando pelos mais relevantes.
+
+    Cada palavra da busca é tratada como prefixo ("jo sil" encontra
+    "João da Silva"). `limit=None` devolve o queryset sem fatiar.
+    """
+    cpf = _cpf_query(q or "")
+    if cpf:
+        results = queryset.filter(cpf__startswith=cpf).order_by("cpf")
+        return results[:limit] if limit else results
+
+    tokens = normalize_search_text(q).split()
+    if not tokens:
+        return queryset.none()
+
+    vendor = connection.vendor
+    if vendor == "sqlite":
+        match = " ".join(f'"{token}"*' for token in tokens)
+        results = queryset.extra(
+            tables=[FTS_TABLE],
+            where=[f"{FTS_TABLE}.rowid = staffs.id", f"{FTS_TABLE} MATCH %s"],
+            params=[match],
+            select={"rank": f"bm25({FTS_TABLE})"},
+            order_by=["rank"],
+        )
+    elif vendor == "mysql":
+        match = " ".join(f"+{token}*" for token in tokens)
+        results = (
+            queryset.annotate(
+                rank=RawSQL(
+                    "MATCH (staffs.name_search) AGAINST (%s IN BOOLEAN MODE)",
+                    [match],
+                )
+            )
+            .filter(rank__gt=0)
+            .order_by("-rank")
+        )
+    else:
+        condition = Q()
+        for token in tokens:
+            condition &= Q(name_search__startswith=token) | Q(
+                name_search__contains=f" {token}"
+            )
+        results = queryset.filter(condition).order_by("name_search")
+
+    return results[:limit] if limit else results
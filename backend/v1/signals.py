@@ -0,0 +1,30 @@
+"""
+Invalidação do cache de respostas (v1/cache.py) quando Company, Project,
+Event ou Staff mudam. Conectado em V1Config.ready.
+
+Escritas em massa (bulk_create/update) não disparam signals: os serviços
+que as fazem chamam `bump_on_commit` diretamente.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from .cache import bump_on_commit
+from .models import Company, Event, Project, Staff
+
+NAMESPACE_BY_MODEL = {
+    Company: "company",
+    Project: "project",
+    Event: "event",
+    Staff: "staff",
+}
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    bump_on_commit(NAMESPACE_BY_MODEL[sender])
+
+
+# Conectado por model: um receiver sem `sender` impediria o fast-delete
+# (DELETE sem carregar as linhas) de todos os outros models
+for model in (Company, Project, Event, Staff):
+    post_save.connect(invalidate_cached_responses, sender=model)
+    post_delete.connect(invalidate_cached_responses, sender=model)
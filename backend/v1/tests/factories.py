@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from ..benchmarks.fixtures import fake_cnpj, fake_cpf
+from ..models import Company, Event, EventsStaff, Project, Staff, User, UserRole
+
+
+def make_company():
+    return Company.objects.create(name="Empresa", cnpj=fake_cnpj())
+
+
+def make_user(role=UserRole.ADMIN, company=None):
+    number = User.objects.count() + 1
+    return User.objects.create_user(
+        email=f"user{number}@example.com",
+        name=f"user {number}",
+        role=role,
+        company=company,
+    )
+
+
+def make_event(staff_count=1, company=None):
+    """Evento aberto com `staff_count` staffs vinculados: (event, links)"""
+    company = company or make_company()
+    project = Project.objects.create(name="Projeto", company=company)
+    now = timezone.now()
+    event = Event.objects.create(
+        name="Evento",
+        project=project,
+        date_begin=now,
+        date_end=now + timedelta(hours=8),
+    )
+    offset = Staff.objects.count()
+    links = [
+        EventsStaff.objects.create(event=event, staff=staff, staff_cpf=staff.cpf)
+        for staff in (
+            Staff.objects.create(
+                name=f"staff {i}", cpf=fake_cpf(offset + i + 1), company=company
+            )
+            for i in range(staff_count)
+        )
+    ]
+    return event, links
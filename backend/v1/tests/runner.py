@@ -0,0 +1,15 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """Roda a suíte com SAVE_QUERY_GUARD="raise" (ver v1/query_guard.py)"""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._query_guard = override_settings(SAVE_QUERY_GUARD="raise")
+        self._query_guard.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._query_guard.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,96 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import Check, CheckAction, EventsStaff, UserInvite, UserRole
+from .factories import make_company, make_event, make_user
+
+
+class ChangelistQueryBudgetTests(TestCase):
+    """
+    Cada changelist roda um número fixo de queries, independente do número
+    de linhas: sessão, usuário, página e contagem do paginador
+    """
+
+    rows = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_user(role=UserRole.ADMIN)
+        cls.admin.is_superuser = True
+        cls.admin.save()
+
+        company = make_company()
+        _, links = make_event(staff_count=cls.rows, company=company)
+        Check.objects.bulk_create(
+            Check(
+                events_staff=link,
+                action=CheckAction.REGISTRATION,
+                user_control=cls.admin,
+            )
+            for link in links
+        )
+        UserInvite.objects.bulk_create(
+            UserInvite(
+                company=company, role=UserRole.CONTROL, email=f"i{i}@example.com"
+            )
+            for i in range(cls.rows)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def assertChangelistQueries(self, model, budget):
+        url = reverse(f"admin:v1_{model}_changelist")
+        with self.assertNumQueries(budget):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].result_count, self.rows)
+
+    def test_staff(self):
+        self.assertChangelistQueries("staff", 4)
+
+    def test_events_staff(self):
+        self.assertChangelistQueries("eventsstaff", 4)
+
+    def test_check(self):
+        self.assertChangelistQueries("check", 4)
+
+    def test_invite(self):
+        self.assertChangelistQueries("userinvite", 4)
+
+
+class EventsStaffAdminFormTests(TestCase):
+    def setUp(self):
+        self.admin = make_user(role=UserRole.ADMIN)
+        self.admin.is_superuser = True
+        self.admin.save()
+        self.client.force_login(self.admin)
+        self.event, (self.link,) = make_event()
+
+    def post_add(self, event, staff):
+        return self.client.post(
+            reverse("admin:v1_eventsstaff_add"),
+            {
+                "event": event.pk,
+                "staff": staff.pk,
+                "registration_check": "",
+                "created_by": self.admin.pk,
+                "created_at_0": "2026-01-01",
+                "created_at_1": "10:00:00",
+            },
+        )
+
+    def test_cpf_is_copied_from_staff(self):
+        other_event, _ = make_event(staff_count=0)
+        response = self.post_add(other_event, self.link.staff)
+
+        self.assertEqual(response.status_code, 302)
+        link = EventsStaff.objects.get(event=other_event)
+        self.assertEqual(link.staff_cpf, self.link.staff.cpf)
+
+    def test_duplicate_link_is_a_form_error(self):
+        response = self.post_add(self.event, self.link.staff)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["adminform"].form.non_field_errors())
+        self.assertEqual(EventsStaff.objects.filter(event=self.event).count(), 1)
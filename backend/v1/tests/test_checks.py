@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Check, CheckAction, EventsStaff
+from ..services import CheckRejected, record_check
+from .factories import make_event, make_user
+
+
+class CheckStateMachineTests(TestCase):
+    def setUp(self):
+        _, (self.link,) = make_event()
+        self.user = make_user()
+
+    def record(self, action):
+        return record_check(self.link, action, self.user)
+
+    def test_check_in_requires_registration(self):
+        for action in (CheckAction.CHECK_IN, CheckAction.CHECK_OUT):
+            with self.assertRaises(CheckRejected):
+                self.record(action)
+        self.assertFalse(Check.objects.exists())
+
+    def test_registration_only_once(self):
+        check = self.record(CheckAction.REGISTRATION)
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.registration_check_id, check.pk)
+
+        with self.assertRaises(CheckRejected):
+            self.record(CheckAction.REGISTRATION)
+        self.assertEqual(Check.objects.count(), 1)
+
+    def test_check_in_and_out_alternate(self):
+        self.record(CheckAction.REGISTRATION)
+        with self.assertRaises(CheckRejected):
+            self.record(CheckAction.CHECK_OUT)
+
+        self.record(CheckAction.CHECK_IN)
+        with self.assertRaises(CheckRejected):
+            self.record(CheckAction.CHECK_IN)
+
+        self.record(CheckAction.CHECK_OUT)
+        with self.assertRaises(CheckRejected):
+            self.record(CheckAction.CHECK_OUT)
+        self.record(CheckAction.CHECK_IN)
+
+    def test_rejection_payload(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post(
+            reverse("check-list"),
+            {"events_staff": self.link.pk, "action": CheckAction.CHECK_IN},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"non_field_errors": ["Staff não credenciado (Registration Required)."]},
+        )
+
+
+class CheckRaceTests(TransactionTestCase):
+    """Várias portarias enviando o mesmo check ao mesmo tempo"""
+
+    threads = 8
+
+    def race(self, link, action, user):
+        barrier = Barrier(self.threads)
+
+        def attempt(_):
+            try:
+                barrier.wait()
+                record_check(link, action, user)
+                return "accepted"
+            except CheckRejected:
+                return "rejected"
+            except OperationalError:
+                # SQLite: escritas concorrentes falham com "database is locked"
+                return "db_error"
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            return list(pool.map(attempt, range(self.threads)))
+
+    def test_single_registration_wins(self):
+        _, (link,) = make_event()
+        outcomes = self.race(
+            EventsStaff.objects.get(pk=link.pk), CheckAction.REGISTRATION, make_user()
+        )
+
+        self.assertEqual(outcomes.count("accepted"), 1)
+        self.assertEqual(
+            Check.objects.filter(action=CheckAction.REGISTRATION).count(), 1
+        )
+        link.refresh_from_db()
+        self.assertIsNotNone(link.registration_check_id)
+
+    def test_double_check_in(self):
+        _, (link,) = make_event()
+        user = make_user()
+        record_check(link, CheckAction.REGISTRATION, user)
+
+        outcomes = self.race(link, CheckAction.CHECK_IN, user)
+
+        self.assertEqual(outcomes.count("accepted"), 1)
+        self.assertEqual(Check.objects.filter(action=CheckAction.CHECK_IN).count(), 1)
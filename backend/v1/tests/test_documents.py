@@ -0,0 +1,39 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..benchmarks.fixtures import fake_cnpj
+from ..models import Company
+from .factories import make_user
+
+
+class CompanyCnpjTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(make_user())
+
+    def test_invalid_cnpj_is_rejected(self):
+        response = self.client.post(
+            reverse("company-list"), {"name": "Nova", "cnpj": "00000000000000"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"cnpj": ["CNPJ inválido."]})
+
+    def test_legacy_invalid_cnpj_does_not_block_other_edits(self):
+        # CNPJs gravados antes da validação
+        company = Company.objects.create(name="Antiga", cnpj="49070919000")
+
+        response = self.client.patch(
+            reverse("company-detail", args=[company.pk]), {"name": "Renomeada"}
+        )
+        self.assertEqual(response.status_code, 200)
+        company.refresh_from_db()
+        self.assertEqual(company.name, "Renomeada")
+
+    def test_valid_cnpj_is_accepted(self):
+        cnpj = fake_cnpj()
+        response = self.client.post(
+            reverse("company-list"), {"name": "Nova", "cnpj": cnpj}
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Company.objects.filter(cnpj=cnpj).exists())
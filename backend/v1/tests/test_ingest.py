@@ -0,0 +1,193 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from django.db import DataError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Check, CheckAction, IngestCheckpoint
+from ..services import CheckIngestor, CheckRejected, ingest_check, record_check
+from ..services.ingest import MAX_ATTEMPTS, SNAPSHOT_TTL
+from .factories import make_event, make_user
+
+
+class IngestTestCase(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.log_path = Path(tmp.name) / "check_ingest.log"
+        _, (self.link,) = make_event()
+
+    def start_ingestor(self):
+        ingestor = CheckIngestor(self.log_path)
+        ingestor.start(background=False)
+        self.addCleanup(ingestor.stop)
+        return ingestor
+
+
+class RecoveryTests(IngestTestCase):
+    def test_torn_line_is_dropped_before_new_entries(self):
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+        ingestor.stop()
+        # Queda no meio de uma escrita: entrada nunca confirmada
+        with open(self.log_path, "a", encoding="utf-8") as log:
+            log.write('{"seq": 2, "events_st')
+
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.CHECK_IN)
+        ingestor.submit(self.link.pk, CheckAction.CHECK_OUT)
+        ingestor._log.close()  # queda antes do flush
+
+        ingestor = CheckIngestor(self.log_path)
+        with self.assertLogs("v1.services.ingest", "WARNING"):
+            self.assertEqual(ingestor.start(background=False), 2)
+        self.addCleanup(ingestor.stop)
+        self.assertEqual(
+            list(Check.objects.order_by("id").values_list("action", flat=True)),
+            [CheckAction.REGISTRATION, CheckAction.CHECK_IN, CheckAction.CHECK_OUT],
+        )
+
+
+class DeadLetterTests(IngestTestCase):
+    def test_persistent_error_goes_to_dead_letter(self):
+        ingestor = self.start_ingestor()
+        entry = ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+
+        with mock.patch.object(
+            CheckIngestor, "_commit", side_effect=DataError("valor inválido")
+        ):
+            for _ in range(MAX_ATTEMPTS - 1):
+                with self.assertRaises(DataError):
+                    ingestor.flush()
+            with self.assertLogs("v1.services.ingest", "ERROR"):
+                self.assertEqual(ingestor.flush(), 1)
+
+        (dead,) = ingestor.dead_letter_path.read_text().splitlines()
+        self.assertEqual(json.loads(dead)["seq"], entry["seq"])
+        self.assertEqual(
+            IngestCheckpoint.objects.get(name=ingestor.name).sequence, entry["seq"]
+        )
+        self.assertEqual(ingestor.flush(), 0)
+        self.assertFalse(Check.objects.exists())
+
+    def test_only_failing_rows_go_to_dead_letter(self):
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+        ingestor.submit(self.link.pk, CheckAction.CHECK_IN)
+        original = CheckIngestor._commit
+
+        def commit(self, batch):
+            if len(batch) > 1 or batch[0]["action"] == CheckAction.CHECK_IN:
+                raise DataError("valor inválido")
+            original(self, batch)
+
+        with mock.patch.object(CheckIngestor, "_commit", commit):
+            for _ in range(MAX_ATTEMPTS - 1):
+                with self.assertRaises(DataError):
+                    ingestor.flush()
+            with self.assertLogs("v1.services.ingest", "ERROR"):
+                ingestor.flush()
+
+        self.assertEqual(Check.objects.count(), 1)
+        self.assertEqual(len(ingestor.dead_letter_path.read_text().splitlines()), 1)
+
+
+class LockedLogTests(IngestTestCase):
+    def setUp(self):
+        super().setUp()
+        # Outro worker está com o log
+        self.start_ingestor()
+        settings_override = override_settings(CHECK_INGEST_LOG=self.log_path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        patcher = mock.patch.multiple(
+            "v1.services.ingest", _ingestor=None, _busy_until=0.0
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_falls_back_to_record_check(self):
+        entry = ingest_check(self.link.pk, CheckAction.REGISTRATION)
+
+        self.assertIsNone(entry["seq"])
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.registration_check.action, entry["action"])
+
+        with self.assertRaises(CheckRejected):
+            ingest_check(self.link.pk, CheckAction.REGISTRATION)
+
+
+class SnapshotRefreshTests(IngestTestCase):
+    def test_direct_writes_are_seen_after_a_rejection(self):
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+        ingestor.flush()
+        # Gravado por um worker sem o log
+        record_check(self.link, CheckAction.CHECK_IN)
+
+        entry = ingestor.submit(self.link.pk, CheckAction.CHECK_OUT)
+
+        self.assertEqual(entry["action"], CheckAction.CHECK_OUT)
+        with self.assertRaises(CheckRejected):
+            ingestor.submit(self.link.pk, CheckAction.CHECK_OUT)
+
+    def later(self):
+        """Relógio depois do SNAPSHOT_TTL dos snapshots carregados até aqui"""
+        return mock.patch(
+            "v1.services.ingest.time.monotonic",
+            return_value=time.monotonic() + SNAPSHOT_TTL + 1,
+        )
+
+    def test_direct_writes_are_seen_after_the_ttl(self):
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+        ingestor.flush()
+        # Gravado por um worker sem o log
+        record_check(self.link, CheckAction.CHECK_IN)
+
+        with self.later(), self.assertRaises(CheckRejected):
+            ingestor.submit(self.link.pk, CheckAction.CHECK_IN)
+
+    def test_pending_entries_survive_a_reload(self):
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+
+        with self.later():
+            ingestor.submit(self.link.pk, CheckAction.CHECK_IN)
+        self.assertEqual(ingestor.flush(), 2)
+
+    def test_idle_events_are_evicted(self):
+        ingestor = self.start_ingestor()
+        ingestor.submit(self.link.pk, CheckAction.REGISTRATION)
+        _, (other,) = make_event()
+
+        with self.later():
+            ingestor.submit(other.pk, CheckAction.REGISTRATION)
+
+        self.assertEqual(set(ingestor._state), {other.pk})
+
+
+@override_settings(CHECK_INGEST_MODE="buffered")
+class BufferedCheckViewTests(IngestTestCase):
+    def test_rejection_uses_non_field_errors(self):
+        client = APIClient()
+        client.force_authenticate(make_user())
+        ingestor = self.start_ingestor()
+
+        with mock.patch("v1.services.ingest.get_ingestor", return_value=ingestor):
+            response = client.post(
+                reverse("check-list"),
+                {"events_staff": self.link.pk, "action": CheckAction.CHECK_IN},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"non_field_errors": ["Staff não credenciado (Registration Required)."]},
+        )
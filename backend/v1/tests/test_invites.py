@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from django.db import OperationalError, connection
+from django.test import TestCase, TransactionTestCase
+
+from ..models import User, UserInvite, UserRole
+from ..services import InviteUnavailable, register_with_invite
+from .factories import make_company
+
+
+def make_invite(**fields):
+    return UserInvite.objects.create(
+        company=make_company(), role=UserRole.CONTROL, **fields
+    )
+
+
+class RegisterWithInviteTests(TestCase):
+    def test_signup_queries(self):
+        invite = make_invite()
+        # SELECT do convite, INSERT do usuário e UPDATE condicional do
+        # convite, dentro de um savepoint (a transação do próprio TestCase)
+        with self.assertNumQueries(5):
+            user = register_with_invite(invite.id, "novo@example.com", "Novo")
+
+        invite.refresh_from_db()
+        self.assertEqual(invite.used_by, user)
+        self.assertEqual(user.company_id, invite.company_id)
+
+    def test_used_invite_is_rejected(self):
+        invite = make_invite()
+        register_with_invite(invite.id, "primeiro@example.com", "Primeiro")
+
+        with self.assertNumQueries(1):
+            with self.assertRaises(InviteUnavailable):
+                register_with_invite(invite.id, "segundo@example.com", "Segundo")
+        self.assertFalse(User.objects.filter(email="segundo@example.com").exists())
+
+
+class InviteRaceTests(TransactionTestCase):
+    """Várias pessoas usando o mesmo convite ao mesmo tempo"""
+
+    threads = 8
+
+    def test_single_signup_wins(self):
+        invite = make_invite()
+        barrier = Barrier(self.threads)
+
+        def attempt(index):
+            try:
+                barrier.wait()
+                register_with_invite(invite.id, f"race{index}@example.com", "race")
+                return "accepted"
+            except InviteUnavailable:
+                return "rejected"
+            except OperationalError:
+                # SQLite: escritas concorrentes falham com "database is locked"
+                return "db_error"
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            outcomes = list(pool.map(attempt, range(self.threads)))
+
+        self.assertEqual(outcomes.count("accepted"), 1)
+        self.assertEqual(User.objects.filter(email__startswith="race").count(), 1)
+        invite.refresh_from_db()
+        self.assertIsNotNone(invite.used_by_id)
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import EmailOutbox, OutboxStatus
+from ..services.mail import _claim_batch, drain_outbox
+
+
+class OutboxClaimTests(TestCase):
+    def setUp(self):
+        EmailOutbox.objects.bulk_create(
+            EmailOutbox(to=f"user{i}@example.com", subject="s", body="b")
+            for i in range(3)
+        )
+
+    def test_claimed_rows_are_not_claimed_again(self):
+        first = _claim_batch(batch_size=2, max_attempts=5)
+        second = _claim_batch(batch_size=10, max_attempts=5)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({m.pk for m in first} & {m.pk for m in second})
+        self.assertEqual(_claim_batch(batch_size=10, max_attempts=5), [])
+
+    def test_expired_lease_returns_to_queue(self):
+        claimed = _claim_batch(batch_size=10, max_attempts=5)
+        EmailOutbox.objects.filter(pk=claimed[0].pk).update(
+            claimed_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        (reclaimed,) = _claim_batch(batch_size=10, max_attempts=5)
+        self.assertEqual(reclaimed.pk, claimed[0].pk)
+        self.assertEqual(reclaimed.attempts, 2)
+
+    def test_drain_sends_each_message_once(self):
+        self.assertEqual(drain_outbox(), (3, 0))
+        self.assertEqual(drain_outbox(), (0, 0))
+        self.assertEqual(
+            EmailOutbox.objects.filter(status=OutboxStatus.SENT).count(), 3
+        )
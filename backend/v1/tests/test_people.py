@@ -0,0 +1,61 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..benchmarks.fixtures import fake_cpf
+from ..models import EventsStaff, Person, Staff
+from ..services import duplicate_groups
+from .factories import make_company, make_event, make_user
+
+
+class PersonLinkTests(TestCase):
+    def test_cpf_change_relinks_person(self):
+        staff = Staff.objects.create(
+            name="Ana", cpf=fake_cpf(1), company=make_company()
+        )
+        old_person = staff.person
+
+        staff = Staff.objects.get(pk=staff.pk)
+        staff.cpf = fake_cpf(2)
+        staff.save(update_fields=["cpf"])
+
+        staff.refresh_from_db()
+        self.assertNotEqual(staff.person_id, old_person.pk)
+        self.assertEqual(staff.person.cpf, fake_cpf(2))
+
+    def test_unchanged_cpf_keeps_person(self):
+        staff = Staff.objects.create(
+            name="Ana", cpf=fake_cpf(1), company=make_company()
+        )
+        staff = Staff.objects.get(pk=staff.pk)
+        staff.name = "Ana Maria"
+        with self.assertNumQueries(1):
+            staff.save()
+
+
+class PersonQueriesTests(TestCase):
+    def setUp(self):
+        self.event, (self.link,) = make_event()
+        other = make_company()
+        self.twin = Staff.objects.create(
+            name="staff 0", cpf=self.link.staff.cpf, company=other
+        )
+        other_event, _ = make_event(staff_count=0, company=other)
+        EventsStaff.objects.create(
+            event=other_event, staff=self.twin, staff_cpf=self.twin.cpf
+        )
+
+    def test_duplicate_groups_by_person(self):
+        (group,) = duplicate_groups()
+        self.assertEqual(group["person"], self.twin.person_id)
+        self.assertEqual(group["cpf"], self.twin.cpf)
+        self.assertEqual(group["staffs"], 2)
+        self.assertEqual(group["companies"], 2)
+
+    def test_history_spans_companies(self):
+        client = APIClient()
+        client.force_authenticate(make_user())
+        response = client.get(reverse("staff-history", args=[self.link.staff_id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["summary"]["events"], 2)
+        self.assertEqual(Person.objects.count(), 1)
@@ -0,0 +1,55 @@
+from django.test import TestCase, override_settings
+
+from ..benchmarks.fixtures import fake_cpf
+from ..models import EventsStaff, Person, Staff
+from ..query_guard import ImplicitQueryError, _guarded
+from .factories import make_company, make_event
+
+
+def _save_reading_company(staff, *args, **kwargs):
+    staff.company.name  # FK não carregada: SELECT escondido
+    return Staff.save(staff, *args, **kwargs)
+
+
+class SaveQueryGuardTests(TestCase):
+    def setUp(self):
+        staff = Staff.objects.create(
+            name="Ana", cpf=fake_cpf(1), company=make_company()
+        )
+        self.staff = Staff.objects.get(pk=staff.pk)
+        self.save = _guarded(_save_reading_company)
+
+    def test_suite_runs_in_raise_mode(self):
+        with self.assertRaises(ImplicitQueryError):
+            self.save(self.staff)
+
+    @override_settings(SAVE_QUERY_GUARD="warn")
+    def test_warn_mode_logs(self):
+        with self.assertLogs("v1.query_guard", "WARNING"):
+            self.save(self.staff)
+
+    @override_settings(SAVE_QUERY_GUARD="off")
+    def test_off_mode_ignores(self):
+        self.save(self.staff)
+
+    def test_allowed_tables_do_not_raise(self):
+        # Staff.save consulta/cria Person: "people" está em save_query_tables
+        self.staff.cpf = fake_cpf(2)
+        self.staff.save()
+
+        self.assertTrue(Person.objects.filter(cpf=fake_cpf(2)).exists())
+
+
+class EventsStaffSaveTests(TestCase):
+    def test_unloaded_staff_without_cpf_raises(self):
+        event, _ = make_event(staff_count=0)
+        staff = Staff.objects.create(
+            name="Ana", cpf=fake_cpf(1), company=make_company()
+        )
+
+        with self.assertRaises(ValueError):
+            EventsStaff(event=event, staff_id=staff.pk).save()
+
+        link = EventsStaff(event=event, staff=staff)
+        link.save()
+        self.assertEqual(link.staff_cpf, staff.cpf)
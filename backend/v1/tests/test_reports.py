@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..models import Check, CheckAction, Status
+from ..reports import check_histogram, invalidate_histogram, throughput
+from ..services import record_check
+from .factories import make_event, make_user
+
+
+class ClosedEventHistogramCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.event, (self.link,) = make_event()
+        record_check(self.link, CheckAction.REGISTRATION)
+        self.event.status = Status.CLOSE
+        self.event.save()
+
+        rows = mock.patch.object(
+            throughput, "_histogram_rows", wraps=throughput._histogram_rows
+        )
+        self.rows = rows.start()
+        self.addCleanup(rows.stop)
+        check_histogram(self.event)
+
+    def test_checks_of_other_events_keep_the_cache(self):
+        _, (other,) = make_event()
+        with self.captureOnCommitCallbacks(execute=True):
+            record_check(other, CheckAction.REGISTRATION)
+
+        check_histogram(self.event)
+        self.assertEqual(self.rows.call_count, 1)
+
+    def test_new_check_of_the_event_refreshes(self):
+        record_check(self.link, CheckAction.CHECK_IN)
+
+        buckets = check_histogram(self.event)
+        self.assertEqual(self.rows.call_count, 2)
+        self.assertEqual(sum(bucket["count"] for bucket in buckets), 2)
+
+    def test_edited_check_refreshes(self):
+        Check.objects.filter(events_staff=self.link).update(action=CheckAction.CHECK_IN)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_histogram(self.event.id)
+
+        (bucket,) = check_histogram(self.event)
+        self.assertEqual(bucket["action"], CheckAction.CHECK_IN)
+
+
+class ProjectAnalyticsDateTests(TestCase):
+    def setUp(self):
+        event, _ = make_event()
+        self.url = reverse("project-analytics", args=[event.project_id])
+        self.client = APIClient()
+        self.client.force_authenticate(make_user())
+
+    def test_valid_range(self):
+        response = self.client.get(self.url, {"from": "2024-02-01", "to": "2024-02-29"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_dates_return_400(self):
+        for value in ("2024-02-30", "abc"):
+            response = self.client.get(self.url, {"from": value})
+            self.assertEqual(response.status_code, 400, value)
+            self.assertIn("from", response.json())
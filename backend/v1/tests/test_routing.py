@@ -0,0 +1,58 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..db_routing import _read_alias
+from ..models import EventsStaff
+from ..reports import double_bookings
+from ..views import StaffViewSet
+from .factories import make_event, make_user
+
+
+# Sem réplica nos testes: o próprio "default" faz o papel dela
+@override_settings(REPLICA_DATABASE="default")
+class ReplicaReadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.event, (self.link,) = make_event()
+        self.client = APIClient()
+        self.client.force_authenticate(make_user())
+        self.aliases = []
+
+        original = StaffViewSet.get_queryset
+
+        def spy(view):
+            self.aliases.append(_read_alias.get())
+            return original(view)
+
+        patcher = mock.patch.object(StaffViewSet, "get_queryset", spy)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_list_reads_from_primary(self):
+        response = self.client.get(reverse("staff-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.aliases, [None])
+
+    def test_uncached_action_reads_from_replica(self):
+        response = self.client.get(reverse("staff-history", args=[self.link.staff_id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.aliases, ["default"])
+
+    def test_double_bookings_uses_read_alias(self):
+        other, _ = make_event(staff_count=0)
+        staff = self.link.staff
+        EventsStaff.objects.create(event=other, staff=staff, staff_cpf=staff.cpf)
+
+        with mock.patch(
+            "v1.reports.calendar.router.db_for_read", return_value="default"
+        ) as db_for_read:
+            rows = double_bookings([self.event.pk, other.pk])
+
+        db_for_read.assert_called_once_with(EventsStaff)
+        self.assertEqual(rows, [(staff.cpf, self.event.pk, other.pk)])
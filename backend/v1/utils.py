@@ -1,6 +1,9 @@
 # core/utils.py
 import re
+import unicodedata
 
+from django.conf import settings
+from django.db import connections, router
 from nanoid import generate
 
 
@@ -9,11 +12,59 @@ def generate_nano_id():
     return generate(size=21)
 
 
+_NON_DIGITS = re.compile(r"\D")
+
+
 def sanitize_digits(value):
     """Remove tudo que não for dígito"""
     if not value:
         return ""
-    return re.sub(r"\D", "", value)
+    # isdecimal() é exatamente a classe \d do re: entrada já limpa volta igual
+    if value.isdecimal():
+        return value
+    # Máscaras de CPF/CNPJ: str.replace é mais rápido que regex/translate
+    stripped = value.replace(".", "").replace("-", "").replace("/", "")
+    if stripped.isdecimal():
+        return stripped
+    return _NON_DIGITS.sub("", stripped)
+
+
+def sanitize_digits_many(values):
+    """sanitize_digits para uma lista inteira (importações em massa)"""
+    sanitize = sanitize_digits
+    return [sanitize(value) for value in values]
+
+
+def build_invite_url(invite_id):
+    """URL do frontend para aceitar um convite"""
+    return f"{settings.FRONTEND_URL}/signup?invite={invite_id}"
+
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_search_text(value):
+    """Minúsculas, sem acentos e apenas letras/dígitos separados por espaço"""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_ALNUM.sub(" ", stripped.lower()).split())
+
+
+def upsert_options(model, unique_fields, update_fields):
+    """
+    kwargs de bulk_create para um upsert em qualquer backend.
+
+    PostgreSQL/SQLite exigem o alvo do conflito (ON CONFLICT (...)); o MySQL
+    não aceita um (ON DUPLICATE KEY UPDATE vale para qualquer chave única),
+    então `unique_fields` só é passado quando o backend suporta.
+    """
+    features = connections[router.db_for_write(model)].features
+    options = {"update_conflicts": True, "update_fields": update_fields}
+    if features.supports_update_conflicts_with_target:
+        options["unique_fields"] = unique_fields
+    return options
 
 
 # Constantes de Enums
@@ -1,9 +1,22 @@
+from .async_views import (
+    AsyncDashboardMetricsView,
+    AsyncEventOverviewView,
+    ControlRosterView,
+    StaffLookupView,
+)
 from .auth_views import GoogleLoginView, RegisterWithInviteView
 from .check_views import CheckViewSet
 from .companies_views import CompanySetView
 from .dashboard_views import DashboardMetricsView
 from .events_views import EventOverviewView, EventStaffBulkView, EventViewSet
 from .invites_views import InviteViewSet
+from .participations_views import ParticipationViewSet
 from .projects_views import ProjectViewSet
+from .reports_views import (
+    EventAttendanceView,
+    EventCheckHistogramView,
+    ProjectAnalyticsView,
+    ProjectAttendanceView,
+)
 from .staff_views import StaffViewSet
 from .users_views import UserSetView
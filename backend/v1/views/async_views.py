@@ -0,0 +1,235 @@
+"""
+Versões assíncronas (Django async views + ORM assíncrono) das leituras
+mais acessadas: busca por CPF, overview do evento, métricas do dashboard
+e lista de presença da equipe de controle.
+
+Sob ASGI, uma conexão lenta não prende uma thread/worker enquanto o
+cliente envia a requisição ou lê a resposta. O DRF é síncrono, então a
+autenticação JWT é feita aqui: o token é validado em memória e o
+usuário é buscado com o ORM assíncrono.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.views import View
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from ..db_routing import aread_alias_for, reading_from
+from ..models import (
+    CheckAction,
+    Company,
+    Event,
+    EventsStaff,
+    Project,
+    Staff,
+    Status,
+    User,
+    UserRole,
+)
+from ..pagination import StandardPagination
+from ..services import last_movement_subquery
+from ..utils import sanitize_digits
+
+_jwt = JWTAuthentication()
+
+
+async def authenticate(request):
+    """Usuário ativo do header `Authorization: Bearer <token>` ou None"""
+    header = _jwt.get_header(request)
+    raw_token = _jwt.get_raw_token(header) if header else None
+    if raw_token is None:
+        return None
+    try:
+        token = _jwt.get_validated_token(raw_token)
+    except (InvalidToken, TokenError):
+        return None
+    user_id = token.get(jwt_settings.USER_ID_CLAIM)
+    return await User.objects.filter(
+        **{jwt_settings.USER_ID_FIELD: user_id}, is_active=True
+    ).afirst()
+
+
+def _error(detail, status):
+    return JsonResponse({"detail": detail}, status=status)
+
+
+class AsyncAPIView(View, metaclass=ABCMeta):
+    """
+    Base das views assíncronas: autenticação JWT e checagem de papel.
+
+    Subclasses implementam `async def handle(request, user, **kwargs)`.
+    """
+
+    http_method_names = ["get"]
+    # None: qualquer usuário autenticado
+    roles = None
+    # Lê da réplica (v1/db_routing.py), se configurada
+    replica = False
+
+    async def get(self, request, *args, **kwargs):
+        user = await authenticate(request)
+        if user is None:
+            return _error("Authentication credentials were not provided.", 401)
+        if self.roles is not None and user.role not in self.roles:
+            return _error("You do not have permission to perform this action.", 403)
+        if not self.replica:
+            return await self.handle(request, user, **kwargs)
+        with reading_from(await aread_alias_for(user)):
+            return await self.handle(request, user, **kwargs)
+
+    @abstractmethod
+    async def handle(self, request, user, **kwargs):
+        """Resposta para o usuário já autenticado e autorizado"""
+
+
+class StaffLookupView(AsyncAPIView):
+    """
+    Busca de staff por CPF (portaria). Com `?event=`, inclui o vínculo
+    com o evento: credenciamento e último movimento.
+    """
+
+    roles = [UserRole.ADMIN, UserRole.CONTROL, UserRole.COMPANY]
+
+    async def handle(self, request, user):
+        cpf = sanitize_digits(request.GET.get("cpf"))
+        if len(cpf) != 11:
+            return _error("cpf must have 11 digits", 400)
+
+        staffs = Staff.objects.filter(cpf=cpf).select_related("company")
+        if user.role == UserRole.COMPANY:
+            staffs = staffs.filter(company_id=user.company_id)
+
+        links = {}
+        event_id = request.GET.get("event")
+        if event_id:
+            if not event_id.isdigit():
+                return _error("event must be an integer", 400)
+            async for link in (
+                EventsStaff.objects.filter(event_id=event_id, staff_cpf=cpf)
+                .annotate(last_action=last_movement_subquery())
+                .values("id", "staff_id", "registration_check_id", "last_action")
+            ):
+                links[link["staff_id"]] = link
+
+        results = []
+        async for staff in staffs:
+            item = {
+                "id": staff.id,
+                "name": staff.name,
+                "cpf": staff.cpf,
+                "company": staff.company_id,
+                "company_name": staff.company.name,
+            }
+            if event_id:
+                link = links.get(staff.id)
+                item["events_staff"] = link["id"] if link else None
+                item["registered"] = bool(link and link["registration_check_id"])
+                item["last_action"] = link["last_action"] if link else None
+            results.append(item)
+        return JsonResponse({"cpf": cpf, "results": results})
+
+
+class AsyncEventOverviewView(AsyncAPIView):
+    """Mesmo payload de EventOverviewView"""
+
+    async def handle(self, request, user, pk):
+        event = await Event.objects.filter(pk=pk).afirst()
+        if event is None:
+            return _error("Not found.", 404)
+        # Evento arquivado: os vínculos estão em archived_events_staff
+        staffs = (
+            event.archived_staffs
+            if event.archived_at is not None
+            else event.event_staffs
+        )
+        return JsonResponse(
+            {
+                "name": event.name,
+                "total_staff": await staffs.acount(),
+                "status": event.status,
+            }
+        )
+
+
+class AsyncDashboardMetricsView(AsyncAPIView):
+    """Mesmo payload de DashboardMetricsView"""
+
+    replica = True
+
+    async def handle(self, request, user):
+        return JsonResponse(
+            {
+                "activeEvents": await Event.objects.filter(status=Status.OPEN).acount(),
+                "totalProjects": await Project.objects.acount(),
+                "totalCompanies": await Company.objects.acount(),
+                "totalUsers": await User.objects.acount(),
+            }
+        )
+
+
+class ControlRosterView(AsyncAPIView):
+    """
+    Lista de presença do evento para a equipe de controle: cada staff
+    vinculado com credenciamento e se está no local (último movimento é
+    um check-in). Paginada como StandardPagination (?page=, ?page_size=).
+    """
+
+    roles = [UserRole.ADMIN, UserRole.CONTROL]
+
+    async def handle(self, request, user, pk):
+        if not await Event.objects.filter(pk=pk).aexists():
+            return _error("Not found.", 404)
+
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+            page_size = int(request.GET.get("page_size", StandardPagination.page_size))
+            page_size = min(max(page_size, 1), StandardPagination.max_page_size)
+        except ValueError:
+            return _error("page and page_size must be integers", 400)
+
+        links = EventsStaff.objects.filter(event_id=pk)
+        totals = await links.aaggregate(
+            count=Count("id"),
+            registered=Count("id", filter=Q(registration_check__isnull=False)),
+        )
+
+        offset = (page - 1) * page_size
+        rows = (
+            links.annotate(last_action=last_movement_subquery())
+            .values(
+                "id",
+                "staff_id",
+                "staff_cpf",
+                "staff__name",
+                "staff__company_id",
+                "staff__company__name",
+                "registration_check_id",
+                "last_action",
+            )
+            .order_by("staff__name", "id")[offset : offset + page_size]
+        )
+        results = [
+            {
+                "events_staff": row["id"],
+                "staff": row["staff_id"],
+                "name": row["staff__name"],
+                "cpf": row["staff_cpf"],
+                "company": row["staff__company_id"],
+                "company_name": row["staff__company__name"],
+                "registered": row["registration_check_id"] is not None,
+                "on_site": row["last_action"] == CheckAction.CHECK_IN,
+            }
+            async for row in rows
+        ]
+        return JsonResponse(
+            {
+                "count": totals["count"],
+                "registered": totals["registered"],
+                "page": page,
+                "results": results,
+            }
+        )
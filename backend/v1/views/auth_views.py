@@ -1,15 +1,19 @@
-from django.conf import settings
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token
 from rest_framework import status, views
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from ..models import User, UserInvite
+from ..models import User
 from ..serializers import (
     UserSerializer,
 )
+from ..services import (
+    InviteError,
+    InviteNotFound,
+    UserAlreadyExists,
+    register_with_invite,
+    verify_google_token,
+)
 
 # --- Auth Views ---
 
@@ -20,9 +24,7 @@ class GoogleLoginView(views.APIView):
     def post(self, request):
         token = request.data.get("token")
         try:
-            idinfo = id_token.verify_oauth2_token(
-                token, google_requests.Request(), settings.GOOGLE_CLIENT_ID
-            )
+            idinfo = verify_google_token(token)
             email = idinfo["email"]
         except ValueError:
             return Response(
@@ -55,47 +57,22 @@ class RegisterWithInviteView(views.APIView):
         name = request.data.get("name")
 
         try:
-            idinfo = id_token.verify_oauth2_token(
-                google_token, google_requests.Request(), settings.GOOGLE_CLIENT_ID
-            )
+            idinfo = verify_google_token(google_token)
             email = idinfo["email"]
         except ValueError:
             return Response(
                 {"error": "Invalid Google Token"}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Convite validado, usuário criado e convite consumido em uma transação
         try:
-            invite = UserInvite.objects.get(id=token)
-        except UserInvite.DoesNotExist:
-            return Response(
-                {"error": "Invalid invite token"}, status=status.HTTP_404_NOT_FOUND
-            )
-
-        # Validação do Slot
-        if invite.status != "pending":
-            return Response(
-                {"error": f"Invite is {invite.status}"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        if invite.email and invite.email != email:
-            return Response(
-                {"error": "Email does not match invite restriction"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Criação do usuário
-        user = User.objects.create_user(
-            email=email,
-            name=name,
-            role=invite.role,
-            company=invite.company,
-            created_by=invite.created_by,  # Admin que gerou o convite
-        )
-
-        # Consome o slot
-        invite.used_by = user
-        invite.save()
+            user = register_with_invite(token, email, name)
+        except InviteNotFound as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+        except UserAlreadyExists as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
+        except InviteError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         refresh = RefreshToken.for_user(user)
         return Response(
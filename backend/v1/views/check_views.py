@@ -1,10 +1,15 @@
-from rest_framework import viewsets
+from django.conf import settings
+from rest_framework import serializers, status, viewsets
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 from ..models import Check
 from ..permissions import IsControlOrAdmin
 from ..serializers import (
+    CheckIngestSerializer,
     CheckSerializer,
 )
+from ..services import CheckRejected, ingest_check
 
 
 class CheckViewSet(viewsets.ModelViewSet):
@@ -16,3 +21,23 @@ class CheckViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         return Check.objects.all().order_by("-timestamp")
+
+    def create(self, request, *args, **kwargs):
+        if settings.CHECK_INGEST_MODE != "buffered":
+            return super().create(request, *args, **kwargs)
+
+        # Picos de portão: confirma após o log local; o INSERT vem em lote
+        serializer = CheckIngestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            entry = ingest_check(
+                serializer.validated_data["events_staff"],
+                serializer.validated_data["action"],
+                user_control=request.user,
+            )
+        except CheckRejected as exc:
+            # Mesmo formato do modo direto (CheckSerializer)
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [str(exc)]}
+            )
+        return Response(entry, status=status.HTTP_202_ACCEPTED)
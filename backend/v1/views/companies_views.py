@@ -1,12 +1,21 @@
 from rest_framework import viewsets
 
+from ..cache import CachedResponseMixin
+from ..db_routing import ReplicaReadMixin
 from ..mixins import AdminWriteCompanyReadMixin, CreatedByMixin
 from ..models import Company
 from ..permissions import IsControlOrAdmin
 from ..serializers import CompanySerializer
 
 
-class CompanySetView(CreatedByMixin, AdminWriteCompanyReadMixin, viewsets.ModelViewSet):
+class CompanySetView(
+    ReplicaReadMixin,
+    CachedResponseMixin,
+    CreatedByMixin,
+    AdminWriteCompanyReadMixin,
+    viewsets.ModelViewSet,
+):
+    cache_namespaces = ("company",)
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [IsControlOrAdmin]
@@ -2,10 +2,11 @@ from rest_framework import views
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from ..db_routing import ReplicaReadMixin
 from ..models import Company, Event, Project, User
 
 
-class DashboardMetricsView(views.APIView):
+class DashboardMetricsView(ReplicaReadMixin, views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
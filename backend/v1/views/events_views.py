@@ -1,17 +1,33 @@
+from django.utils.dateparse import parse_date
 from rest_framework import generics, status, views, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
+from ..cache import CachedResponseMixin
+from ..db_routing import ReplicaReadMixin
 from ..mixins import AdminWriteCompanyReadMixin, CreatedByMixin
-from ..models import Event, EventsStaff, Staff
+from ..models import Event
 from ..permissions import IsAdmin, IsCompanyOrAdmin, IsControlOrAdmin
-from ..serializers import EventSerializer
-from ..utils import sanitize_digits
-
-
-class EventViewSet(CreatedByMixin, AdminWriteCompanyReadMixin, viewsets.ModelViewSet):
+from ..reports import MAX_RANGE_DAYS, event_calendar
+from ..serializers import EventCloneSerializer, EventSerializer
+from ..services import clone_event, link_staffs_to_event
+
+
+class EventViewSet(
+    ReplicaReadMixin,
+    CachedResponseMixin,
+    CreatedByMixin,
+    AdminWriteCompanyReadMixin,
+    viewsets.ModelViewSet,
+):
+    # A visibilidade para empresas depende de Project.company
+    cache_namespaces = ("event", "project")
     queryset = Event.objects.all()
     serializer_class = EventSerializer
+    write_actions = AdminWriteCompanyReadMixin.write_actions + ["clone"]
+    replica_actions = ("list", "calendar")
 
     def list(self, request):
         """Lista de Eventos"""
@@ -35,49 +51,87 @@ class EventViewSet(CreatedByMixin, AdminWriteCompanyReadMixin, viewsets.ModelVie
         serializer = EventSerializer(event)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"])
+    def calendar(self, request):
+        """Eventos sobrepostos a ?from=&to= (datas), por dia, com conflitos"""
+        try:
+            day_from = parse_date(request.query_params.get("from", ""))
+            day_to = parse_date(request.query_params.get("to", ""))
+        except ValueError:
+            day_from = day_to = None
+        if not day_from or not day_to:
+            raise ValidationError({"from": "Informe from e to (AAAA-MM-DD)."})
+        if day_to < day_from or (day_to - day_from).days >= MAX_RANGE_DAYS:
+            raise ValidationError(
+                {"to": f"Intervalo deve ter de 1 a {MAX_RANGE_DAYS} dias."}
+            )
+
+        if request.user.role == "admin" or request.user.role == "control":
+            events, company = Event.objects.all(), None
+        else:
+            events = Event.objects.filter(project__company=request.user.company)
+            company = request.user.company
+        return Response(event_calendar(events, day_from, day_to, company=company))
+
+    @action(detail=True, methods=["post"])
+    def clone(self, request, pk=None):
+        """Copia o evento com suas empresas e (opcional) staffs"""
+        payload = EventCloneSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        event, companies, staffs = clone_event(
+            self.get_object(), created_by=request.user, **payload.validated_data
+        )
+        return Response(
+            {
+                "event": EventSerializer(event).data,
+                "companies": companies,
+                "staffs": staffs,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class EventStaffBulkView(views.APIView):
     permission_classes = [IsCompanyOrAdmin]
 
     def post(self, request, event_id):
-        """Bulk Upsert de Staffs para um evento"""
+        """Bulk Upsert de Staffs para um evento (respeita o staff_limit da empresa)"""
         try:
-            event = Event.objects.get(id=event_id)
+            event = Event.objects.select_related("project").get(id=event_id)
         except Event.DoesNotExist:
             return Response(status=404)
 
-        # Validação de Permissão: O evento deve pertencer à company do usuário
-        if event.project.company != request.user.company:
+        # Validação de Permissão: o evento deve pertencer à company do usuário
+        # ou a company deve participar dele (EventsCompany)
+        is_owner = (
+            event.project is not None
+            and event.project.company_id == request.user.company_id
+        )
+        if (
+            not is_owner
+            and not event.participating_companies.filter(
+                company_id=request.user.company_id
+            ).exists()
+        ):
             return Response(
                 {"error": "Permission denied for this event"},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        staff_list = request.data.get("staffs", [])
-        created_count = 0
-
-        for item in staff_list:
-            cpf = sanitize_digits(item.get("cpf"))
-            name = item.get("name")
-
-            # 1. Upsert Staff na Company do User
-            staff, _ = Staff.objects.update_or_create(
-                company=request.user.company,
-                cpf=cpf,
-                defaults={"name": name, "created_by": request.user},
-            )
-
-            # 2. Vincular ao Evento
-            _, created = EventsStaff.objects.get_or_create(
-                event=event,
-                staff_cpf=cpf,
-                defaults={"staff": staff, "created_by": request.user},
+        if event.archived_at is not None:
+            return Response(
+                {"error": "Event is archived"}, status=status.HTTP_400_BAD_REQUEST
             )
-            if created:
-                created_count += 1
 
+        result = link_staffs_to_event(
+            event,
+            request.user.company,
+            request.data.get("staffs", []),
+            created_by=request.user,
+        )
         return Response(
-            {"message": f"{created_count} staffs linked to event"}, status=200
+            {"message": f"{result['linked']} staffs linked to event", **result},
+            status=200,
         )
 
 
@@ -88,7 +142,13 @@ class EventOverviewView(generics.RetrieveAPIView):
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         # Lógica customizada de agregação aqui
-        staff_count = instance.event_staffs.count()
+        # Evento arquivado: os vínculos estão em archived_events_staff
+        staffs = (
+            instance.archived_staffs
+            if instance.archived_at is not None
+            else instance.event_staffs
+        )
+        staff_count = staffs.count()
         return Response(
             {
                 "name": instance.name,
@@ -1,12 +1,18 @@
-from rest_framework import mixins, viewsets
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
+from ..db_routing import ReplicaReadMixin
 from ..mixins import CreatedByMixin
-from ..models import UserInvite
+from ..models import InviteStatus, UserInvite
 from ..permissions import IsAdmin
-from ..serializers import InviteSerializer
+from ..serializers import InviteBulkSerializer, InviteSerializer
+from ..services import create_invites
 
 
 class InviteViewSet(
+    ReplicaReadMixin,
     CreatedByMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
@@ -14,6 +20,31 @@ class InviteViewSet(
     mixins.DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
-    queryset = UserInvite.objects.all()
     serializer_class = InviteSerializer
     permission_classes = [IsAdmin]
+
+    def get_queryset(self):
+        queryset = UserInvite.objects.with_status().order_by("-created_at")
+
+        # ?status=pending|used|expired filtrado no banco
+        status_param = self.request.query_params.get("status")
+        if status_param:
+            if status_param not in InviteStatus.values:
+                raise ValidationError(
+                    {"status": f"Use um de: {', '.join(InviteStatus.values)}"}
+                )
+            queryset = queryset.filter_status(status_param)
+        return queryset
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Cria convites em massa e enfileira os e-mails (drain_outbox envia)"""
+        payload = InviteBulkSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        invites = create_invites(
+            created_by=request.user,
+            **payload.validated_data,
+        )
+        return Response(
+            InviteSerializer(invites, many=True).data, status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,84 @@
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from ..db_routing import ReplicaReadMixin
+from ..mixins import AdminWriteCompanyReadMixin
+from ..models import Event, EventsCompany
+from ..serializers import EventsCompanySerializer, ParticipationBulkSerializer
+from ..services import assign_companies, participation_matrix
+
+
+def _int_list(value, name):
+    try:
+        return [int(item) for item in value.split(",") if item]
+    except ValueError:
+        raise ValidationError({name: "Use ids separados por vírgula."})
+
+
+class ParticipationViewSet(
+    ReplicaReadMixin, AdminWriteCompanyReadMixin, viewsets.ModelViewSet
+):
+    """Participação de empresas em eventos (EventsCompany)"""
+
+    serializer_class = EventsCompanySerializer
+    write_actions = AdminWriteCompanyReadMixin.write_actions + ["bulk"]
+    replica_actions = ("list", "matrix")
+
+    def get_queryset(self):
+        user = self.request.user
+        queryset = EventsCompany.objects.order_by("event_id", "company_id")
+        if user.role not in ["admin", "control"]:
+            queryset = queryset.filter(company=user.company)
+
+        params = self.request.query_params
+        if params.get("event"):
+            queryset = queryset.filter(event_id__in=_int_list(params["event"], "event"))
+        if params.get("company"):
+            queryset = queryset.filter(
+                company_id__in=_int_list(params["company"], "company")
+            )
+        if params.get("project"):
+            queryset = queryset.filter(
+                event__project_id__in=_int_list(params["project"], "project")
+            )
+        return queryset
+
+    def _matrix(self, event_ids, company_ids=None):
+        if self.request.user.role not in ["admin", "control"]:
+            # Empresas veem apenas a própria coluna
+            company_ids = [self.request.user.company_id]
+        return participation_matrix(event_ids, company_ids)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Atribui todas as empresas a todos os eventos (upsert da matriz)"""
+        payload = ParticipationBulkSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        data = payload.validated_data
+        written = assign_companies(
+            data["events"], data["companies"], data["role"], data["staff_limit"]
+        )
+        matrix = self._matrix(data["events"], data["companies"])
+        return Response({"written": written, **matrix}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def matrix(self, request):
+        """Matriz eventos x empresas (?events=1,2 ou ?project=) com uso da cota"""
+        params = request.query_params
+        if params.get("events"):
+            event_ids = _int_list(params["events"], "events")
+        elif params.get("project"):
+            event_ids = list(
+                Event.objects.filter(
+                    project_id__in=_int_list(params["project"], "project")
+                ).values_list("id", flat=True)
+            )
+        else:
+            raise ValidationError({"events": "Informe events ou project."})
+
+        company_ids = None
+        if params.get("companies"):
+            company_ids = _int_list(params["companies"], "companies")
+        return Response(self._matrix(event_ids, company_ids))
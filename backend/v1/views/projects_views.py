@@ -1,10 +1,41 @@
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
+from ..cache import CachedResponseMixin
+from ..db_routing import ReplicaReadMixin
 from ..mixins import AdminWriteCompanyReadMixin, CreatedByMixin
 from ..models import Project
-from ..serializers import ProjectSerializer
+from ..serializers import CloneSerializer, ProjectSerializer
+from ..services import clone_project
 
 
-class ProjectViewSet(CreatedByMixin, AdminWriteCompanyReadMixin, viewsets.ModelViewSet):
+class ProjectViewSet(
+    ReplicaReadMixin,
+    CachedResponseMixin,
+    CreatedByMixin,
+    AdminWriteCompanyReadMixin,
+    viewsets.ModelViewSet,
+):
+    cache_namespaces = ("project",)
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    write_actions = AdminWriteCompanyReadMixin.write_actions + ["clone"]
+
+    @action(detail=True, methods=["post"])
+    def clone(self, request, pk=None):
+        """Copia o projeto com seus eventos, empresas e (opcional) staffs"""
+        payload = CloneSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        project, events, companies, staffs = clone_project(
+            self.get_object(), created_by=request.user, **payload.validated_data
+        )
+        return Response(
+            {
+                "project": ProjectSerializer(project).data,
+                "events": events,
+                "companies": companies,
+                "staffs": staffs,
+            },
+            status=status.HTTP_201_CREATED,
+        )
@@ -0,0 +1,168 @@
+from django.db.models import Max, Sum
+from django.utils.dateparse import parse_date
+from rest_framework import status, views
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from ..db_routing import ReplicaReadMixin
+from ..models import CheckAction, DailySnapshot, Event, Project
+from ..permissions import IsCompanyOrAdmin, IsControlOrAdmin
+from ..reports import INTERVALS, build_attendance_report, check_histogram
+
+
+def _report_company(user, owner_company_id):
+    """
+    Empresa usada para filtrar o relatório.
+
+    Admin e a empresa dona do projeto veem todos os staffs; as demais
+    empresas veem apenas os seus.
+    """
+    if user.role == "admin" or user.company_id == owner_company_id:
+        return None
+    return user.company
+
+
+class EventAttendanceView(ReplicaReadMixin, views.APIView):
+    """Horas trabalhadas por staff, empresa e dia em um evento"""
+
+    permission_classes = [IsCompanyOrAdmin]
+
+    def get(self, request, pk):
+        try:
+            event = Event.objects.select_related("project").get(id=pk)
+        except Event.DoesNotExist:
+            return Response(status=404)
+
+        owner_id = event.project.company_id if event.project else None
+        report = build_attendance_report(
+            [event.id], company=_report_company(request.user, owner_id)
+        )
+        return Response({"event": event.id, **report.as_dict()})
+
+
+class ProjectAttendanceView(ReplicaReadMixin, views.APIView):
+    """Horas trabalhadas consolidadas de todos os eventos de um projeto"""
+
+    permission_classes = [IsCompanyOrAdmin]
+
+    def get(self, request, pk):
+        try:
+            project = Project.objects.get(id=pk)
+        except Project.DoesNotExist:
+            return Response(status=404)
+
+        event_ids = list(project.events.values_list("id", flat=True))
+        report = build_attendance_report(
+            event_ids, company=_report_company(request.user, project.company_id)
+        )
+        return Response({"project": project.id, **report.as_dict()})
+
+
+class ProjectAnalyticsView(ReplicaReadMixin, views.APIView):
+    """
+    Analytics do projeto lidos apenas dos snapshots diários.
+
+    Aceita `?from=` e `?to=` (YYYY-MM-DD) para limitar o período.
+    """
+
+    permission_classes = [IsCompanyOrAdmin]
+
+    METRICS = {
+        "registered": Sum("registered"),
+        "check_ins": Sum("check_ins"),
+        "check_outs": Sum("check_outs"),
+        "hours": Sum("hours"),
+        # Maior pico registrado em uma célula (evento, empresa, dia)
+        "peak_on_site": Max("peak_on_site"),
+    }
+
+    @staticmethod
+    def _date_param(request, name):
+        value = request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            day = parse_date(value)
+        except ValueError:
+            # Bem formada, mas inexistente (ex.: 2024-02-30)
+            day = None
+        if day is None:
+            raise ValidationError({name: "Data inválida (AAAA-MM-DD)."})
+        return day
+
+    def get(self, request, pk):
+        try:
+            project = Project.objects.get(id=pk)
+        except Project.DoesNotExist:
+            return Response(status=404)
+
+        snapshots = DailySnapshot.objects.filter(project=project)
+        company = _report_company(request.user, project.company_id)
+        if company is not None:
+            snapshots = snapshots.filter(company=company)
+
+        date_from = self._date_param(request, "from")
+        date_to = self._date_param(request, "to")
+        if date_from:
+            snapshots = snapshots.filter(day__gte=date_from)
+        if date_to:
+            snapshots = snapshots.filter(day__lte=date_to)
+
+        def grouped(*fields):
+            return list(
+                snapshots.values(*fields).annotate(**self.METRICS).order_by(*fields)
+            )
+
+        return Response(
+            {
+                "project": project.id,
+                "totals": snapshots.aggregate(**self.METRICS),
+                "events": grouped("event_id", "event__name"),
+                "companies": grouped("company_id", "company__name"),
+                "days": grouped("day"),
+            }
+        )
+
+
+class EventCheckHistogramView(ReplicaReadMixin, views.APIView):
+    """
+    Vazão de checks por portão (operador) em buckets de tempo.
+
+    Parâmetros: `?interval=` (1, 5 ou 15 minutos) e `?action=`.
+    """
+
+    permission_classes = [IsCompanyOrAdmin | IsControlOrAdmin]
+
+    def get(self, request, pk):
+        try:
+            if request.user.role in ["admin", "control"]:
+                event = Event.objects.get(id=pk)
+            else:
+                event = Event.objects.get(id=pk, project__company=request.user.company)
+        except Event.DoesNotExist:
+            return Response(status=404)
+
+        try:
+            interval = int(request.query_params.get("interval", 5))
+        except ValueError:
+            interval = None
+        if interval not in INTERVALS:
+            return Response(
+                {"error": f"interval must be one of {list(INTERVALS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        action = request.query_params.get("action")
+        if action and action not in CheckAction.values:
+            return Response(
+                {"error": f"action must be one of {CheckAction.values}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "event": event.id,
+                "interval": interval,
+                "buckets": check_histogram(event, interval=interval, action=action),
+            }
+        )
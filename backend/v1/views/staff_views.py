@@ -1,21 +1,138 @@
+from django.db.models import Count, Max, Min, Q
+from django.db.models.functions import Now
 from rest_framework import viewsets
+from rest_framework.decorators import action
 
-from ..models import Staff
+from ..cache import CachedResponseMixin
+from ..db_routing import ReplicaReadMixin
+from ..models import ArchivedEventsStaff, CheckAction, EventsStaff, Staff
+from ..pagination import StandardPagination
 from ..permissions import IsCompanyOrAdmin
+from ..reports import hours_by_events_staff, load_check_columns
 from ..serializers import (
     StaffSerializer,
 )
+from ..services import search_staffs
 
 
-class StaffViewSet(viewsets.ModelViewSet):
+class StaffViewSet(ReplicaReadMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    cache_namespaces = ("staff",)
+    replica_actions = ("list", "history")
     serializer_class = StaffSerializer
     permission_classes = [IsCompanyOrAdmin]
 
     def get_queryset(self):
         user = self.request.user
         if user.role == "admin":
-            return Staff.objects.all()
-        return Staff.objects.filter(company=user.company)
+            queryset = Staff.objects.all()
+        else:
+            queryset = Staff.objects.filter(company=user.company)
+
+        # ?q= busca por nome (prefixo de palavras, sem acentos) ou CPF
+        q = self.request.query_params.get("q")
+        if q and self.action == "list":
+            return search_staffs(queryset, q)
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user, company=self.request.user.company)
+
+    @action(detail=True, methods=["get"])
+    def history(self, request, pk=None):
+        """
+        Histórico da pessoa (Person) em todos os eventos, paginado.
+
+        Empresas veem apenas as participações dos seus próprios staffs.
+        """
+        staff = self.get_object()
+        # Staffs ainda não ligados a uma Person (dedup_staff) caem no CPF
+        if staff.person_id is not None:
+            filters = {"staff__person": staff.person_id}
+        else:
+            filters = {"staff_cpf": staff.cpf}
+        if request.user.role != "admin":
+            filters["staff__company"] = request.user.company
+
+        # Participações em eventos arquivados vêm de ArchivedEventsStaff, que
+        # expõe os mesmos campos usados abaixo
+        sources = [
+            EventsStaff.objects.filter(**filters),
+            ArchivedEventsStaff.objects.filter(**filters),
+        ]
+
+        summary = {"events": 0, "registered": 0, "no_shows": 0}
+        for links in sources:
+            totals = links.aggregate(
+                events=Count("event", distinct=True),
+                registered=Count("id", filter=Q(registration_check_id__isnull=False)),
+                no_shows=Count(
+                    "id",
+                    filter=Q(
+                        registration_check_id__isnull=True, event__date_end__lt=Now()
+                    ),
+                ),
+            )
+            for key, value in totals.items():
+                summary[key] += value
+
+        # Uma query agrupada por participação (evento), vivas e arquivadas
+        live, archived = (
+            links.values(
+                "id",
+                "event_id",
+                "event__name",
+                "event__status",
+                "event__date_begin",
+                "event__date_end",
+                "staff__company_id",
+                "registration_check_id",
+            )
+            .annotate(
+                check_ins=Count(
+                    "checks_history",
+                    filter=Q(checks_history__action=CheckAction.CHECK_IN),
+                ),
+                check_outs=Count(
+                    "checks_history",
+                    filter=Q(checks_history__action=CheckAction.CHECK_OUT),
+                ),
+                first_check=Min("checks_history__timestamp"),
+                last_check=Max("checks_history__timestamp"),
+            )
+            .order_by()
+            for links in sources
+        )
+        participations = live.union(archived, all=True).order_by(
+            "-event__date_begin", "-event_id"
+        )
+
+        hours = hours_by_events_staff(
+            load_check_columns(
+                **{f"events_staff__{key}": value for key, value in filters.items()}
+            )
+        )
+        summary["hours"] = round(sum(hours.values()), 2)
+
+        paginator = StandardPagination()
+        page = paginator.paginate_queryset(participations, request, view=self)
+        results = [
+            {
+                "event": row["event_id"],
+                "event_name": row["event__name"],
+                "event_status": row["event__status"],
+                "date_begin": row["event__date_begin"],
+                "date_end": row["event__date_end"],
+                "company": row["staff__company_id"],
+                "registered": row["registration_check_id"] is not None,
+                "check_ins": row["check_ins"],
+                "check_outs": row["check_outs"],
+                "first_check": row["first_check"],
+                "last_check": row["last_check"],
+                "hours": hours.get(row["id"], 0.0),
+            }
+            for row in page
+        ]
+        response = paginator.get_paginated_response(results)
+        response.data["cpf"] = staff.cpf
+        response.data["summary"] = summary
+        return response